@@ -0,0 +1,69 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the energy dispersion product of apply_edisp.
+
+Compares `~gammapy.datasets.utils.apply_edisp`, which uses a sparse product
+for migration matrices with a narrow band of non-zero entries, with the
+dense product of the whole migration matrix.
+
+Run with::
+
+    python dev/benchmarks/apply_edisp.py
+"""
+
+import timeit
+import numpy as np
+from gammapy.datasets import utils
+from gammapy.datasets.utils import apply_edisp
+from gammapy.irf import EDispKernel
+from gammapy.maps import Map, MapAxis
+
+N_REPEAT = 5
+
+
+def apply_edisp_dense(m, edisp):
+    """Product as done before the sparse product."""
+    data = np.rollaxis(m.data, 0, m.data.ndim)
+    data = np.matmul(data, edisp.pdf_matrix)
+    return np.rollaxis(data, -1, 0)
+
+
+def main():
+    rng = np.random.default_rng(42)
+
+    for nbin_true, nbin, npix, sigma in [
+        (120, 40, 200, 0.1),
+        (120, 40, 200, 0.3),
+        (60, 20, 400, 0.1),
+    ]:
+        energy_axis_true = MapAxis.from_energy_bounds(
+            "0.01 TeV", "100 TeV", nbin=nbin_true, name="energy_true"
+        )
+        energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=nbin)
+
+        edisp = EDispKernel.from_gauss(
+            energy_axis_true=energy_axis_true,
+            energy_axis=energy_axis,
+            sigma=sigma,
+            bias=0,
+        )
+        pdf_matrix = edisp.get_pdf_sparse()
+        density = pdf_matrix.nnz / np.prod(pdf_matrix.shape)
+
+        m = Map.create(npix=npix, binsz=0.02, axes=[energy_axis_true])
+        m.data = rng.uniform(size=m.data.shape)
+
+        print(f"Map shape {m.data.shape}, migration matrix density {density:.2f}")
+
+        for method, func in [
+            ("dense", lambda: apply_edisp_dense(m, edisp)),
+            ("gammapy", lambda: apply_edisp(m, edisp)),
+        ]:
+            timer = timeit.Timer(func)
+            duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+            print(f"  {method:8s} {duration * 1e3:8.1f} ms")
+
+    print(f"Sparse product up to a density of {utils.EDISP_SPARSE_MAX_DENSITY}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the PSF convolution of WcsNDMap.convolve.
+
+Compares `~gammapy.maps.WcsNDMap.convolve`, which uses the cached kernel
+spectra of `~gammapy.utils.fft.FFTConvolver`, with a convolution of every
+image plane using `scipy.signal.convolve`, for repeated convolutions with the
+same `~gammapy.irf.PSFKernel`. For a large survey image, it compares the
+overlap-add convolution with a single transform of the whole image.
+
+Run with::
+
+    python dev/benchmarks/convolve.py
+"""
+
+import timeit
+import numpy as np
+import astropy.units as u
+import scipy.signal
+from gammapy.irf import PSFKernel
+from gammapy.maps import MapAxis, WcsNDMap
+from gammapy.utils.fft import FFT_CONVOLVER
+
+N_REPEAT = 5
+
+
+def convolve_loop(m, kernel):
+    """Convolution as done before the cached FFT convolution."""
+    kernel = kernel.psf_kernel_map.data.astype(np.float32)
+    data = np.empty(m.data.shape, dtype=np.float32)
+
+    for idx in range(m.data.shape[0]):
+        data[idx] = scipy.signal.convolve(
+            m.data[idx], kernel[idx], method="fft", mode="same"
+        )
+
+    return data
+
+
+def main():
+    rng = np.random.default_rng(42)
+
+    for npix, nbin, binsz in [(200, 10, 0.02), (500, 20, 0.02), (1000, 5, 0.01)]:
+        energy_axis = MapAxis.from_energy_bounds("1 TeV", "100 TeV", nbin=nbin)
+        m = WcsNDMap.create(npix=npix, binsz=binsz, axes=[energy_axis])
+
+        kernel = PSFKernel.from_gauss(m.geom, sigma=0.1 * u.deg, max_radius=0.5 * u.deg)
+        print(f"Map shape {m.data.shape}, kernel shape {kernel.data.shape}")
+
+        for dtype in [np.float64, np.float32]:
+            m.data = rng.poisson(1, m.data.shape).astype(dtype)
+
+            for method, func in [
+                ("loop", lambda: convolve_loop(m, kernel)),
+                ("gammapy", lambda: m.convolve(kernel)),
+            ]:
+                timer = timeit.Timer(func)
+                duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+                print(
+                    f"  {np.dtype(dtype).name:8s} {method:8s} {duration * 1e3:8.1f} ms"
+                )
+
+    image = rng.poisson(1, (6000, 6000)).astype(np.float32)
+    kernel = kernel.psf_kernel_map.data[0].astype(np.float32)
+    print(f"Image shape {image.shape}, kernel shape {kernel.shape}")
+
+    for method, tiled in [("full", False), ("tiled", True)]:
+        timer = timeit.Timer(lambda: FFT_CONVOLVER.convolve(image, kernel, tiled=tiled))
+        duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+        print(f"  {method:8s} {duration * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
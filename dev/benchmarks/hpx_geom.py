@@ -0,0 +1,63 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the pixel lookups of partial-sky HpxGeom.
+
+Compares the global to local pixel lookup of `~gammapy.maps.HpxGeom`, which
+uses a dense lookup table, with a search in the sorted pixel list, and times
+coordinate to index conversion, filling and interpolation of a partial-sky
+map with an energy axis, including repeated interpolation at the same
+coordinates.
+
+Run with::
+
+    python dev/benchmarks/hpx_geom.py
+"""
+
+import timeit
+import numpy as np
+from gammapy.maps import HpxGeom, Map, MapAxis
+
+N_REPEAT = 3
+
+
+def global_to_local_search(geom, idx):
+    """Global to local lookup as done before the dense lookup table."""
+    retval = np.full(idx.size, -1, "i")
+    m = np.isin(idx.flat, geom._ipix)
+    retval[m] = np.searchsorted(geom._ipix, idx.flat[m])
+    return retval.reshape(idx.shape)
+
+
+def main():
+    rng = np.random.default_rng(42)
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=10)
+
+    for nside in [256, 1024]:
+        geom = HpxGeom.create(
+            nside=nside, region="DISK(0,0,30)", axes=[energy_axis], frame="icrs"
+        )
+        m = Map.from_geom(geom)
+        m.data += 1
+        print(f"nside {nside}, map shape {m.data.shape}")
+
+        n_events = 1_000_000
+        coords = {
+            "lon": rng.uniform(-20, 20, n_events),
+            "lat": rng.uniform(-20, 20, n_events),
+            "energy": rng.uniform(1, 10, n_events) * energy_axis.unit,
+        }
+        idx = rng.integers(0, 12 * nside**2, n_events)
+
+        for method, func in [
+            ("search", lambda: global_to_local_search(geom, idx)),
+            ("lookup", lambda: geom._lookup_local(idx)),
+            ("coord_to_idx", lambda: geom.coord_to_idx(coords)),
+            ("fill", lambda: m.fill_by_coord(coords)),
+            ("interp", lambda: m.interp_by_coord(coords)),
+        ]:
+            timer = timeit.Timer(func)
+            duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+            print(f"  {method:12s} {duration * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
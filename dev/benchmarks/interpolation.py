@@ -0,0 +1,95 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the regular grid interpolation used by IRF.evaluate and Map.interp_by_coord.
+
+Compares `~gammapy.utils.interpolation.ScaledRegularGridInterpolator` with the
+plain `scipy.interpolate.RegularGridInterpolator` on a background-like IRF grid
+evaluated on a map geometry.
+
+Run with::
+
+    python dev/benchmarks/interpolation.py
+"""
+
+import timeit
+import numpy as np
+import scipy.interpolate
+from gammapy.utils.interpolation import ScaledRegularGridInterpolator
+
+N_REPEAT = 5
+
+
+def make_problem(n_energy=24, n_pix=250):
+    """Background-like log-energy / fov grid and map-like evaluation points."""
+    rng = np.random.default_rng(42)
+
+    energy = np.geomspace(0.1, 100, 20)
+    fov_lon = np.linspace(-5, 5, 41)
+    fov_lat = np.linspace(-5, 5, 41)
+    offset = np.hypot(fov_lon, fov_lat[:, np.newaxis])
+    values = 1e-5 * energy[:, np.newaxis, np.newaxis] ** -2.7 * np.exp(-0.1 * offset**2)
+
+    points = (energy, fov_lon, fov_lat)
+
+    coords = (
+        np.geomspace(0.05, 200, n_energy).reshape((-1, 1, 1)),
+        rng.uniform(-5.5, 5.5, (1, n_pix, n_pix)),
+        rng.uniform(-5.5, 5.5, (1, n_pix, n_pix)),
+    )
+    return points, values, coords
+
+
+def evaluate_scipy(points, values, coords, method="linear"):
+    """Interpolation as done before the fast path, using scipy on stacked points."""
+    points_scaled = (np.log(points[0]),) + points[1:]
+    interp = scipy.interpolate.RegularGridInterpolator(
+        points_scaled,
+        np.log(values),
+        method=method,
+        bounds_error=False,
+        fill_value=None,
+    )
+    coords = np.broadcast_arrays(np.log(coords[0]), *coords[1:])
+    xi = np.stack([_.flat for _ in coords]).T
+    return np.exp(interp(xi)).reshape(coords[0].shape)
+
+
+def evaluate_gammapy(points, values, coords, method="linear", dtype=None):
+    interp = ScaledRegularGridInterpolator(
+        points,
+        values,
+        points_scale=("log", "lin", "lin"),
+        values_scale="log",
+        method=method,
+        dtype=dtype,
+    )
+    return interp(coords, clip=False)
+
+
+def main():
+    points, values, coords = make_problem()
+    n_points = np.broadcast_shapes(*[_.shape for _ in coords])
+
+    print(f"Evaluating {np.prod(n_points):.2e} points, grid shape {values.shape}\n")
+
+    for method in ["linear", "nearest"]:
+        reference = evaluate_scipy(points, values, coords, method=method)
+
+        for name, func, kwargs in [
+            ("scipy", evaluate_scipy, {}),
+            ("gammapy", evaluate_gammapy, {}),
+            ("gammapy float32", evaluate_gammapy, {"dtype": np.float32}),
+        ]:
+            timer = timeit.Timer(
+                lambda: func(points, values, coords, method=method, **kwargs)
+            )
+            duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+            result = func(points, values, coords, method=method, **kwargs)
+            max_diff = np.max(np.abs(result / reference - 1))
+            print(
+                f"{method:8s} {name:16s} {duration * 1e3:8.1f} ms "
+                f"(max. rel. diff. {max_diff:.1e})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the kernel cache of the IRF maps.
+
+Compares `~gammapy.irf.EDispMap.get_edisp_kernel` and
+`~gammapy.irf.EDispKernelMap.get_edisp_kernel` for repeated positions with the
+computation of the kernel without the cache.
+
+Run with::
+
+    python dev/benchmarks/irf_kernel_cache.py
+"""
+
+import timeit
+import numpy as np
+from astropy.coordinates import SkyCoord
+from gammapy.irf import EDispKernelMap, EDispMap
+from gammapy.maps import MapAxis, WcsGeom
+
+N_REPEAT = 5
+N_CALLS = 100
+
+
+def main():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=50, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=30)
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=100, node_type="edges", name="migra")
+
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=0.5, width=5, axes=[migra_axis, energy_axis_true]
+    )
+    edisp_map = EDispMap.from_geom(geom)
+    edisp_map.edisp_map.data = np.random.default_rng(0).uniform(
+        size=edisp_map.edisp_map.data.shape
+    )
+    edisp_kernel_map = EDispKernelMap.from_gauss(
+        energy_axis=energy_axis,
+        energy_axis_true=energy_axis_true,
+        sigma=0.1,
+        bias=0,
+        geom=geom.to_image(),
+    )
+
+    position = SkyCoord(0.1, 0.1, unit="deg")
+
+    for name, irf_map, kwargs, compute in [
+        (
+            "EDispMap",
+            edisp_map,
+            dict(energy_axis=energy_axis),
+            lambda: edisp_map.to_region_nd_map(region=position)
+            .to_edisp_kernel_map(energy_axis=energy_axis)
+            .get_edisp_kernel(),
+        ),
+        (
+            "EDispKernelMap",
+            edisp_kernel_map,
+            dict(),
+            lambda: edisp_kernel_map._get_edisp_kernel(position=position),
+        ),
+    ]:
+        print(f"{name}, {N_CALLS} calls at the same position")
+
+        def cached():
+            return irf_map.get_edisp_kernel(position=position, **kwargs)
+
+        for method, func in [("no cache", compute), ("cache", cached)]:
+            timer = timeit.Timer(func)
+            duration = min(timer.repeat(repeat=N_REPEAT, number=N_CALLS))
+            print(f"  {method:8s} {duration * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
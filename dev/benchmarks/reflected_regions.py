@@ -0,0 +1,111 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmark the reflected regions search of ReflectedRegionsFinder.
+
+Compares `~gammapy.makers.ReflectedRegionsFinder` with a step by step search,
+rotating the ON region and testing all excluded pixels for every candidate
+angle, on H.E.S.S.-like and CTA-like exclusion masks around the Galactic plane.
+
+Run with::
+
+    python dev/benchmarks/reflected_regions.py
+"""
+
+import timeit
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from regions import CircleSkyRegion, RectangleSkyRegion
+from gammapy.makers import ReflectedRegionsFinder
+from gammapy.maps import WcsGeom, WcsNDMap
+
+N_REPEAT = 5
+
+
+def make_exclusion_mask(width, binsz, n_sources=40):
+    """Galactic plane band with randomly placed circular exclusions."""
+    rng = np.random.default_rng(42)
+    center = SkyCoord(0, 0.5, unit="deg", frame="galactic")
+
+    geom = WcsGeom.create(skydir=center, width=width, binsz=binsz, frame="galactic")
+    coords = geom.get_coord().skycoord
+
+    mask = np.abs(coords.b) > 0.3 * u.deg
+
+    for _ in range(n_sources):
+        position = SkyCoord(
+            rng.uniform(-width / 2, width / 2),
+            rng.uniform(-width / 3, width / 3),
+            unit="deg",
+            frame="galactic",
+        )
+        mask &= coords.separation(position) > rng.uniform(0.1, 0.4) * u.deg
+
+    return center, WcsNDMap(geom, data=mask)
+
+
+def find_regions_loop(finder, region, center, exclusion_mask):
+    """Reflected regions search as done before the polar exclusion lookup."""
+    reference_geom = finder._create_reference_geometry(region, center)
+    center_pixel = finder._get_center_pixel(center, reference_geom)
+    region_pix = finder._get_region_pixels(region, reference_geom)
+    excluded_pixels = finder._get_excluded_pixels(reference_geom, exclusion_mask)
+
+    angle_min, angle_max = finder._get_angle_range(
+        region=region, reference_geom=reference_geom, center_pix=center_pixel
+    )
+
+    regions = []
+    angle = angle_min + finder.min_distance_input
+    while angle < angle_max:
+        region_test = region_pix.rotate(center_pixel, angle)
+
+        if not np.any(region_test.contains(excluded_pixels)):
+            regions.append(region_test.to_sky(reference_geom.wcs))
+
+            if len(regions) >= finder.max_region_number:
+                break
+
+            angle += angle_min
+        else:
+            angle += finder.angle_increment
+
+    return regions, reference_geom.wcs
+
+
+def main():
+    on_regions = {
+        "circle": CircleSkyRegion(
+            SkyCoord(0.5, 0.5, unit="deg", frame="galactic"), 0.12 * u.deg
+        ),
+        "rectangle": RectangleSkyRegion(
+            SkyCoord(0.3, 1.2, unit="deg", frame="galactic"),
+            width=0.3 * u.deg,
+            height=0.1 * u.deg,
+            angle=30 * u.deg,
+        ),
+    }
+
+    finder = ReflectedRegionsFinder(angle_increment="0.01 rad", min_distance="0.05 rad")
+
+    for name, width, binsz in [("H.E.S.S.", 6, 0.02), ("CTA", 10, 0.01)]:
+        center, exclusion_mask = make_exclusion_mask(width=width, binsz=binsz)
+        print(f"{name} mask, shape {exclusion_mask.data.shape}")
+
+        for region_name, region in on_regions.items():
+            for method, func in [
+                ("loop", find_regions_loop),
+                ("gammapy", ReflectedRegionsFinder.run),
+            ]:
+                timer = timeit.Timer(
+                    lambda: func(finder, region, center, exclusion_mask)
+                )
+                duration = min(timer.repeat(repeat=N_REPEAT, number=1))
+                regions, _ = func(finder, region, center, exclusion_mask)
+                print(
+                    f"  {region_name:10s} {method:8s} {duration * 1e3:8.1f} ms "
+                    f"({len(regions)} regions)"
+                )
+
+
+if __name__ == "__main__":
+    main()
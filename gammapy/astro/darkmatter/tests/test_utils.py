@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 import astropy.units as u
 from gammapy.astro.darkmatter import (
     DarkMatterAnnihilationSpectralModel,
@@ -68,3 +69,70 @@ def test_dmfluxmap_decay(jfact_decay):
     actual = int_flux[5, 5]
     desired = 7.01927e-3 / u.cm**2 / u.s
     assert_quantity_allclose(actual, desired, rtol=1e-3)
+
+
+def test_jfactory_differential_jfactor(geom):
+    profile = profiles.NFWProfile()
+    distance = profiles.DMProfile.DISTANCE_GC
+    jfactory = JFactory(geom=geom, profile=profile, distance=distance)
+
+    diff_jfact = jfactory.compute_differential_jfactor()
+    assert diff_jfact.unit == "GeV2 cm-5 sr-1"
+    assert diff_jfact.shape == (10, 10)
+
+    separation = geom.separation(geom.center_skydir).rad[2, 3]
+    rmin = np.tan(separation) * distance
+    desired = 2 * profile.integral(
+        rmin, distance, separation, ndecade=1e4
+    ) + profile.integral(distance, 4 * distance, separation, ndecade=1e4)
+    assert_quantity_allclose(diff_jfact[2, 3], desired / u.sr, rtol=1e-3)
+
+    diff_jfact_interp = jfactory.compute_differential_jfactor(n_separation=5)
+    assert_quantity_allclose(diff_jfact_interp, diff_jfact, rtol=0.2)
+
+
+def test_jfactory_differential_jfactor_center():
+    geom = WcsGeom.create(binsz=0.5, npix=5)
+    profile = profiles.NFWProfile()
+    distance = profiles.DMProfile.DISTANCE_GC
+    jfactory = JFactory(geom=geom, profile=profile, distance=distance)
+
+    diff_jfact = jfactory.compute_differential_jfactor()
+
+    # the center pixel takes the value of its nearest neighbours
+    separation = geom.separation(geom.center_skydir).rad
+    assert separation[2, 2] == 0
+    assert_quantity_allclose(diff_jfact[2, 2], diff_jfact[2, 3], rtol=1e-10)
+    assert_quantity_allclose(diff_jfact[2, 2], diff_jfact[1, 2], rtol=1e-10)
+
+    rmin = np.tan(separation[2, 3]) * distance
+    desired = 2 * profile.integral(
+        rmin, distance, separation[2, 3], ndecade=1e4
+    ) + profile.integral(distance, 4 * distance, separation[2, 3], ndecade=1e4)
+    assert_quantity_allclose(diff_jfact[2, 2], desired / u.sr, rtol=1e-3)
+
+    jfact = jfactory.compute_jfactor()
+    assert_quantity_allclose(
+        jfact[2, 2], diff_jfact[2, 2] * geom.solid_angle()[2, 2], rtol=1e-10
+    )
+
+    # oversampling resolves the cusp
+    jfact_oversampled = jfactory.compute_jfactor(oversampling_factor=5)
+    assert jfact_oversampled[2, 2] > 3 * jfact[2, 2]
+
+
+def test_jfactory_jfactor_oversampling(geom):
+    jfactory = JFactory(
+        geom=geom,
+        profile=profiles.BurkertProfile(),
+        distance=profiles.DMProfile.DISTANCE_GC,
+        annihilation=False,
+    )
+    jfact = jfactory.compute_jfactor()
+    assert jfact.unit == "GeV cm-2"
+
+    jfact_oversampled = jfactory.compute_jfactor(oversampling_factor=1)
+    assert_quantity_allclose(jfact_oversampled, jfact)
+
+    jfact_oversampled = jfactory.compute_jfactor(oversampling_factor=4)
+    assert_quantity_allclose(jfact_oversampled.sum(), jfact.sum(), rtol=1e-2)
@@ -3,6 +3,7 @@
 import html
 import numpy as np
 import astropy.units as u
+from gammapy.utils.integrate import trapz_loglog
 
 __all__ = ["JFactory"]
 
@@ -38,7 +39,63 @@ class JFactory:
         except AttributeError:
             return f"<pre>{html.escape(str(self))}</pre>"
 
-    def compute_differential_jfactor(self, ndecade=1e4):
+    @property
+    def _integral_unit(self):
+        return u.Unit("GeV2 cm-5") if self.annihilation else u.Unit("GeV cm-2")
+
+    def _integrate_line_of_sight(self, rmin, rmax, separation, ndecade):
+        """Integrate the profile along the line of sight for several separations.
+
+        The integration grid is logarithmic between ``rmin`` and ``rmax`` for
+        each separation, with the same number of points for all separations.
+        """
+        n = np.max(np.log10(rmax / rmin).to_value("") * ndecade).astype(np.int32)
+        offset = np.linspace(0, 1, max(n, 2))
+        radius = rmin[:, np.newaxis] * (rmax / rmin)[:, np.newaxis] ** offset
+        values = self.profile._eval_substitution(
+            radius, separation[:, np.newaxis], self.annihilation
+        )
+        return trapz_loglog(values, radius, axis=-1).sum(axis=0)
+
+    def _compute_differential_jfactor_separation(self, separation, ndecade):
+        """Differential J-Factor for a 1D array of separations in radians."""
+        rmin = np.tan(separation) * self.distance
+        rmax = self.distance * np.ones_like(separation)
+
+        values = []
+        # bound memory of the integration grid
+        chunk_size = max(int(1e7 / (6 * ndecade)), 1)
+
+        for idx in range(0, len(separation), chunk_size):
+            chunk = slice(idx, idx + chunk_size)
+            value = 2 * self._integrate_line_of_sight(
+                rmin[chunk], rmax[chunk], separation[chunk], ndecade
+            ) + self._integrate_line_of_sight(
+                rmax[chunk], 4 * rmax[chunk], separation[chunk], ndecade
+            )
+            values.append(value.to_value(self._integral_unit))
+
+        return np.concatenate(values) * self._integral_unit / u.steradian
+
+    def _interp_differential_jfactor(self, separation, ndecade, n_separation):
+        """Tabulate differential J-Factor vs separation and interpolate."""
+        separation_grid = np.unique(separation[separation > 0])
+
+        if len(separation_grid) > n_separation:
+            separation_grid = np.geomspace(
+                separation_grid[0], separation_grid[-1], n_separation
+            )
+
+        jfact = self._compute_differential_jfactor_separation(separation_grid, ndecade)
+
+        with np.errstate(divide="ignore"):
+            values = np.interp(
+                np.log(separation), np.log(separation_grid), np.log(jfact.value)
+            )
+
+        return np.exp(values) * jfact.unit
+
+    def compute_differential_jfactor(self, ndecade=1e4, n_separation=200):
         r"""Compute differential J-Factor.
 
         .. math::
@@ -48,43 +105,74 @@ class JFactory:
         .. math::
             \frac{\mathrm d J_\text{decay}}{\mathrm d \Omega} =
             \int_{\mathrm{LoS}} \mathrm d l \rho(l)
+
+        As the profile is radially symmetric, the line of sight integral is
+        tabulated once versus separation from the map center and interpolated
+        in log-log to the pixel separations. The line of sight integral is not
+        defined at zero separation, so a pixel at the map center, e.g. for an odd
+        number of pixels, takes the value of the smallest non-zero pixel
+        separation, i.e. of its nearest neighbours. Its J-Factor is thus
+        underestimated for cuspy profiles, use the ``oversampling_factor`` of
+        `compute_jfactor` to integrate the center pixel more accurately.
+
+        Parameters
+        ----------
+        ndecade : int, optional
+            Number of grid points per decade used for the line of sight
+            integration. Default is 1e4.
+        n_separation : int, optional
+            Maximum number of separations at which the line of sight integral is
+            evaluated. If the map has fewer distinct pixel separations, it is
+            evaluated at each of them. Default is 200.
+
+        Returns
+        -------
+        jfact : `~astropy.units.Quantity`
+            Differential J-Factor or D-Factor.
         """
         separation = self.geom.separation(self.geom.center_skydir).rad
-        rmin = u.Quantity(
-            value=np.tan(separation) * self.distance, unit=self.distance.unit
-        )
-        rmax = self.distance
-        val = [
-            (
-                2
-                * self.profile.integral(
-                    _.value * u.kpc,
-                    rmax,
-                    np.arctan(_.value / self.distance.value),
-                    ndecade,
-                    self.annihilation,
-                )
-                + self.profile.integral(
-                    self.distance,
-                    4 * rmax,
-                    np.arctan(_.value / self.distance.value),
-                    ndecade,
-                    self.annihilation,
-                )
-            )
-            for _ in rmin.ravel()
-        ]
-        integral_unit = u.Unit("GeV2 cm-5") if self.annihilation else u.Unit("GeV cm-2")
-        jfact = u.Quantity(val).to(integral_unit).reshape(rmin.shape)
-        return jfact / u.steradian
+        return self._interp_differential_jfactor(separation, ndecade, n_separation)
 
-    def compute_jfactor(self, ndecade=1e4):
+    def compute_jfactor(self, ndecade=1e4, n_separation=200, oversampling_factor=None):
         r"""Compute astrophysical J-Factor.
 
         .. math::
             J(\Delta\Omega) =
            \int_{\Delta\Omega} \mathrm d \Omega^{\prime}
            \frac{\mathrm d J}{\mathrm d \Omega^{\prime}}
+
+        Parameters
+        ----------
+        ndecade : int, optional
+            Number of grid points per decade used for the line of sight
+            integration. Default is 1e4.
+        n_separation : int, optional
+            Maximum number of separations at which the line of sight integral is
+            evaluated. Default is 200.
+        oversampling_factor : int, optional
+            Oversampling factor of the pixels used to integrate the differential
+            J-Factor over the pixel solid angle. If None, the differential
+            J-Factor at the pixel center is multiplied by the pixel solid angle.
+            Default is None.
+
+        Returns
+        -------
+        jfact : `~astropy.units.Quantity`
+            J-Factor or D-Factor.
         """
-        diff_jfact = self.compute_differential_jfactor(ndecade)
-        return diff_jfact * self.geom.to_image().solid_angle()
+        geom = self.geom.to_image()
+
+        if oversampling_factor is None:
+            diff_jfact = self.compute_differential_jfactor(ndecade, n_separation)
+            return diff_jfact * geom.solid_angle()
+
+        geom_upsampled = geom.upsample(factor=oversampling_factor)
+        separation = geom_upsampled.separation(self.geom.center_skydir).rad
+        diff_jfact = self._interp_differential_jfactor(
+            separation, ndecade, n_separation
+        )
+        jfact = diff_jfact * geom_upsampled.solid_angle()
+
+        ny, nx = geom.data_shape
+        shape = (ny, oversampling_factor, nx, oversampling_factor)
+        return jfact.reshape(shape).sum(axis=(1, 3))
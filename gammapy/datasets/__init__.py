@@ -6,6 +6,7 @@ from .io import OGIPDatasetReader, OGIPDatasetWriter, FermipyDatasetsReader
 from .map import (
     MapDataset,
     MapDatasetOnOff,
+    MapDatasetStacker,
     create_empty_map_dataset_from_irfs,
     create_map_dataset_from_observation,
     create_map_dataset_geoms,
@@ -39,6 +40,7 @@ __all__ = [
     "MapDataset",
     "MapDatasetEventSampler",
     "MapDatasetOnOff",
+    "MapDatasetStacker",
     "ObservationEventSampler",
     "OGIPDatasetWriter",
     "OGIPDatasetReader",
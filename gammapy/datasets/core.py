@@ -7,6 +7,7 @@ import logging
 import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
+from astropy.time import Time
 from gammapy.data import GTI
 from gammapy.modeling.models import DatasetModels, Models
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
@@ -134,9 +135,15 @@ class Datasets(collections.abc.MutableSequence):
     ----------
     datasets : `Dataset` or list of `Dataset`
         Datasets.
+    max_memory : `~astropy.units.Quantity`, str or int, optional
+        Memory budget for the data of lazily loaded datasets. When a dataset is
+        accessed and the data loaded by all datasets exceeds the budget, the
+        data cache of the least recently accessed datasets is reset, see
+        `~gammapy.datasets.MapDataset.reset_data_cache`. Integers are
+        interpreted as bytes. Default is None, which means no limit.
     """
 
-    def __init__(self, datasets=None):
+    def __init__(self, datasets=None, max_memory=None):
         if datasets is None:
             datasets = []
 
@@ -155,6 +162,65 @@ class Datasets(collections.abc.MutableSequence):
 
         self._datasets = datasets
         self._covariance = None
+        self._data_cache_order = collections.OrderedDict()
+        self._data_cache_nbytes = 0
+        self.max_memory = max_memory
+
+    @property
+    def max_memory(self):
+        """Memory budget for the data of lazily loaded datasets as a `~astropy.units.Quantity`."""
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value):
+        if value is not None:
+            value = u.Quantity(value, "byte")
+        self._max_memory = value
+
+    def _set_data_cache_nbytes(self, dataset):
+        """Update the size of the data loaded by a dataset in the running total."""
+        order = self._data_cache_order
+        _, nbytes_old = order.pop(id(dataset), (None, 0))
+
+        nbytes = dataset._get_data_cache_nbytes()
+        self._data_cache_nbytes += nbytes - nbytes_old
+        order[id(dataset)] = (dataset, nbytes)
+
+    def _update_data_cache(self, dataset):
+        """Mark dataset as most recently used and free data exceeding the memory budget.
+
+        Data is usually loaded after the dataset was accessed, so only the size of
+        the previously and currently accessed datasets is updated. Only data loaded
+        from file and not modified since is freed.
+        """
+        if not hasattr(dataset, "_get_data_cache_nbytes"):
+            return
+
+        # the checksum of the loaded data is only needed to evict it safely
+        dataset._data_cache_tracked = True
+
+        order = self._data_cache_order
+
+        if order:
+            dataset_last, _ = order[next(reversed(order))]
+            self._set_data_cache_nbytes(dataset_last)
+
+        self._set_data_cache_nbytes(dataset)
+        max_bytes = self.max_memory.to_value("byte")
+
+        for key in list(order):
+            if self._data_cache_nbytes <= max_bytes:
+                break
+
+            dataset_lru, _ = order[key]
+
+            if dataset_lru is dataset:
+                continue
+
+            # afterwards no data of the dataset is backed by the file anymore
+            dataset_lru._evict_data_cache()
+            _, nbytes = order.pop(key)
+            self._data_cache_nbytes -= nbytes
 
     @property
     def parameters(self):
@@ -204,7 +270,7 @@ class Datasets(collections.abc.MutableSequence):
     @property
     def is_all_same_type(self):
         """Whether all contained datasets are of the same type."""
-        return len(set(_.__class__ for _ in self)) == 1
+        return len(set(_.__class__ for _ in self._datasets)) == 1
 
     @property
     def is_all_same_shape(self):
@@ -260,6 +326,88 @@ class Datasets(collections.abc.MutableSequence):
             stat_sum += dataset._stat_sum_likelihood()
         return stat_sum
 
+    def _get_time_index(self):
+        """Start and stop times of the datasets, cached on the first call.
+
+        Times are stored in seconds relative to a reference time, together with
+        the order of the datasets sorted by start time. The index is rebuilt when
+        datasets or their GTIs are replaced.
+        """
+        gtis = [dataset.gti for dataset in self]
+        index = self.__dict__.get("_time_index")
+
+        if (
+            index is not None
+            and len(index["gtis"]) == len(gtis)
+            and all(gti is other for gti, other in zip(gtis, index["gtis"]))
+        ):
+            return index
+
+        valid = [gti is not None and len(gti.table) > 0 for gti in gtis]
+
+        time_start = [gti.time_start[0] for gti, ok in zip(gtis, valid) if ok]
+        time_stop = [gti.time_stop[-1] for gti, ok in zip(gtis, valid) if ok]
+
+        start = np.full(len(gtis), np.nan)
+        stop = np.full(len(gtis), np.nan)
+        time_ref = None
+
+        if time_start:
+            time_start, time_stop = Time(time_start), Time(time_stop)
+            time_ref = time_start[0]
+            start[valid] = (time_start - time_ref).to_value("s")
+            stop[valid] = (time_stop - time_ref).to_value("s")
+
+        order = np.argsort(start, kind="stable")
+
+        index = {
+            "gtis": gtis,
+            "time_ref": time_ref,
+            "start": start[order],
+            "stop": stop[order],
+            "order": order,
+        }
+        self._time_index = index
+        return index
+
+    def _select_time_idx(self, time_min, time_max, atol="1e-6 s"):
+        """Indices of the datasets contained in each time interval.
+
+        Parameters
+        ----------
+        time_min, time_max : `~astropy.time.Time`
+            Start and stop times of the intervals.
+        atol : `~astropy.units.Quantity`
+            Tolerance value for time comparison with different scale. Default 1e-6 sec.
+
+        Returns
+        -------
+        indices : list of `~numpy.ndarray`
+            Sorted dataset indices, one array per time interval.
+        """
+        time_min, time_max = Time(time_min).reshape(-1), Time(time_max).reshape(-1)
+        index = self._get_time_index()
+
+        if index["time_ref"] is None:
+            return [np.array([], dtype=int) for _ in range(len(time_min))]
+
+        atol = u.Quantity(atol).to_value("s")
+        t_min = (time_min - index["time_ref"]).to_value("s") - atol
+        t_max = (time_max - index["time_ref"]).to_value("s") + atol
+
+        # datasets start and stop within the interval, so only those starting
+        # in the interval are candidates
+        idx_min = np.searchsorted(index["start"], t_min, side="left")
+        idx_max = np.searchsorted(index["start"], t_max, side="right")
+
+        indices = []
+
+        for i_min, i_max, t in zip(idx_min, idx_max, t_max):
+            selected = index["stop"][i_min:i_max] <= t
+            indices.append(np.sort(index["order"][i_min:i_max][selected]))
+
+        return indices
+
     def select_time(self, time_min, time_max, atol="1e-6 s"):
         """Select datasets in a given time interval.
 
@@ -276,18 +424,30 @@ class Datasets(collections.abc.MutableSequence):
             Datasets in the given time interval.
 
         """
-        atol = u.Quantity(atol)
+        (idx,) = self._select_time_idx(time_min, time_max, atol=atol)
+        return self.__class__([self._datasets[_] for _ in idx])
 
-        datasets = []
+    def group_by_time(self, time_min, time_max, atol="1e-6 s"):
+        """Group datasets by time intervals.
 
-        for dataset in self:
-            t_start = dataset.gti.time_start[0]
-            t_stop = dataset.gti.time_stop[-1]
+        Equivalent to calling `Datasets.select_time` for each interval, but the
+        start and stop times of the datasets are only sorted once and each interval
+        is found by binary search.
 
-            if t_start >= (time_min - atol) and t_stop <= (time_max + atol):
-                datasets.append(dataset)
+        Parameters
+        ----------
+        time_min, time_max : `~astropy.time.Time`
+            Start and stop times of the intervals.
+        atol : `~astropy.units.Quantity`
+            Tolerance value for time comparison with different scale. Default 1e-6 sec.
 
-        return self.__class__(datasets)
+        Returns
+        -------
+        groups : list of `Datasets`
+            Datasets contained in each time interval.
+        """
+        indices = self._select_time_idx(time_min, time_max, atol=atol)
+        return [self.__class__([self._datasets[_] for _ in idx]) for idx in indices]
 
     def slice_by_energy(self, energy_min, energy_max):
         """Select and slice datasets in energy range.
@@ -410,7 +570,16 @@ class Datasets(collections.abc.MutableSequence):
         return copy.deepcopy(self)
 
     @classmethod
-    def read(cls, filename, filename_models=None, lazy=True, cache=True, checksum=True):
+    def read(
+        cls,
+        filename,
+        filename_models=None,
+        lazy=True,
+        cache=True,
+        checksum=True,
+        max_memory=None,
+        **kwargs,
+    ):
         """De-serialize datasets from YAML and FITS files.
 
         Parameters
@@ -420,11 +589,20 @@ class Datasets(collections.abc.MutableSequence):
         filename_models : str or `~pathlib.Path`, optional
             File path or name of models yaml file. Default is None.
         lazy : bool
-            Whether to lazy load data into memory. Default is True.
+            Whether to lazy load data into memory. Ignored if a partial read is
+            requested with ``energy_min``, ``energy_max`` or ``position``, in which
+            case the selected data is always loaded. Default is True.
         cache : bool
             Whether to cache the data after loading. Default is True.
         checksum : bool
             Whether to perform checksum verification. Default is False.
+        max_memory : `~astropy.units.Quantity`, str or int, optional
+            Memory budget for the data of lazily loaded datasets, see `Datasets`.
+            Default is None.
+        **kwargs : dict, optional
+            Keyword arguments passed to the ``read`` method of each dataset,
+            e.g. ``energy_min``, ``energy_max``, ``position`` and ``width``
+            for `~gammapy.datasets.MapDataset`.
 
         Returns
         -------
@@ -436,6 +614,10 @@ class Datasets(collections.abc.MutableSequence):
         filename = make_path(filename)
         data_list = read_yaml(filename, checksum=checksum)
 
+        partial_kwargs = ["energy_min", "energy_max", "position"]
+        if any(kwargs.get(name) is not None for name in partial_kwargs):
+            lazy = False
+
         datasets = []
         for data in data_list["datasets"]:
             path = filename.parent
@@ -444,10 +626,10 @@ class Datasets(collections.abc.MutableSequence):
                 data["filename"] = str(make_path(path / data["filename"]))
 
             dataset_cls = DATASET_REGISTRY.get_cls(data["type"])
-            dataset = dataset_cls.from_dict(data, lazy=lazy, cache=cache)
+            dataset = dataset_cls.from_dict(data, lazy=lazy, cache=cache, **kwargs)
             datasets.append(dataset)
 
-        datasets = cls(datasets)
+        datasets = cls(datasets, max_memory=max_memory)
 
         if filename_models:
             datasets.models = Models.read(filename_models, checksum=checksum)
@@ -461,6 +643,7 @@ class Datasets(collections.abc.MutableSequence):
         overwrite=False,
         write_covariance=True,
         checksum=False,
+        **kwargs,
     ):
         """Serialize datasets to YAML and FITS files.
 
@@ -477,6 +660,9 @@ class Datasets(collections.abc.MutableSequence):
         checksum : bool
             When True adds both DATASUM and CHECKSUM cards to the headers written to the FITS files.
             Default is False.
+        **kwargs : dict, optional
+            Keyword arguments passed to the ``write`` method of each dataset,
+            e.g. ``tile_compress`` for `~gammapy.datasets.MapDataset`.
         """
         path = make_path(filename)
 
@@ -486,7 +672,10 @@ class Datasets(collections.abc.MutableSequence):
             d = dataset.to_dict()
             filename = d["filename"]
             dataset.write(
-                path.parent / filename, overwrite=overwrite, checksum=checksum
+                path.parent / filename,
+                overwrite=overwrite,
+                checksum=checksum,
+                **kwargs,
             )
             data["datasets"].append(d)
 
@@ -528,10 +717,24 @@ class Datasets(collections.abc.MutableSequence):
                 "Stacking impossible: all Datasets contained are not of a unique type."
             )
 
-        stacked = self[0].to_masked(name=name, nan_to_num=nan_to_num)
+        from .map import MapDataset, MapDatasetStacker
 
-        for dataset in self[1:]:
-            stacked.stack(dataset, nan_to_num=nan_to_num)
+        stacked, stacker = None, None
+
+        for dataset in self:
+            if isinstance(dataset, MapDataset):
+                if stacker is None:
+                    stacker = MapDatasetStacker.from_dataset(
+                        dataset, name=name, nan_to_num=nan_to_num
+                    )
+                stacker.stack(dataset)
+            elif stacked is None:
+                stacked = dataset.to_masked(name=name, nan_to_num=nan_to_num)
+            else:
+                stacked.stack(dataset, nan_to_num=nan_to_num)
+
+        if stacker is not None:
+            stacked = stacker.finalize()
 
         return stacked
 
@@ -552,18 +755,19 @@ class Datasets(collections.abc.MutableSequence):
         if not self.is_all_same_type:
             raise ValueError("Info table not supported for mixed dataset type.")
 
-        rows = []
+        rows, stacked = [], None
 
-        if cumulative:
-            name = "stacked"
-            stacked = self[0].to_masked(name=name)
-            rows.append(stacked.info_dict())
-            for dataset in self[1:]:
-                stacked.stack(dataset)
-                rows.append(stacked.info_dict())
-        else:
-            for dataset in self:
+        for dataset in self:
+            if not cumulative:
                 rows.append(dataset.info_dict())
+                continue
+
+            if stacked is None:
+                stacked = dataset.to_masked(name="stacked")
+            else:
+                stacked.stack(dataset)
+
+            rows.append(stacked.info_dict())
 
         return Table(rows)
 
@@ -598,7 +802,13 @@ class Datasets(collections.abc.MutableSequence):
         return meta_table
 
     def __getitem__(self, key):
-        return self._datasets[self.index(key)]
+        dataset = self._datasets[self.index(key)]
+
+        # not set for the DatasetsActor, which forwards attributes to the actors
+        if self.__dict__.get("_max_memory") is not None:
+            self._update_data_cache(dataset)
+
+        return dataset
 
     def __delitem__(self, key):
         del self._datasets[self.index(key)]
@@ -48,6 +48,9 @@ class MapEvaluator:
         This mode is recommended for global optimization algorithms.
     use_cache : bool
         Use npred caching.
+    psf_convolution_method : {"wcs-tan", "harmonic", "sparse", "auto"}
+        Method used to convolve HEALPix maps with the PSF, see
+        `~gammapy.maps.HpxNDMap.convolve`. Default is "wcs-tan".
     """
 
     def __init__(
@@ -60,6 +63,7 @@ class MapEvaluator:
         mask=None,
         evaluation_mode="local",
         use_cache=True,
+        psf_convolution_method="wcs-tan",
     ):
         self.model = model
         self.exposure = exposure
@@ -68,6 +72,7 @@ class MapEvaluator:
         self.mask = mask
         self.gti = gti
         self.use_cache = use_cache
+        self.psf_convolution_method = psf_convolution_method
         self.contributes = True
         self.psf_containment = None
 
@@ -352,7 +357,15 @@ class MapEvaluator:
         return Map.from_geom(self.geom, data=npred, unit="")
 
     def apply_psf(self, npred):
-        """Convolve npred cube with PSF."""
+        """Convolve npred cube with PSF.
+
+        HEALPix maps are convolved with ``psf_convolution_method``.
+        """
+        if npred.geom.is_hpx:
+            return npred.convolve(
+                self.psf, convolution_method=self.psf_convolution_method
+            )
+
         return npred.convolve(self.psf)
 
     def apply_edisp(self, npred):
@@ -18,7 +18,13 @@ from gammapy.stats import (
     WStatCountsStatistic,
     get_wstat_mu_bkg,
 )
-from gammapy.utils.fits import HDULocation, LazyFitsData
+from gammapy.utils.fits import (
+    HDULocation,
+    LazyFitsData,
+    _get_data_arrays,
+    _get_data_checksum,
+    to_tile_compressed_hdulist,
+)
 from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_name, make_path
 from gammapy.utils.table import hstack_columns
@@ -30,6 +36,7 @@ from .utils import get_axes
 __all__ = [
     "MapDataset",
     "MapDatasetOnOff",
+    "MapDatasetStacker",
     "create_empty_map_dataset_from_irfs",
     "create_map_dataset_geoms",
     "create_map_dataset_from_observation",
@@ -50,6 +57,7 @@ BINSZ_IRF_DEFAULT = 0.2 * u.deg
 
 EVALUATION_MODE = "local"
 USE_NPRED_CACHE = True
+HPX_PSF_CONVOLUTION_METHOD = "wcs-tan"
 
 
 def create_map_dataset_geoms(
@@ -404,6 +412,62 @@ def create_map_dataset_from_observation(
     return dataset
 
 
+def _get_energy_slices(energy_axis, energy_min=None, energy_max=None):
+    """Slices selecting the reconstructed energy bins within the given range."""
+    if energy_min is None:
+        energy_min = energy_axis.bounds[0]
+
+    if energy_max is None:
+        energy_max = energy_axis.bounds[1]
+
+    energy_min, energy_max = u.Quantity(energy_min), u.Quantity(energy_max)
+
+    group = energy_axis.group_table(edges=[energy_min, energy_max])
+
+    is_normal = group["bin_type"] == "normal   "
+    group = group[is_normal]
+
+    return {"energy": slice(int(group["idx_min"][0]), int(group["idx_max"][0]) + 1)}
+
+
+def _get_stacked_acceptance_off(acceptance, counts_off, alpha_counts_off):
+    """Stacked off acceptance from the summed acceptance and off counts."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        acceptance_off = acceptance * counts_off / alpha_counts_off
+        average_alpha = alpha_counts_off.data.sum() / counts_off.data.sum()
+
+    # For the bins where the stacked OFF counts equal 0, the alpha value is
+    # performed by weighting on the total OFF counts of each run
+    is_zero = counts_off.data == 0
+    acceptance_off.data[is_zero] = acceptance.data[is_zero] / average_alpha
+    return acceptance_off
+
+
+def _slice_by_idx_view(obj, slices):
+    """Slice a map, IRF map or PSF kernel as read-only views on the parent data.
+
+    In-place modifications through the `~gammapy.maps.Map` API copy the sliced
+    data first, so that the parent is never modified through the view. Code
+    writing directly to the ``.data`` array of dataset maps must replace the map
+    instead.
+    """
+    sliced = obj.slice_by_idx(slices=slices)
+
+    if isinstance(sliced, Map):
+        maps = [sliced]
+    elif isinstance(sliced, PSFKernel):
+        maps = [sliced.psf_kernel_map]
+    else:
+        maps = [sliced._irf_map, sliced.exposure_map]
+
+    for m in maps:
+        if m is not None:
+            m.data.flags.writeable = False
+            m.meta = m.meta.copy()
+
+    return sliced
+
+
 class MapDataset(Dataset):
     """Main map dataset for likelihood fitting.
 
@@ -687,6 +751,7 @@ class MapDataset(Dataset):
                         evaluation_mode=EVALUATION_MODE,
                         gti=self.gti,
                         use_cache=USE_NPRED_CACHE,
+                        psf_convolution_method=HPX_PSF_CONVOLUTION_METHOD,
                     )
                     self._evaluators[model.name] = evaluator
 
@@ -1160,7 +1225,9 @@ class MapDataset(Dataset):
 
             if "livetime" in other.exposure.meta and np.any(other.mask_safe_image):
                 if "livetime" in self.exposure.meta:
-                    self.exposure.meta["livetime"] += other.exposure.meta["livetime"]
+                    self.exposure.meta["livetime"] = (
+                        self.exposure.meta["livetime"] + other.exposure.meta["livetime"]
+                    )
                 else:
                     self.exposure.meta["livetime"] = other.exposure.meta[
                         "livetime"
@@ -1191,8 +1258,7 @@ class MapDataset(Dataset):
             self.mask_fit = other.mask_fit.copy()
 
         if self.gti and other.gti:
-            self.gti.stack(other.gti)
-            self.gti = self.gti.union()
+            self.gti = GTI.from_stack([self.gti, other.gti]).union()
 
         if self.meta_table and other.meta_table:
             self.meta_table = hstack_columns(self.meta_table, other.meta_table)
@@ -1550,7 +1616,9 @@ class MapDataset(Dataset):
         return hdulist
 
     @classmethod
-    def from_hdulist(cls, hdulist, name=None, lazy=False, format="gadf"):
+    def from_hdulist(
+        cls, hdulist, name=None, lazy=False, format="gadf", slices=None, cutout=None
+    ):
         """Create map dataset from list of HDUs.
 
         Parameters
@@ -1563,6 +1631,13 @@ class MapDataset(Dataset):
             Whether to lazy load data into memory. Default is False.
         format : {"gadf"}
             Format the hdulist is given in. Default is "gadf".
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs, see
+            `MapDataset.slice_by_idx`. Only the selected part of the maps is
+            read. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to `MapDataset.cutout`. Only the pixels
+            within the cutout are read. Default is None.
 
         Returns
         -------
@@ -1573,37 +1648,43 @@ class MapDataset(Dataset):
         kwargs = {"name": name}
         kwargs["meta"] = MapDatasetMetaData.from_header(hdulist["PRIMARY"].header)
 
+        map_kwargs = {"format": format, "slices": slices, "cutout": cutout}
+        irf_kwargs = map_kwargs.copy()
+
+        if cutout is not None:
+            irf_kwargs["cutout"] = {"min_npix": 3, **cutout}
+
         if "COUNTS" in hdulist:
-            kwargs["counts"] = Map.from_hdulist(hdulist, hdu="counts", format=format)
+            kwargs["counts"] = Map.from_hdulist(hdulist, hdu="counts", **map_kwargs)
 
         if "EXPOSURE" in hdulist:
-            exposure = Map.from_hdulist(hdulist, hdu="exposure", format=format)
+            exposure = Map.from_hdulist(hdulist, hdu="exposure", **map_kwargs)
             if exposure.geom.axes[0].name == "energy":
                 exposure.geom.axes[0].name = "energy_true"
             kwargs["exposure"] = exposure
 
         if "BACKGROUND" in hdulist:
             kwargs["background"] = Map.from_hdulist(
-                hdulist, hdu="background", format=format
+                hdulist, hdu="background", **map_kwargs
             )
 
         if "EDISP" in hdulist:
             kwargs["edisp"] = EDispMap.from_hdulist(
-                hdulist, hdu="edisp", exposure_hdu="edisp_exposure", format=format
+                hdulist, hdu="edisp", exposure_hdu="edisp_exposure", **irf_kwargs
             )
 
         if "PSF" in hdulist:
             kwargs["psf"] = PSFMap.from_hdulist(
-                hdulist, hdu="psf", exposure_hdu="psf_exposure", format=format
+                hdulist, hdu="psf", exposure_hdu="psf_exposure", **irf_kwargs
             )
 
         if "MASK_SAFE" in hdulist:
-            mask_safe = Map.from_hdulist(hdulist, hdu="mask_safe", format=format)
+            mask_safe = Map.from_hdulist(hdulist, hdu="mask_safe", **map_kwargs)
             mask_safe.data = mask_safe.data.astype(bool)
             kwargs["mask_safe"] = mask_safe
 
         if "MASK_FIT" in hdulist:
-            mask_fit = Map.from_hdulist(hdulist, hdu="mask_fit", format=format)
+            mask_fit = Map.from_hdulist(hdulist, hdu="mask_fit", **map_kwargs)
             mask_fit.data = mask_fit.data.astype(bool)
             kwargs["mask_fit"] = mask_fit
 
@@ -1617,7 +1698,7 @@ class MapDataset(Dataset):
 
         return cls(**kwargs)
 
-    def write(self, filename, overwrite=False, checksum=False):
+    def write(self, filename, overwrite=False, checksum=False, tile_compress=False):
         """Write Dataset to file.
 
         A MapDataset is serialised using the GADF format with a WCS geometry.
@@ -1632,8 +1713,25 @@ class MapDataset(Dataset):
         checksum : bool
             When True adds both DATASUM and CHECKSUM cards to the headers written to the file.
             Default is False.
+        tile_compress : bool, optional
+            Whether to store the image HDUs as lossless tile-compressed images.
+            Default is False.
+
+        Notes
+        -----
+        With ``tile_compress=True`` each image HDU is split into tiles of at most
+        one image plane, which are compressed independently. The file keeps the
+        GADF layout and is read with `MapDataset.read` as usual, but energy
+        slices and spatial cutouts only decompress the tiles they overlap.
+        Converting between both layouts is a matter of reading the dataset and
+        writing it again with the other ``tile_compress`` value.
         """
-        self.to_hdulist().writeto(
+        hdulist = self.to_hdulist()
+
+        if tile_compress:
+            hdulist = to_tile_compressed_hdulist(hdulist)
+
+        hdulist.writeto(
             str(make_path(filename)), overwrite=overwrite, checksum=checksum
         )
 
@@ -1679,7 +1777,17 @@ class MapDataset(Dataset):
 
     @classmethod
     def read(
-        cls, filename, name=None, lazy=False, cache=True, format="gadf", checksum=False
+        cls,
+        filename,
+        name=None,
+        lazy=False,
+        cache=True,
+        format="gadf",
+        checksum=False,
+        energy_min=None,
+        energy_max=None,
+        position=None,
+        width=None,
     ):
         """Read a dataset from file.
 
@@ -1697,11 +1805,27 @@ class MapDataset(Dataset):
             Format of the dataset file. Default is "gadf".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        energy_min, energy_max : `~astropy.units.Quantity`, optional
+            Reconstructed energy range to read, see `MapDataset.slice_by_energy`.
+            Default is None.
+        position : `~astropy.coordinates.SkyCoord`, optional
+            Center position of the cutout to read, see `MapDataset.cutout`.
+            Default is None.
+        width : tuple of `~astropy.coordinates.Angle`, optional
+            Angular sizes of the cutout to read. Required if ``position`` is given.
+            Default is None.
 
         Returns
         -------
         dataset : `MapDataset`
             Map dataset.
+
+        Notes
+        -----
+        Reading an energy range or a cutout is equivalent to reading the full
+        dataset and calling `MapDataset.slice_by_energy` and `MapDataset.cutout`,
+        but for WCS maps only the selected part of the data is read from the
+        file. See `MapDataset.write` for a tile-compressed layout.
         """
 
         if name is None:
@@ -1709,21 +1833,44 @@ class MapDataset(Dataset):
             name = header.get("NAME", name)
         ds_name = make_name(name)
 
+        is_partial = energy_min is not None or energy_max is not None
+        is_partial |= position is not None
+
+        if lazy and is_partial:
+            raise ValueError(
+                "Reading a partial dataset is not supported with lazy=True"
+            )
+
         if lazy:
             return cls._read_lazy(
                 name=ds_name, filename=filename, cache=cache, format=format
             )
-        else:
-            with fits.open(
-                str(make_path(filename)), memmap=False, checksum=checksum
-            ) as hdulist:
-                return cls.from_hdulist(hdulist, name=ds_name, format=format)
+
+        with fits.open(
+            str(make_path(filename)), memmap=is_partial, checksum=checksum
+        ) as hdulist:
+            slices, cutout = None, None
+
+            if energy_min is not None or energy_max is not None:
+                axes = MapAxes.from_table_hdu(hdulist["COUNTS_BANDS"], format=format)
+                slices = _get_energy_slices(
+                    axes["energy"], energy_min=energy_min, energy_max=energy_max
+                )
+
+            if position is not None:
+                cutout = {"position": position, "width": width, "mode": "trim"}
+
+            return cls.from_hdulist(
+                hdulist, name=ds_name, format=format, slices=slices, cutout=cutout
+            )
 
     @classmethod
-    def from_dict(cls, data, lazy=False, cache=True):
+    def from_dict(cls, data, lazy=False, cache=True, **kwargs):
         """Create from dicts and models list generated from YAML serialization."""
         filename = make_path(data["filename"])
-        dataset = cls.read(filename, name=data["name"], lazy=lazy, cache=cache)
+        dataset = cls.read(
+            filename, name=data["name"], lazy=lazy, cache=cache, **kwargs
+        )
         return dataset
 
     @property
@@ -2172,6 +2319,13 @@ class MapDataset(Dataset):
         dataset : `MapDataset` or `SpectrumDataset`
             Sliced dataset.
 
+        Notes
+        -----
+        The maps of the sliced dataset are read-only views on the data of the
+        parent dataset, so no data is copied. Modifying them in place through
+        the `~gammapy.maps.Map` API, e.g. by stacking, copies the data first
+        (copy-on-write), writing directly to the ``.data`` arrays raises an error.
+
         Examples
         --------
         >>> from gammapy.datasets import MapDataset
@@ -2195,25 +2349,25 @@ class MapDataset(Dataset):
         kwargs = {"gti": self.gti, "name": name, "meta_table": self.meta_table}
 
         if self.counts is not None:
-            kwargs["counts"] = self.counts.slice_by_idx(slices=slices)
+            kwargs["counts"] = _slice_by_idx_view(self.counts, slices)
 
         if self.exposure is not None:
-            kwargs["exposure"] = self.exposure.slice_by_idx(slices=slices)
+            kwargs["exposure"] = _slice_by_idx_view(self.exposure, slices)
 
         if self.background is not None and self.stat_type == "cash":
-            kwargs["background"] = self.background.slice_by_idx(slices=slices)
+            kwargs["background"] = _slice_by_idx_view(self.background, slices)
 
         if self.edisp is not None:
-            kwargs["edisp"] = self.edisp.slice_by_idx(slices=slices)
+            kwargs["edisp"] = _slice_by_idx_view(self.edisp, slices)
 
         if self.psf is not None:
-            kwargs["psf"] = self.psf.slice_by_idx(slices=slices)
+            kwargs["psf"] = _slice_by_idx_view(self.psf, slices)
 
         if self.mask_safe is not None:
-            kwargs["mask_safe"] = self.mask_safe.slice_by_idx(slices=slices)
+            kwargs["mask_safe"] = _slice_by_idx_view(self.mask_safe, slices)
 
         if self.mask_fit is not None:
-            kwargs["mask_fit"] = self.mask_fit.slice_by_idx(slices=slices)
+            kwargs["mask_fit"] = _slice_by_idx_view(self.mask_fit, slices)
 
         return self.__class__(**kwargs)
 
@@ -2241,33 +2395,52 @@ class MapDataset(Dataset):
         (3, np.int64(240), np.int64(320))
         """
         name = make_name(name)
+        slices = _get_energy_slices(
+            self._geom.axes["energy"], energy_min=energy_min, energy_max=energy_max
+        )
+        return self.slice_by_idx(slices, name=name)
 
-        energy_axis = self._geom.axes["energy"]
-
-        if energy_min is None:
-            energy_min = energy_axis.bounds[0]
+    def reset_data_cache(self):
+        """Reset data cache to free memory space.
 
-        if energy_max is None:
-            energy_max = energy_axis.bounds[1]
+        Only the data members that were lazily loaded from file are cleared,
+        they are loaded again on the next access. Data members assigned after
+        reading are kept.
+        """
+        for name in self._lazy_data_members:
+            self.__dict__.pop(f"_{name}_checksum", None)
+            if f"_{name}_hdu" in self.__dict__ and self.__dict__.pop(name, False):
+                log.info(f"Clearing {name} cache for dataset {self.name}")
 
-        energy_min, energy_max = u.Quantity(energy_min), u.Quantity(energy_max)
+    def _evict_data_cache(self):
+        """Clear the data members loaded from file that were not modified since.
 
-        group = energy_axis.group_table(edges=[energy_min, energy_max])
+        Members modified in place, or loaded before the cache was tracked and
+        thus without a checksum, are kept in memory and detached from the file,
+        so that they are neither reloaded nor evicted later.
+        """
+        for name in self._lazy_data_members:
+            if f"_{name}_hdu" not in self.__dict__ or name not in self.__dict__:
+                continue
 
-        is_normal = group["bin_type"] == "normal   "
-        group = group[is_normal]
+            checksum = self.__dict__.pop(f"_{name}_checksum", None)
 
-        slices = {
-            "energy": slice(int(group["idx_min"][0]), int(group["idx_max"][0]) + 1)
-        }
+            if checksum == _get_data_checksum(self.__dict__[name]):
+                log.info(f"Clearing {name} cache for dataset {self.name}")
+                del self.__dict__[name]
+            else:
+                del self.__dict__[f"_{name}_hdu"]
 
-        return self.slice_by_idx(slices, name=name)
+    def _get_data_cache_nbytes(self):
+        """Number of bytes of the lazily loaded data members held in memory."""
+        nbytes = 0
 
-    def reset_data_cache(self):
-        """Reset data cache to free memory space."""
         for name in self._lazy_data_members:
-            if self.__dict__.pop(name, False):
-                log.info(f"Clearing {name} cache for dataset {self.name}")
+            if f"_{name}_hdu" in self.__dict__:
+                value = self.__dict__.get(name)
+                nbytes += sum(_.nbytes for _ in _get_data_arrays(value))
+
+        return nbytes
 
     def resample_energy_axis(self, energy_axis, name=None):
         """Resample MapDataset over new reco energy axis.
@@ -2927,16 +3100,11 @@ class MapDatasetOnOff(MapDataset):
                 nan_to_num=nan_to_num,
             )
 
-        with np.errstate(divide="ignore", invalid="ignore"):
-            acceptance_off = total_acceptance * total_off / total_alpha
-            average_alpha = total_alpha.data.sum() / total_off.data.sum()
-
-        # For the bins where the stacked OFF counts equal 0, the alpha value is
-        # performed by weighting on the total OFF counts of each run
-        is_zero = total_off.data == 0
-        acceptance_off.data[is_zero] = total_acceptance.data[is_zero] / average_alpha
+        acceptance_off = _get_stacked_acceptance_off(
+            total_acceptance, total_off, total_alpha
+        )
 
-        self.acceptance.data[...] = total_acceptance.data
+        self.acceptance = total_acceptance
         self.acceptance_off = acceptance_off
 
         self.counts_off = total_off
@@ -3006,7 +3174,7 @@ class MapDatasetOnOff(MapDataset):
         )
 
     @classmethod
-    def from_hdulist(cls, hdulist, name=None, format="gadf"):
+    def from_hdulist(cls, hdulist, name=None, format="gadf", slices=None, cutout=None):
         """Create map dataset from list of HDUs.
 
         Parameters
@@ -3017,6 +3185,13 @@ class MapDatasetOnOff(MapDataset):
             Name of the new dataset. Default is None.
         format : {"gadf"}
             Format the hdulist is given in. Default is "gadf".
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs, see
+            `MapDataset.slice_by_idx`. Only the selected part of the maps is
+            read. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to `MapDataset.cutout`. Only the pixels
+            within the cutout are read. Default is None.
 
         Returns
         -------
@@ -3026,35 +3201,44 @@ class MapDatasetOnOff(MapDataset):
         kwargs = {}
         kwargs["name"] = name
 
+        map_kwargs = {"format": format, "slices": slices, "cutout": cutout}
+        irf_kwargs = map_kwargs.copy()
+
+        if cutout is not None:
+            irf_kwargs["cutout"] = {"min_npix": 3, **cutout}
+
+        irf_exposure_kwargs = irf_kwargs.copy()
+
+        if slices is not None and "energy_true" not in slices:
+            irf_exposure_kwargs["slices"] = None
+
         if "COUNTS" in hdulist:
-            kwargs["counts"] = Map.from_hdulist(hdulist, hdu="counts", format=format)
+            kwargs["counts"] = Map.from_hdulist(hdulist, hdu="counts", **map_kwargs)
 
         if "COUNTS_OFF" in hdulist:
             kwargs["counts_off"] = Map.from_hdulist(
-                hdulist, hdu="counts_off", format=format
+                hdulist, hdu="counts_off", **map_kwargs
             )
 
         if "ACCEPTANCE" in hdulist:
             kwargs["acceptance"] = Map.from_hdulist(
-                hdulist, hdu="acceptance", format=format
+                hdulist, hdu="acceptance", **map_kwargs
             )
 
         if "ACCEPTANCE_OFF" in hdulist:
             kwargs["acceptance_off"] = Map.from_hdulist(
-                hdulist, hdu="acceptance_off", format=format
+                hdulist, hdu="acceptance_off", **map_kwargs
             )
 
         if "EXPOSURE" in hdulist:
-            kwargs["exposure"] = Map.from_hdulist(
-                hdulist, hdu="exposure", format=format
-            )
+            kwargs["exposure"] = Map.from_hdulist(hdulist, hdu="exposure", **map_kwargs)
 
         if "EDISP" in hdulist:
-            edisp_map = Map.from_hdulist(hdulist, hdu="edisp", format=format)
+            edisp_map = Map.from_hdulist(hdulist, hdu="edisp", **irf_kwargs)
 
             try:
                 exposure_map = Map.from_hdulist(
-                    hdulist, hdu="edisp_exposure", format=format
+                    hdulist, hdu="edisp_exposure", **irf_exposure_kwargs
                 )
             except KeyError:
                 exposure_map = None
@@ -3065,21 +3249,21 @@ class MapDatasetOnOff(MapDataset):
                 kwargs["edisp"] = EDispMap(edisp_map, exposure_map)
 
         if "PSF" in hdulist:
-            psf_map = Map.from_hdulist(hdulist, hdu="psf", format=format)
+            psf_map = Map.from_hdulist(hdulist, hdu="psf", **irf_kwargs)
             try:
                 exposure_map = Map.from_hdulist(
-                    hdulist, hdu="psf_exposure", format=format
+                    hdulist, hdu="psf_exposure", **irf_exposure_kwargs
                 )
             except KeyError:
                 exposure_map = None
             kwargs["psf"] = PSFMap(psf_map, exposure_map)
 
         if "MASK_SAFE" in hdulist:
-            mask_safe = Map.from_hdulist(hdulist, hdu="mask_safe", format=format)
+            mask_safe = Map.from_hdulist(hdulist, hdu="mask_safe", **map_kwargs)
             kwargs["mask_safe"] = mask_safe
 
         if "MASK_FIT" in hdulist:
-            mask_fit = Map.from_hdulist(hdulist, hdu="mask_fit", format=format)
+            mask_fit = Map.from_hdulist(hdulist, hdu="mask_fit", **map_kwargs)
             kwargs["mask_fit"] = mask_fit
 
         if "GTI" in hdulist:
@@ -3322,13 +3506,13 @@ class MapDatasetOnOff(MapDataset):
         dataset = super().slice_by_idx(slices, name)
 
         if self.counts_off is not None:
-            kwargs["counts_off"] = self.counts_off.slice_by_idx(slices=slices)
+            kwargs["counts_off"] = _slice_by_idx_view(self.counts_off, slices)
 
         if self.acceptance is not None:
-            kwargs["acceptance"] = self.acceptance.slice_by_idx(slices=slices)
+            kwargs["acceptance"] = _slice_by_idx_view(self.acceptance, slices)
 
         if self.acceptance_off is not None:
-            kwargs["acceptance_off"] = self.acceptance_off.slice_by_idx(slices=slices)
+            kwargs["acceptance_off"] = _slice_by_idx_view(self.acceptance_off, slices)
 
         return self.from_map_dataset(dataset, **kwargs)
 
@@ -3379,3 +3563,293 @@ class MapDatasetOnOff(MapDataset):
             counts_off=counts_off,
             name=name,
         )
+
+
+class MapDatasetStacker:
+    """Incremental stacking of map datasets.
+
+    The stacker accumulates datasets into the maps of a single dataset, following
+    the same rules as `~gammapy.datasets.MapDataset.stack`. Contrary to repeated
+    calls of `~gammapy.datasets.MapDataset.stack`, the IRF maps are kept weighted
+    by their exposure and the off acceptance is only computed once, while the
+    GTI and meta tables are concatenated in a single step by `finalize`. Partial
+    stackers, e.g. filled in parallel workers, can be combined with `merge`.
+
+    For details, see :ref:`stack`.
+
+    Parameters
+    ----------
+    dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+        Dataset to stack into, e.g. an empty dataset created with
+        `~gammapy.datasets.MapDataset.from_geoms`. It is modified in place and
+        returned by `finalize`.
+    nan_to_num : bool
+        Non-finite values are replaced by zero if True. Default is True. As for
+        `~gammapy.datasets.MapDataset.stack`, non-finite values of the IRF maps
+        are always replaced.
+    """
+
+    def __init__(self, dataset, nan_to_num=True):
+        self._dataset = dataset
+        self.nan_to_num = nan_to_num
+        self._gtis = []
+        self._meta_tables = []
+        self._livetime = None
+        self._irfs = []
+
+        self._append_tables(dataset)
+
+        if dataset.exposure and "livetime" in dataset.exposure.meta:
+            self._livetime = dataset.exposure.meta["livetime"]
+
+        if (
+            dataset.stat_type == "cash"
+            and dataset.background_model
+            and dataset.background
+        ):
+            dataset.background = dataset.npred_background().copy()
+
+        for irf in [dataset.psf, dataset.edisp]:
+            if getattr(irf, "exposure_map", None) is not None:
+                irf._irf_map._ensure_writeable()
+                irf._irf_map.data *= irf.exposure_map.data
+                self._irfs.append(irf)
+
+        if isinstance(dataset, MapDatasetOnOff):
+            if not dataset._is_stackable:
+                raise ValueError("Cannot stack incomplete MapDatasetOnOff.")
+
+            geom = dataset.counts.geom
+            acceptance = Map.from_geom(geom)
+            self._counts_off = Map.from_geom(geom)
+            self._alpha_counts_off = Map.from_geom(geom)
+
+            if dataset.acceptance:
+                acceptance.stack(dataset.acceptance, nan_to_num=nan_to_num)
+
+            if dataset.counts_off:
+                self._counts_off.stack(dataset.counts_off, nan_to_num=nan_to_num)
+                self._alpha_counts_off.stack(
+                    dataset.alpha * dataset.counts_off, nan_to_num=nan_to_num
+                )
+
+            dataset.acceptance = acceptance
+
+    @classmethod
+    def from_dataset(cls, dataset, name=None, nan_to_num=True):
+        """Create an empty stacker with the type and geometries of a dataset.
+
+        The dataset itself is not stacked.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Reference dataset.
+        name : str, optional
+            Name of the stacked dataset. Default is None.
+        nan_to_num : bool
+            Non-finite values are replaced by zero if True. Default is True.
+
+        Returns
+        -------
+        stacker : `MapDatasetStacker`
+            Map dataset stacker.
+        """
+        stacked = dataset.__class__.from_geoms(**dataset.geoms, name=name)
+        return cls(stacked, nan_to_num=nan_to_num)
+
+    def _check_not_finalized(self):
+        if self._dataset is None:
+            raise ValueError("MapDatasetStacker has already been finalized.")
+
+    def _append_tables(self, dataset):
+        if dataset.gti and len(dataset.gti.table) > 0:
+            self._gtis.append(dataset.gti)
+
+        if dataset.meta_table:
+            self._meta_tables.append(dataset.meta_table)
+
+    def _add_livetime(self, livetime):
+        if self._livetime is None:
+            self._livetime = livetime.copy()
+        else:
+            self._livetime = self._livetime + livetime
+
+    @staticmethod
+    def _stack_irf(irf, other, weights=None):
+        # like `~gammapy.irf.IRFMap.stack`, non-finite values are always replaced
+        if irf.exposure_map is None or other.exposure_map is None:
+            raise ValueError(f"Missing exposure map for {irf.__class__.__name__}.stack")
+
+        irf._irf_map.stack(other._irf_map * other.exposure_map.data, weights=weights)
+
+        if weights and "energy" in weights.geom.axes.names:
+            weights = weights.reduce(
+                axis_name="energy", func=np.logical_or, keepdims=True
+            )
+
+        irf.exposure_map.stack(other.exposure_map, weights=weights)
+
+    def stack(self, other):
+        """Stack a dataset.
+
+        Parameters
+        ----------
+        other : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Dataset to stack. If the stacked dataset is an on-off dataset, other
+            must be an on-off dataset as well.
+        """
+        self._check_not_finalized()
+        dataset, nan_to_num = self._dataset, self.nan_to_num
+
+        if isinstance(dataset, MapDatasetOnOff):
+            if not isinstance(other, MapDatasetOnOff):
+                raise TypeError("Incompatible types for MapDatasetOnOff stacking")
+
+            if not other._is_stackable:
+                raise ValueError("Cannot stack incomplete MapDatasetOnOff.")
+
+            dataset.acceptance.stack(
+                other.acceptance, weights=other.mask_safe, nan_to_num=nan_to_num
+            )
+
+            if other.counts_off:
+                self._counts_off.stack(
+                    other.counts_off, weights=other.mask_safe, nan_to_num=nan_to_num
+                )
+                self._alpha_counts_off.stack(
+                    other.alpha * other.counts_off,
+                    weights=other.mask_safe,
+                    nan_to_num=nan_to_num,
+                )
+
+        if dataset.counts and other.counts:
+            dataset.counts.stack(
+                other.counts, weights=other.mask_safe, nan_to_num=nan_to_num
+            )
+
+        if dataset.exposure and other.exposure:
+            mask_safe_image = other.mask_safe_image
+            dataset.exposure.stack(
+                other.exposure, weights=mask_safe_image, nan_to_num=nan_to_num
+            )
+
+            if "livetime" in other.exposure.meta and np.any(mask_safe_image):
+                self._add_livetime(other.exposure.meta["livetime"])
+
+        if dataset.stat_type == "cash":
+            if dataset.background and other.background:
+                dataset.background.stack(
+                    other.npred_background(),
+                    weights=other.mask_safe,
+                    nan_to_num=nan_to_num,
+                )
+
+        if dataset.psf and other.psf:
+            if isinstance(dataset.psf, RecoPSFMap):
+                raise NotImplementedError(
+                    "Stacking is not supported for PSF in reconstructed energy."
+                )
+            self._stack_irf(dataset.psf, other.psf, weights=other.mask_safe_psf)
+
+        if dataset.edisp and other.edisp:
+            self._stack_irf(dataset.edisp, other.edisp, weights=other.mask_safe_edisp)
+
+        if dataset.mask_safe and other.mask_safe:
+            dataset.mask_safe.stack(other.mask_safe)
+
+        if dataset.mask_fit and other.mask_fit:
+            dataset.mask_fit.stack(other.mask_fit)
+        elif other.mask_fit:
+            dataset.mask_fit = other.mask_fit.copy()
+
+        self._append_tables(other)
+
+    def merge(self, other):
+        """Merge another, not finalized, stacker into this one.
+
+        Parameters
+        ----------
+        other : `MapDatasetStacker`
+            Stacker to merge. Its stacked dataset must have the same type and
+            the same or cutout geometries.
+        """
+        self._check_not_finalized()
+        other._check_not_finalized()
+        dataset, nan_to_num = self._dataset, self.nan_to_num
+        stacked = other._dataset
+
+        if type(dataset) is not type(stacked):
+            raise TypeError(
+                f"Cannot merge stackers of {type(dataset).__name__} "
+                f"and {type(stacked).__name__}"
+            )
+
+        if isinstance(dataset, MapDatasetOnOff):
+            dataset.acceptance.stack(stacked.acceptance, nan_to_num=nan_to_num)
+            self._counts_off.stack(other._counts_off, nan_to_num=nan_to_num)
+            self._alpha_counts_off.stack(other._alpha_counts_off, nan_to_num=nan_to_num)
+
+        names = ["counts", "exposure", "mask_safe"]
+        if dataset.stat_type == "cash":
+            names.append("background")
+
+        for name in names:
+            m, m_other = getattr(dataset, name), getattr(stacked, name)
+            if m and m_other:
+                m.stack(m_other, nan_to_num=nan_to_num)
+
+        for irf, irf_other in zip(self._irfs, other._irfs):
+            irf._irf_map.stack(irf_other._irf_map)
+            irf.exposure_map.stack(irf_other.exposure_map)
+
+        if dataset.mask_fit and stacked.mask_fit:
+            dataset.mask_fit.stack(stacked.mask_fit)
+        elif stacked.mask_fit:
+            dataset.mask_fit = stacked.mask_fit.copy()
+
+        if other._livetime is not None:
+            self._add_livetime(other._livetime)
+
+        self._gtis.extend(other._gtis)
+        self._meta_tables.extend(other._meta_tables)
+
+    def finalize(self):
+        """Normalise the IRF maps and concatenate the GTI and meta tables.
+
+        The stacker can not be used anymore afterwards.
+
+        Returns
+        -------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Stacked dataset.
+        """
+        self._check_not_finalized()
+        dataset = self._dataset
+
+        for irf in self._irfs:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                irf._irf_map.data /= irf.exposure_map.data
+            irf._irf_map.data = np.nan_to_num(irf._irf_map.data)
+
+        if isinstance(dataset, MapDatasetOnOff):
+            dataset.acceptance_off = _get_stacked_acceptance_off(
+                dataset.acceptance, self._counts_off, self._alpha_counts_off
+            )
+            dataset.counts_off = self._counts_off
+
+        if self._livetime is not None:
+            dataset.exposure.meta["livetime"] = self._livetime
+
+        if dataset.gti is not None and self._gtis:
+            dataset.gti = GTI.from_stack(self._gtis).union()
+
+        if self._meta_tables:
+            meta_table = Table()
+            for column in self._meta_tables[0].colnames:
+                data = [table[column].data[0] for table in self._meta_tables]
+                meta_table[column] = np.hstack(data)[np.newaxis, :]
+            dataset.meta_table = meta_table
+
+        self._dataset = None
+        return dataset
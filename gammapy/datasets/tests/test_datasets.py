@@ -3,10 +3,18 @@ import os
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
+import astropy.units as u
 from astropy.coordinates import SkyCoord
-from gammapy.datasets import Datasets, SpectrumDatasetOnOff
+from astropy.time import Time
+from gammapy.data import GTI
+from gammapy.datasets import (
+    Datasets,
+    MapDataset,
+    SpectrumDataset,
+    SpectrumDatasetOnOff,
+)
 from gammapy.datasets.tests.test_map import get_map_dataset
-from gammapy.maps import MapAxis, WcsGeom
+from gammapy.maps import MapAxis, RegionGeom, WcsGeom
 from gammapy.modeling import Fit
 from gammapy.modeling.models import FoVBackgroundModel, Models, SkyModel
 from gammapy.modeling.tests.test_fit import MyDataset
@@ -77,6 +85,172 @@ def test_datasets_mutation():
         dats.extend(dats2)
 
 
+def test_datasets_select_time():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+
+    reference_time = Time("2020-01-01T00:00:00", scale="utc")
+    starts = [3, 0, 1, 5, 1.5] * u.h
+
+    datasets = Datasets()
+
+    for idx, start in enumerate(starts):
+        gti = GTI.create(start, start + 0.5 * u.h, reference_time=reference_time)
+        datasets.append(SpectrumDataset.create(geom=geom, name=f"d{idx}", gti=gti))
+
+    time_min = reference_time + [0, 1, 4, 10] * u.h
+    time_max = reference_time + [2, 4, 6, 11] * u.h
+
+    groups = datasets.group_by_time(time_min=time_min, time_max=time_max)
+
+    assert len(groups) == 4
+    assert groups[0].names == ["d1", "d2", "d4"]
+    assert groups[1].names == ["d0", "d2", "d4"]
+    assert groups[2].names == ["d3"]
+    assert len(groups[3]) == 0
+
+    # interval bounds in a different time scale
+    selected = datasets.select_time(time_min[1].tt, time_max[1].tt)
+    assert selected.names == ["d0", "d2", "d4"]
+
+    selected = datasets.select_time(time_min[1] + 1 * u.ms, time_max[1], atol=1 * u.s)
+    assert selected.names == ["d0", "d2", "d4"]
+
+    datasets["d3"].gti = GTI.create(0.2 * u.h, 0.4 * u.h, reference_time=reference_time)
+    selected = datasets.select_time(time_min[0], time_max[0])
+    assert selected.names == ["d1", "d2", "d3", "d4"]
+
+
+def test_datasets_max_memory(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(npix=20, binsz=0.1, axes=[axis])
+
+    datasets = Datasets()
+    for idx in range(4):
+        dataset = MapDataset.create(geom=geom, name=f"test-{idx}")
+        dataset.counts.data += idx
+        dataset.mask_safe.data = True
+        dataset.gti = GTI.create(idx * u.h, (idx + 1) * u.h)
+        datasets.append(dataset)
+
+    datasets.write(tmp_path / "datasets.yaml")
+
+    nbytes = 3 * 20 * 20 * (4 + 4 + 1)
+    datasets_lazy = Datasets.read(
+        tmp_path / "datasets.yaml", checksum=False, max_memory=1.5 * nbytes * u.byte
+    )
+    assert_allclose(datasets_lazy.max_memory, 1.5 * nbytes * u.byte)
+
+    for dataset in datasets_lazy:
+        dataset.counts, dataset.background, dataset.mask_safe
+        assert dataset._get_data_cache_nbytes() == nbytes
+
+    n_loaded = [d._get_data_cache_nbytes() > 0 for d in datasets_lazy._datasets]
+    assert_equal(n_loaded, [False, False, True, True])
+
+    stacked = datasets_lazy.stack_reduce()
+    assert_allclose(
+        stacked.counts.data.sum(), datasets.stack_reduce().counts.data.sum()
+    )
+
+    table = datasets_lazy.info_table(cumulative=True)
+    assert_equal(table["counts"], [0, 1200, 3600, 7200])
+
+    n_loaded = [d._get_data_cache_nbytes() > 0 for d in datasets_lazy._datasets]
+    assert sum(n_loaded) <= 2
+
+    datasets_lazy.max_memory = None
+    for dataset in datasets_lazy:
+        dataset.counts
+
+    n_loaded = [d._get_data_cache_nbytes() > 0 for d in datasets_lazy._datasets]
+    assert all(n_loaded)
+
+
+def test_datasets_max_memory_modified(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(npix=20, binsz=0.1, axes=[axis])
+
+    datasets = Datasets()
+    for idx in range(3):
+        dataset = MapDataset.create(geom=geom, name=f"test-{idx}")
+        dataset.mask_safe.data = True
+        datasets.append(dataset)
+
+    datasets.write(tmp_path / "datasets.yaml")
+
+    datasets_lazy = Datasets.read(
+        tmp_path / "datasets.yaml", checksum=False, max_memory=4000 * u.byte
+    )
+
+    datasets_lazy[0].mask_safe.data[...] = False
+    datasets_lazy[1].counts = datasets_lazy[1].counts + 1
+
+    for _ in range(2):
+        for dataset in datasets_lazy:
+            dataset.counts, dataset.mask_safe
+
+    # modified data is kept and no longer counted towards the budget
+    assert datasets_lazy[0].mask_safe.data.sum() == 0
+    assert datasets_lazy[1].counts.data.sum() == 1200
+    assert "_mask_safe_hdu" not in datasets_lazy[0].__dict__
+    assert "_counts_hdu" not in datasets_lazy[1].__dict__
+
+
+def test_datasets_max_memory_checksum(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(npix=20, binsz=0.1, axes=[axis])
+
+    Datasets([MapDataset.create(geom=geom, name="test")]).write(
+        tmp_path / "datasets.yaml"
+    )
+
+    # the checksum is only needed to evict the data
+    datasets_lazy = Datasets.read(tmp_path / "datasets.yaml", checksum=False)
+    datasets_lazy[0].counts
+    assert "_counts_checksum" not in datasets_lazy[0].__dict__
+
+    datasets_lazy = Datasets.read(
+        tmp_path / "datasets.yaml", checksum=False, max_memory="1 MB"
+    )
+    datasets_lazy[0].counts
+    assert "_counts_checksum" in datasets_lazy[0].__dict__
+
+
+def test_datasets_read_partial(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "100 TeV", nbin=4)
+    geom = WcsGeom.create(npix=20, binsz=0.1, axes=[axis])
+
+    datasets = Datasets()
+    for idx in range(2):
+        dataset = MapDataset.create(geom=geom, name=f"test-{idx}")
+        dataset.counts.data += idx + 1
+        datasets.append(dataset)
+
+    datasets.write(tmp_path / "datasets.yaml", tile_compress=True)
+
+    position = SkyCoord(0.2, 0.1, unit="deg")
+    datasets_partial = Datasets.read(
+        tmp_path / "datasets.yaml",
+        checksum=False,
+        energy_min=3 * u.TeV,
+        energy_max=30 * u.TeV,
+        position=position,
+        width=1 * u.deg,
+    )
+
+    assert datasets_partial.names == ["test-0", "test-1"]
+
+    for idx, dataset in enumerate(datasets_partial):
+        desired = (
+            datasets[idx]
+            .slice_by_energy(energy_min=3 * u.TeV, energy_max=30 * u.TeV)
+            .cutout(position=position, width=1 * u.deg)
+        )
+        assert dataset.counts.geom == desired.counts.geom
+        assert_equal(dataset.counts.data, desired.counts.data)
+
+
 @requires_data()
 def test_datasets_info_table():
     datasets_hess = Datasets()
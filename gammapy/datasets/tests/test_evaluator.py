@@ -8,7 +8,7 @@ from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
 from gammapy.datasets.evaluator import MapEvaluator
 from gammapy.irf import PSFKernel, RecoPSFMap
-from gammapy.maps import Map, MapAxis, RegionGeom, RegionNDMap, WcsGeom
+from gammapy.maps import HpxGeom, Map, MapAxis, RegionGeom, RegionNDMap, WcsGeom
 from gammapy.modeling.models import (
     ConstantSpectralModel,
     GaussianSpatialModel,
@@ -18,7 +18,7 @@ from gammapy.modeling.models import (
     SkyModel,
 )
 from gammapy.utils.gauss import Gauss2DPDF
-from gammapy.utils.testing import mpl_plot_check
+from gammapy.utils.testing import mpl_plot_check, requires_dependency
 
 
 @pytest.fixture
@@ -277,3 +277,39 @@ def test_norm_only_changed():
     spectral_model.amplitude.value *= 2
     spectral_model.index.value *= 2
     assert not evaluator.parameter_norm_only_changed
+
+
+@requires_dependency("healpy")
+def test_apply_psf_hpx():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = HpxGeom.create(
+        nside=64, region="DISK(0,0,5)", axes=[energy_axis_true], frame="galactic"
+    )
+
+    spectral_model = PowerLawSpectralModel(amplitude="1e-11 TeV-1 s-1 m-2")
+    spatial_model = PointSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s", data=1e12)
+
+    wcs_geom = WcsGeom.create(
+        width=4, binsz=0.1, axes=[energy_axis_true], frame="galactic"
+    )
+    psf = PSFKernel.from_gauss(wcs_geom, sigma="0.5 deg")
+
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+    assert evaluator.psf_convolution_method == "wcs-tan"
+
+    npred = evaluator.compute_npred()
+    assert_allclose(npred.data.sum(axis=1), [6.637664, 2.099014], rtol=1e-5)
+
+    # the sparse convolution conserves the flux within the map
+    evaluator = MapEvaluator(
+        model=model, exposure=exposure, psf=psf, psf_convolution_method="sparse"
+    )
+    npred = evaluator.compute_npred()
+    assert_allclose(npred.data.sum(axis=1), [6.837722, 2.162278], rtol=1e-5)
@@ -17,6 +17,7 @@ from gammapy.datasets import (
     Datasets,
     MapDataset,
     MapDatasetOnOff,
+    MapDatasetStacker,
     create_empty_map_dataset_from_irfs,
     create_map_dataset_from_observation,
 )
@@ -741,6 +742,67 @@ def test_map_dataset_fits_io(tmp_path, sky_model, geom, geom_etrue):
     assert_allclose(stacked1.edisp.edisp_map, stacked.edisp.edisp_map)
 
 
+@pytest.mark.parametrize("tile_compress", [False, True])
+def test_map_dataset_read_partial(tmp_path, tile_compress):
+    axis = MapAxis.from_energy_bounds("1 TeV", "100 TeV", nbin=10)
+    axis_etrue = MapAxis.from_energy_bounds(
+        "0.5 TeV", "200 TeV", nbin=15, name="energy_true"
+    )
+    geom = WcsGeom.create(npix=(50, 40), binsz=0.05, axes=[axis], frame="galactic")
+    dataset = MapDataset.create(
+        geom=geom, energy_axis_true=axis_etrue, binsz_irf=0.25, name="test"
+    )
+
+    rng = np.random.default_rng(42)
+    dataset.counts.data = rng.poisson(3, size=geom.data_shape).astype(float)
+    dataset.background.data = rng.random(geom.data_shape)
+    dataset.exposure.data = rng.random(dataset.exposure.data.shape)
+    dataset.mask_safe.data = rng.random(geom.data_shape) > 0.3
+
+    filename = tmp_path / "test.fits"
+    dataset.write(filename, tile_compress=tile_compress)
+
+    with fits.open(filename) as hdulist:
+        assert isinstance(hdulist["COUNTS"], fits.CompImageHDU) == tile_compress
+
+    dataset_full = MapDataset.read(filename)
+    assert_allclose(dataset_full.counts.data, dataset.counts.data)
+    assert_allclose(dataset_full.background.data, dataset.background.data)
+    assert_allclose(dataset_full.exposure.data, dataset.exposure.data)
+    assert_equal(dataset_full.mask_safe.data, dataset.mask_safe.data)
+
+    position = SkyCoord(0.3, 0.2, unit="deg", frame="galactic")
+    width = 0.8 * u.deg
+
+    sliced = MapDataset.read(
+        filename,
+        energy_min=3 * u.TeV,
+        energy_max=30 * u.TeV,
+        position=position,
+        width=width,
+    )
+    desired = dataset_full.slice_by_energy(
+        energy_min=3 * u.TeV, energy_max=30 * u.TeV
+    ).cutout(position=position, width=width)
+
+    assert sliced.name == "test"
+    assert sliced.counts.geom.data_shape == (5, 16, 16)
+
+    for name in ["counts", "background", "exposure", "mask_safe"]:
+        actual, expected = getattr(sliced, name), getattr(desired, name)
+        assert actual.geom == expected.geom
+        assert_equal(actual.data, expected.data)
+
+    for name in ["psf", "edisp"]:
+        actual, expected = getattr(sliced, name), getattr(desired, name)
+        assert actual._irf_map.geom == expected._irf_map.geom
+        assert_equal(actual._irf_map.data, expected._irf_map.data)
+        assert_equal(actual.exposure_map.data, expected.exposure_map.data)
+
+    with pytest.raises(ValueError):
+        MapDataset.read(filename, lazy=True, energy_min=3 * u.TeV)
+
+
 @requires_data()
 def test_map_auto_psf_upsampling(sky_model, geom, geom_etrue):
     dataset_2 = get_map_dataset(geom, geom_etrue, name="test-2")
@@ -1717,6 +1779,88 @@ def test_stack_onoff_cutout(geom_image):
     assert dataset_cutout.name == "cutout-dataset"
 
 
+def _get_stacker_datasets(geom, onoff=False):
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    cls = MapDatasetOnOff if onoff else MapDataset
+    random_state = np.random.RandomState(42)
+
+    datasets = Datasets()
+    for idx in range(4):
+        dataset = cls.create(geom, energy_axis_true=energy_axis_true, name=f"{idx}")
+        dataset.counts.data = random_state.poisson(5, geom.data_shape).astype(float)
+        dataset.background.data += 1 + idx
+        dataset.exposure.data += 1e6 * (idx + 1)
+        dataset.psf.exposure_map.data += 1e6 * (idx + 1)
+        dataset.psf.psf_map.data *= idx + 1
+        dataset.edisp.exposure_map.data += 1e6 * (idx + 1)
+        dataset.mask_safe.data[idx % 2 :] = True
+        dataset.exposure.meta["livetime"] = 1 * u.h
+        dataset.gti = GTI.create(
+            [idx] * u.h, [idx + 1] * u.h, reference_time="2010-01-01T00:00:00"
+        )
+        dataset.meta_table = Table({"OBS_ID": [idx]})
+
+        if onoff:
+            dataset.counts_off.data += 10 * (idx + 1)
+            dataset.acceptance.data += 1
+            dataset.acceptance_off.data += 2 + idx
+
+        datasets.append(dataset)
+
+    return datasets
+
+
+@pytest.mark.parametrize("onoff", [False, True])
+def test_map_dataset_stacker(geom, onoff):
+    datasets = _get_stacker_datasets(geom, onoff=onoff)
+
+    expected = datasets[0].to_masked(name="expected")
+    for dataset in datasets[1:]:
+        expected.stack(dataset)
+
+    stacker = MapDatasetStacker.from_dataset(datasets[0], name="stacked")
+    for dataset in datasets:
+        stacker.stack(dataset)
+
+    stacked = stacker.finalize()
+
+    assert stacked.name == "stacked"
+    assert_allclose(stacked.counts.data, expected.counts.data)
+    assert_allclose(stacked.npred_background().data, expected.npred_background().data)
+    assert_allclose(stacked.exposure.data, expected.exposure.data)
+    assert_allclose(stacked.psf.psf_map.data, expected.psf.psf_map.data)
+    assert_allclose(stacked.edisp.edisp_map.data, expected.edisp.edisp_map.data)
+    assert_equal(stacked.mask_safe.data, expected.mask_safe.data)
+    assert_allclose(stacked.exposure.meta["livetime"], 4 * u.h)
+    assert_allclose(stacked.gti.time_sum, 4 * u.h)
+    assert_equal(stacked.meta_table["OBS_ID"][0], [0, 1, 2, 3])
+
+    if onoff:
+        assert_allclose(stacked.counts_off.data, expected.counts_off.data)
+        assert_allclose(stacked.alpha.data, expected.alpha.data)
+
+    with pytest.raises(ValueError):
+        stacker.stack(datasets[0])
+
+    stackers = [MapDatasetStacker.from_dataset(datasets[0]) for _ in range(2)]
+    for idx, dataset in enumerate(datasets):
+        stackers[idx % 2].stack(dataset)
+
+    stackers[0].merge(stackers[1])
+    merged = stackers[0].finalize()
+
+    assert_allclose(merged.counts.data, expected.counts.data)
+    assert_allclose(merged.psf.psf_map.data, expected.psf.psf_map.data)
+    assert_allclose(merged.edisp.edisp_map.data, expected.edisp.edisp_map.data)
+    assert_allclose(merged.gti.time_sum, 4 * u.h)
+    assert_equal(np.sort(merged.meta_table["OBS_ID"][0]), [0, 1, 2, 3])
+
+    if onoff:
+        assert_allclose(merged.alpha.data, expected.alpha.data)
+
+
 def test_datasets_io_no_model(tmpdir):
     axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
     geom = WcsGeom.create(npix=(5, 5), axes=[axis])
@@ -2009,6 +2153,50 @@ def test_slice_by_idx():
     assert_allclose(axis.edges[0].value, 0.210175, rtol=1e-5)
 
 
+def test_slice_by_idx_view():
+    axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=6)
+    axis_etrue = MapAxis.from_energy_bounds(
+        "0.1 TeV", "10 TeV", nbin=8, name="energy_true"
+    )
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.5, width=(2, 2), axes=[axis])
+    dataset = MapDataset.create(geom=geom, energy_axis_true=axis_etrue, binsz_irf=0.5)
+    dataset.counts.data += 1
+    dataset.mask_safe.data[...] = True
+    dataset.exposure.meta["livetime"] = 1 * u.h
+    dataset.gti = GTI.create(0 * u.s, 1 * u.h)
+
+    sub_dataset = dataset.slice_by_energy(energy_min=1 * u.TeV, energy_max=10 * u.TeV)
+
+    pairs = [
+        (dataset.counts, sub_dataset.counts),
+        (dataset.exposure, sub_dataset.exposure),
+        (dataset.background, sub_dataset.background),
+        (dataset.mask_safe, sub_dataset.mask_safe),
+        (dataset.psf.psf_map, sub_dataset.psf.psf_map),
+        (dataset.edisp.edisp_map, sub_dataset.edisp.edisp_map),
+        (dataset.edisp.exposure_map, sub_dataset.edisp.exposure_map),
+    ]
+
+    for parent, view in pairs:
+        assert np.shares_memory(parent.data, view.data)
+        assert not view.data.flags.writeable
+        assert parent.data.flags.writeable
+
+    with pytest.raises(ValueError):
+        sub_dataset.counts.data[0] = 0
+
+    sub_dataset.stack(sub_dataset.copy())
+
+    assert_allclose(sub_dataset.counts.data.sum(), 96)
+    assert_allclose(dataset.counts.data.sum(), 96)
+    assert not np.shares_memory(dataset.counts.data, sub_dataset.counts.data)
+    assert not np.shares_memory(
+        dataset.edisp.edisp_map.data, sub_dataset.edisp.edisp_map.data
+    )
+    assert_allclose(dataset.exposure.meta["livetime"], 1 * u.h)
+    assert_allclose(dataset.gti.time_sum, 1 * u.h)
+
+
 def test_plot_residual_onoff():
     axis = MapAxis.from_energy_bounds(1, 10, 2, unit="TeV")
     geom = WcsGeom.create(npix=(10, 10), binsz=0.05, axes=[axis])
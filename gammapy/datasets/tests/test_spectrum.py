@@ -1006,6 +1006,22 @@ class TestSpectrumDatasetOnOffStack:
         assert_allclose(obs1.gti.met_start.value, [1.0, 5.0, 14.0])
         assert_allclose(obs1.gti.met_stop.value, [4.0, 8.0, 15.0])
 
+    def test_stack_sliced(self):
+        obs1, obs2 = make_observation_list()
+        slices = {"energy": slice(0, 2)}
+
+        sliced = obs1.slice_by_idx(slices=slices)
+        sliced.stack(obs2.slice_by_idx(slices=slices))
+
+        assert_allclose(sliced.counts.data[:, 0, 0], [0, 2])
+        assert_allclose(sliced.counts_off.data[:, 0, 0], [4, 0])
+        assert_allclose(sliced.alpha.data[:, 0, 0], [1.25 / 4.0, 2.5 / 8.0])
+
+        # the parent dataset is not modified
+        assert_allclose(obs1.counts.data[:, 0, 0], [0, 1, 2])
+        assert_allclose(obs1.counts_off.data[:, 0, 0], [1, 0, 1])
+        assert_allclose(obs1.acceptance.data[:, 0, 0], 1)
+
 
 @requires_data("gammapy-data")
 def test_datasets_stack_reduce():
@@ -1056,6 +1072,65 @@ def test_datasets_stack_reduce_no_off():
     assert stacked.counts == 245
 
 
+@pytest.mark.parametrize("nan_to_num", [True, False])
+@pytest.mark.parametrize("cls", [SpectrumDataset, SpectrumDatasetOnOff])
+def test_datasets_stack_reduce_to_masked_stack(cls, nan_to_num):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=4)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "20 TeV", nbin=6, name="energy_true"
+    )
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+    random_state = np.random.RandomState(0)
+
+    datasets = Datasets()
+    for idx in range(3):
+        dataset = cls.create(geom, energy_axis_true=energy_axis_true, name=f"{idx}")
+        dataset.counts.data = random_state.poisson(5, geom.data_shape).astype(float)
+        dataset.exposure.data += 1e6 * (idx + 1)
+        dataset.exposure.meta["livetime"] = 1 * u.h
+        dataset.edisp.exposure_map.data += 1e6 * (idx + 1)
+        dataset.edisp.edisp_map.data *= idx + 1
+        dataset.mask_safe.data[idx:] = True
+        dataset.gti = GTI.create([idx] * u.h, [idx + 1] * u.h)
+        dataset.meta_table = Table({"OBS_ID": [idx]})
+
+        if cls is SpectrumDatasetOnOff:
+            dataset.counts_off.data += 10 * (idx + 1)
+            dataset.acceptance.data += 1
+            dataset.acceptance_off.data += 2 + idx
+        else:
+            dataset.background.data += 1 + idx
+
+        datasets.append(dataset)
+
+    # non-finite values in the data and the IRFs
+    datasets[1].counts.data[-1] = np.nan
+    datasets[1].edisp.edisp_map.data[2] = np.nan
+
+    expected = datasets[0].to_masked(name="expected", nan_to_num=nan_to_num)
+    for dataset in datasets[1:]:
+        expected.stack(dataset, nan_to_num=nan_to_num)
+
+    stacked = datasets.stack_reduce(name="stacked", nan_to_num=nan_to_num)
+
+    assert type(stacked) is cls
+    assert_allclose(stacked.counts.data, expected.counts.data)
+    assert_allclose(stacked.background.data, expected.background.data)
+    assert_allclose(stacked.exposure.data, expected.exposure.data)
+    assert_allclose(stacked.edisp.edisp_map.data, expected.edisp.edisp_map.data)
+    assert_allclose(stacked.edisp.exposure_map.data, expected.edisp.exposure_map.data)
+    assert_equal(stacked.mask_safe.data, expected.mask_safe.data)
+    assert_allclose(stacked.exposure.meta["livetime"], 3 * u.h)
+    assert_allclose(stacked.gti.time_sum, expected.gti.time_sum)
+    assert_equal(stacked.meta_table["OBS_ID"], expected.meta_table["OBS_ID"])
+
+    if cls is SpectrumDatasetOnOff:
+        assert_allclose(stacked.counts_off.data, expected.counts_off.data)
+        assert_allclose(stacked.acceptance.data, expected.acceptance.data)
+        assert_allclose(stacked.acceptance_off.data, expected.acceptance_off.data)
+        assert_allclose(stacked.alpha.data, expected.alpha.data)
+
+
 @requires_data("gammapy-data")
 def test_stack_livetime():
     dataset_ref = SpectrumDatasetOnOff.read(
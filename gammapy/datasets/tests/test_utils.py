@@ -4,6 +4,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
 from gammapy.datasets import MapDataset
+from gammapy.datasets import utils
 from gammapy.datasets.utils import apply_edisp, split_dataset, create_global_dataset
 from gammapy.irf import EDispKernel
 from gammapy.maps import Map, MapAxis
@@ -46,6 +47,34 @@ def test_apply_edisp(region_map_true):
     assert_allclose(e_reco[[0, -1]].value, [1, 10])
 
 
+@pytest.mark.parametrize("max_density", [1, 0])
+def test_apply_edisp_sparse(monkeypatch, max_density):
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=30, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=5)
+
+    edisp = EDispKernel.from_gauss(
+        energy_axis_true=energy_axis_true, energy_axis=energy_axis, sigma=0.1, bias=0
+    )
+
+    # the Gaussian kernel has rounding noise far from the diagonal
+    assert (edisp.pdf_matrix > 0).sum() == 41
+    assert edisp.get_pdf_sparse().nnz == 35
+
+    monkeypatch.setattr(utils, "EDISP_SPARSE_MAX_DENSITY", max_density)
+
+    m = Map.create(npix=(4, 3), axes=[energy_axis_true], unit="1/TeV")
+    m.data = np.random.default_rng(0).uniform(size=m.data.shape)
+
+    result = apply_edisp(m, edisp)
+
+    desired = np.einsum("ijk,il->ljk", m.data, edisp.pdf_matrix)
+    assert result.data.shape == (5, 3, 4)
+    assert result.unit == "1/TeV"
+    assert_allclose(result.data, desired)
+
+
 @requires_data()
 def test_dataset_split():
     template_diffuse = TemplateSpatialModel.read(
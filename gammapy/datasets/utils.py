@@ -14,6 +14,10 @@ __all__ = [
     "create_map_dataset_from_dl4",
 ]
 
+# maximum fraction of non-zero entries of the migration matrix, for which
+# `apply_edisp` uses a sparse matrix product
+EDISP_SPARSE_MAX_DENSITY = 0.2
+
 
 def apply_edisp(input_map, edisp):
     """Apply energy dispersion to map. Requires "energy_true" axis.
@@ -61,12 +65,19 @@ def apply_edisp(input_map, edisp):
         dtype : float64
     <BLANKLINE>
     """
-    # TODO: either use sparse matrix multiplication or something like edisp.is_diagonal
     if edisp is not None:
         loc = input_map.geom.axes.index("energy_true")
-        data = np.rollaxis(input_map.data, loc, len(input_map.data.shape))
-        data = np.matmul(data, edisp.pdf_matrix)
-        data = np.rollaxis(data, -1, loc)
+        pdf_matrix = edisp.get_pdf_sparse()
+
+        # the sparse product is single threaded, it is only faster than the
+        # dense product for a narrow band of non-zero entries
+        if pdf_matrix.nnz > EDISP_SPARSE_MAX_DENSITY * np.prod(pdf_matrix.shape):
+            pdf_matrix = edisp.pdf_matrix
+
+        data = np.moveaxis(input_map.data, loc, 0)
+        shape = data.shape[1:]
+        data = pdf_matrix.T @ data.reshape((len(data), -1))
+        data = np.moveaxis(data.reshape((-1,) + shape), 0, loc)
         energy_axis = edisp.axes["energy"].copy(name="energy")
     else:
         data = input_map.data
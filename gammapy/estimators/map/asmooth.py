@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Implementation of adaptive smoothing algorithms."""
 
+from itertools import repeat
 import numpy as np
 from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
@@ -8,8 +9,8 @@ from gammapy.datasets import MapDatasetOnOff
 from gammapy.maps import Map, Maps, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import CashCountsStatistic
-from gammapy.utils.array import scale_cube
-from gammapy.utils.pbar import progress_bar
+import gammapy.utils.parallel as parallel
+from gammapy.utils.array import fftconvolve_multi
 from ..core import Estimator
 from ..utils import estimate_exposure_reco_energy
 from gammapy.utils.deprecation import deprecated_renamed_argument
@@ -22,7 +23,7 @@ def _sqrt_ts_asmooth(counts, background):
     return (counts - background) / np.sqrt(counts + background)
 
 
-class ASmoothMapEstimator(Estimator):
+class ASmoothMapEstimator(Estimator, parallel.ParallelMixin):
     """Adaptively smooth counts image.
 
     Achieves a roughly constant sqrt(TS) of features across the whole image.
@@ -49,6 +50,18 @@ class ASmoothMapEstimator(Estimator):
         but rather the closest values to the energy axis edges of the parent dataset.
         Default is None: apply the estimator in each energy bin of the parent dataset.
         For further explanation see :ref:`estimators`.
+    dtype : {`~numpy.float64`, `~numpy.float32`}
+        Floating point precision of the FFT convolutions. Single precision is
+        about twice as fast and uses half the memory. Default is `~numpy.float64`.
+    n_jobs : int
+        Number of processes used in parallel for the computation. Energy bins
+        are distributed over the processes, a single energy bin is processed
+        using ``n_jobs`` threads for the FFTs. Default is one, unless
+        `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified. The number of jobs
+        is limited to the number of physical CPUs.
+    parallel_backend : {"multiprocessing", "ray"}
+        Which backend to use for multiprocessing.
+        Default is `~gammapy.utils.parallel.BACKEND_DEFAULT`.
 
     Examples
     --------
@@ -78,6 +91,9 @@ class ASmoothMapEstimator(Estimator):
         method="lima",
         threshold=5,
         energy_edges=None,
+        dtype=np.float64,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         if spectral_model is None:
             spectral_model = PowerLawSpectralModel(index=2)
@@ -92,6 +108,9 @@ class ASmoothMapEstimator(Estimator):
         self.threshold = threshold
         self.method = method
         self.energy_edges = energy_edges
+        self.dtype = dtype
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
     def selection_all(self):
         """Which quantities are computed."""
@@ -183,11 +202,9 @@ class ASmoothMapEstimator(Estimator):
         """
         energy_axis = self._get_energy_axis(dataset)
 
-        results = []
+        datasets = []
 
-        for energy_min, energy_max in progress_bar(
-            energy_axis.iter_by_edges, desc="Energy bins"
-        ):
+        for energy_min, energy_max in energy_axis.iter_by_edges:
             dataset_sliced = dataset.slice_by_energy(
                 energy_min=energy_min, energy_max=energy_max, name=dataset.name
             )
@@ -197,8 +214,21 @@ class ASmoothMapEstimator(Estimator):
                     energy_max=energy_max,
                 )
                 dataset_sliced.models = models_sliced
-            result = self.estimate_maps(dataset_sliced)
-            results.append(result)
+            datasets.append(dataset_sliced)
+
+        if len(datasets) == 1:
+            workers = self.n_jobs
+        else:
+            self._update_child_jobs()
+            workers = self._get_n_child_jobs
+
+        results = parallel.run_multiprocessing(
+            self._estimate_maps,
+            zip(datasets, repeat(workers)),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="Energy bins",
+        )
 
         maps = Maps()
 
@@ -227,6 +257,9 @@ class ASmoothMapEstimator(Estimator):
                 * 'scales'
                 * 'sqrt_ts'.
         """
+        return self._estimate_maps(dataset, workers=self.n_jobs)
+
+    def _estimate_maps(self, dataset, workers=None):
         dataset_image = dataset.to_image(name=dataset.name)
         dataset_image.models = dataset.models
 
@@ -245,17 +278,13 @@ class ASmoothMapEstimator(Estimator):
         pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
         kernels = self.get_kernels(pixel_scale)
 
-        cubes = {}
-        cubes["counts"] = scale_cube(counts, kernels)
-        cubes["background"] = scale_cube(background, kernels)
+        images = {"counts": counts, "background": background}
 
         if exposure is not None:
             flux = (dataset_image.counts - background) / exposure
-            cubes["flux"] = scale_cube(flux.data[0], kernels)
-
-        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
+            images["flux"] = flux.data[0]
 
-        smoothed = self._reduce_cubes(cubes, kernels)
+        smoothed = self._smooth_images(images, kernels, workers=workers)
 
         result = {}
 
@@ -279,41 +308,61 @@ class ASmoothMapEstimator(Estimator):
 
         return result
 
-    def _reduce_cubes(self, cubes, kernels):
-        """
-        Combine scale cube to image.
+    def _smooth_images(self, images, kernels, workers=None):
+        """Combine images convolved with increasing scales to adaptively smoothed images.
+
+        The convolutions are computed scale by scale and stop as soon as all
+        pixels reached the significance threshold.
 
         Parameters
         ----------
-        cubes : dict
-            Data cubes.
+        images : dict of `~numpy.ndarray`
+            Images to smooth, "counts" and "background" are required.
+        kernels : list of `~astropy.convolution.Kernel`
+            Smoothing kernels, in the order of ``scales``.
+        workers : int, optional
+            Number of threads used for the FFTs. Default is None.
+
+        Returns
+        -------
+        smoothed : dict of `~numpy.ndarray`
+            Smoothed images, pixels below threshold at all scales are NaN.
         """
-        shape = cubes["counts"].shape[:2]
+        shape = images["counts"].shape
         smoothed = {}
 
         # Init smoothed data arrays
         for key in ["counts", "background", "scale", "sqrt_ts"]:
             smoothed[key] = np.tile(np.nan, shape)
 
-        if "flux" in cubes:
+        if "flux" in images:
             smoothed["flux"] = np.tile(np.nan, shape)
 
-        for idx, scale in enumerate(self.scales):
-            # slice out 2D image at index idx out of cube
-            slice_ = np.s_[:, :, idx]
+        names = list(images)
+        convolved = fftconvolve_multi(
+            list(images.values()), kernels, dtype=self.dtype, workers=workers
+        )
+
+        for scale, kernel, data in zip(self.scales, kernels, convolved):
+            cubes = dict(zip(names, data))
+
+            remaining = np.isnan(smoothed["counts"])
+            cubes_remaining = {key: cubes[key][remaining] for key in names}
+            sqrt_ts = self._sqrt_ts_cube(cubes_remaining, method=self.method)
 
-            mask = np.isnan(smoothed["counts"])
-            mask = (cubes["sqrt_ts"][slice_] > self.threshold) & mask
+            selected = sqrt_ts > self.threshold
+            mask = np.zeros(shape, dtype=bool)
+            mask[remaining] = selected
 
             smoothed["scale"][mask] = scale
-            smoothed["sqrt_ts"][mask] = cubes["sqrt_ts"][slice_][mask]
+            smoothed["sqrt_ts"][mask] = sqrt_ts[selected]
 
             # renormalize smoothed data arrays
-            norm = kernels[idx].array.sum()
-            for key in ["counts", "background"]:
-                smoothed[key][mask] = cubes[key][slice_][mask] / norm
+            norm = kernel.array.sum()
+            for key in names:
+                smoothed[key][mask] = cubes_remaining[key][selected] / norm
 
-            if "flux" in cubes:
-                smoothed["flux"][mask] = cubes["flux"][slice_][mask] / norm
+            if not np.isnan(smoothed["counts"]).any():
+                break
 
         return smoothed
@@ -1,8 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
-from astropy.convolution import Tophat2DKernel
+from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
 from gammapy.estimators import ASmoothMapEstimator
 from gammapy.maps import Map, MapAxis, WcsNDMap
@@ -123,3 +124,46 @@ def test_asmooth_map_dataset_on_off():
     assert_allclose(smoothed["counts"].data[0, 25, 25], 2)
     assert_allclose(smoothed["background"].data[0, 25, 25], 1)
     assert_allclose(smoothed["sqrt_ts"].data[0, 25, 25], 4.39, rtol=1e-2)
+
+
+def test_asmooth_fft_precision_and_early_stop():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    counts = WcsNDMap.create(npix=(60, 50), binsz=0.02, unit="", axes=[axis])
+    counts.data = np.random.default_rng(0).poisson(2, counts.data.shape)
+    counts.data[:, 25:35, 20:30] += 10
+
+    background = counts.copy(data=np.full(counts.data.shape, 2.0))
+    dataset = MapDataset(counts=counts, background=background)
+
+    kernel = Gaussian2DKernel
+    scales = ASmoothMapEstimator.get_scales(5, kernel=kernel) * 0.2 * u.deg
+
+    energy_edges = axis.edges
+
+    asmooth = ASmoothMapEstimator(
+        scales=scales, kernel=kernel, threshold=3, energy_edges=energy_edges
+    )
+    smoothed = asmooth.run(dataset)
+
+    asmooth_32 = ASmoothMapEstimator(
+        scales=scales,
+        kernel=kernel,
+        threshold=3,
+        energy_edges=energy_edges,
+        dtype=np.float32,
+    )
+    smoothed_32 = asmooth_32.run(dataset)
+
+    for name in ["counts", "background", "sqrt_ts", "scale"]:
+        assert_allclose(smoothed_32[name].data, smoothed[name].data, rtol=1e-4)
+
+    # the source region reaches the threshold at the smallest scale
+    assert_allclose(smoothed["scale"].data[:, 30, 25], scales[0].value)
+    assert_allclose(
+        smoothed["counts"].data[:, 30, 25], [11.842728, 11.899243], rtol=1e-5
+    )
+
+    # with a low threshold, the larger scales are never used
+    asmooth = ASmoothMapEstimator(scales=scales, kernel=kernel, threshold=-100)
+    smoothed = asmooth.run(dataset)
+    assert_allclose(smoothed["scale"].data, scales[0].value)
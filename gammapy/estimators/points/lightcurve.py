@@ -130,13 +130,13 @@ class LightCurveEstimator(FluxPointsEstimator):
         valid_intervals = []
         parallel_datasets = []
         dataset_names = datasets.names
-        for t_min, t_max in progress_bar(
-            gti.time_intervals, desc="Time intervals selection"
-        ):
-            datasets_to_fit = datasets.select_time(
-                time_min=t_min, time_max=t_max, atol=self.atol
-            )
+        groups = datasets.group_by_time(
+            time_min=gti.time_start, time_max=gti.time_stop, atol=self.atol
+        )
 
+        for (t_min, t_max), datasets_to_fit in progress_bar(
+            zip(gti.time_intervals, groups), desc="Time intervals selection"
+        ):
             if len(datasets_to_fit) == 0:
                 log.info(
                     f"No Dataset for the time interval {t_min} to {t_max}. Skipping interval."
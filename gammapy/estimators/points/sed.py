@@ -138,17 +138,22 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             "sed_type_init": "likelihood",
         }
 
-        rows = parallel.run_multiprocessing(
-            self.estimate_flux_point,
-            zip(
-                repeat(datasets),
-                self.energy_edges[:-1],
-                self.energy_edges[1:],
-            ),
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=self.n_jobs),
-            task_name="Energy bins",
-        )
+        energy_groups = list(zip(self.energy_edges[:-1], self.energy_edges[1:]))
+
+        if self.n_jobs > 1 and not isinstance(datasets, DatasetsActor):
+            rows = self._run_sliced(datasets, energy_groups)
+        else:
+            rows = parallel.run_multiprocessing(
+                self.estimate_flux_point,
+                zip(
+                    repeat(datasets),
+                    self.energy_edges[:-1],
+                    self.energy_edges[1:],
+                ),
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=self.n_jobs),
+                task_name="Energy bins",
+            )
 
         table = Table(rows, meta=meta)
         model = _get_reference_model(datasets.models[self.source], self.energy_edges)
@@ -159,6 +164,66 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             format="gadf-sed",
         )
 
+    def _run_sliced(self, datasets, energy_groups):
+        """Estimate flux points in parallel, slicing the datasets in the parent process.
+
+        Each worker only receives the datasets sliced to its energy group, instead
+        of the full datasets.
+        """
+        datasets_sliced = [
+            self._slice_datasets(datasets, energy_min, energy_max)
+            for energy_min, energy_max in energy_groups
+        ]
+
+        results = parallel.run_multiprocessing(
+            self._estimate_flux_point_sliced,
+            [(_,) for _ in datasets_sliced if len(_) > 0],
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="Energy bins",
+        )
+        results = iter(results)
+
+        rows = []
+
+        for (energy_min, energy_max), sliced in zip(energy_groups, datasets_sliced):
+            if len(sliced) > 0:
+                rows.append(next(results))
+            else:
+                rows.append(self._empty_result(datasets, energy_min, energy_max))
+
+        return rows
+
+    def _slice_datasets(self, datasets, energy_min, energy_max):
+        """Slice datasets and models to a single energy group."""
+        datasets_sliced = datasets.slice_by_energy(
+            energy_min=energy_min, energy_max=energy_max
+        )
+        if self.sum_over_energy_groups:
+            datasets_sliced = datasets_sliced.__class__(
+                [_.to_image(name=_.name) for _ in datasets_sliced]
+            )
+
+        if len(datasets_sliced) > 0 and datasets.models is not None:
+            models_sliced = datasets.models._slice_by_energy(
+                energy_min=energy_min,
+                energy_max=energy_max,
+                sum_over_energy_groups=self.sum_over_energy_groups,
+            )
+            datasets_sliced.models = models_sliced
+
+        return datasets_sliced
+
+    def _estimate_flux_point_sliced(self, datasets_sliced):
+        """Estimate flux point for datasets already sliced to an energy group."""
+        return super().run(datasets=datasets_sliced)
+
+    def _empty_result(self, datasets, energy_min, energy_max):
+        """Result for an energy group without contributing datasets."""
+        log.warning(f"No dataset contribute in range {energy_min}-{energy_max}")
+        model = _get_reference_model(datasets.models[self.source], self.energy_edges)
+        return self._nan_result(datasets, model, energy_min, energy_max)
+
     def estimate_flux_point(self, datasets, energy_min, energy_max):
         """Estimate flux point for a single energy group.
 
@@ -174,30 +239,14 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
         result : dict
             Dictionary with results for the flux point.
         """
-        datasets_sliced = datasets.slice_by_energy(
-            energy_min=energy_min, energy_max=energy_max
+        datasets_sliced = self._slice_datasets(
+            datasets, energy_min=energy_min, energy_max=energy_max
         )
-        if self.sum_over_energy_groups:
-            datasets_sliced = datasets_sliced.__class__(
-                [_.to_image(name=_.name) for _ in datasets_sliced]
-            )
 
         if len(datasets_sliced) > 0:
-            if datasets.models is not None:
-                models_sliced = datasets.models._slice_by_energy(
-                    energy_min=energy_min,
-                    energy_max=energy_max,
-                    sum_over_energy_groups=self.sum_over_energy_groups,
-                )
-                datasets_sliced.models = models_sliced
-
-            return super().run(datasets=datasets_sliced)
+            return self._estimate_flux_point_sliced(datasets_sliced)
         else:
-            log.warning(f"No dataset contribute in range {energy_min}-{energy_max}")
-            model = _get_reference_model(
-                datasets.models[self.source], self.energy_edges
-            )
-            return self._nan_result(datasets, model, energy_min, energy_max)
+            return self._empty_result(datasets, energy_min, energy_max)
 
     def _nan_result(self, datasets, model, energy_min, energy_max):
         """NaN result."""
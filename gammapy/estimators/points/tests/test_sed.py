@@ -654,6 +654,22 @@ def test_flux_points_parallel_multiprocessing(fpe_pwl):
     )
 
 
+def test_flux_points_parallel_multiprocessing_small_edges():
+    pl = PowerLawSpectralModel(amplitude="1e-11 cm-2s-1TeV-1")
+
+    datasets, fpe = create_fpe(pl)
+
+    fpe.energy_edges = datasets[0].counts.geom.axes["energy"].upsample(3).edges[1:4]
+    fpe.selection_optional = []
+    fpe.n_jobs = 2
+
+    fp = fpe.run(datasets)
+
+    assert_allclose(fp.ts.data[0, 0, 0], 2156.96959291)
+    assert np.isnan(fp.ts.data[1, 0, 0])
+    assert np.isnan(fp.npred.data[1, 0, 0])
+
+
 def test_global_n_jobs_default_handling():
     fpe = FluxPointsEstimator(energy_edges=[1, 3, 10] * u.TeV)
 
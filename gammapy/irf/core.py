@@ -2,10 +2,13 @@
 import abc
 import html
 import logging
+import zlib
+from collections import OrderedDict
 from copy import deepcopy
 from enum import Enum
 import numpy as np
 from astropy import units as u
+from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.table import Table
 from astropy.utils import lazyproperty
@@ -21,6 +24,9 @@ from .io import IRF_DL3_HDU_SPECIFICATION, IRF_MAP_HDU_SPECIFICATION, gadf_is_po
 
 log = logging.getLogger(__name__)
 
+# maximum number of cached kernels per IRF map
+IRF_KERNEL_CACHE_SIZE = 64
+
 
 class FoVAlignment(str, Enum):
     """
@@ -668,6 +674,90 @@ class IRFMap:
     def has_single_spatial_bin(self):
         return self._irf_map.geom.to_image().data_shape == (1, 1)
 
+    @property
+    def _kernel_cache(self):
+        """Cache of computed kernels, reset when the IRF map data is replaced."""
+        data = self._irf_map.data
+
+        if self.__dict__.get("_kernel_cache_data") is not data:
+            self._kernel_cache_data = data
+            self._kernels = OrderedDict()
+
+        return self._kernels
+
+    def _get_kernel_cache_key(self, position):
+        """Index of the IRF map pixel containing the position, used as cache key.
+
+        Returns None if the position is not a single sky coordinate inside the map.
+        """
+        geom = self._irf_map.geom
+
+        if isinstance(geom, RegionGeom) or not isinstance(position, SkyCoord):
+            return None
+
+        if not position.isscalar:
+            return None
+
+        idx = geom.to_image().coord_to_idx(position)
+        key = tuple(int(_) for _ in np.ravel(idx))
+
+        if min(key) < 0:
+            return None
+
+        return key
+
+    def _get_cached_kernel(self, key, compute, **kwargs):
+        """Get the kernel from the cache or compute and cache it.
+
+        Cached kernels are read-only and shared between calls. They are
+        invalidated if the IRF map data of the pixel changes, including in-place
+        modifications of the data. At most ``IRF_KERNEL_CACHE_SIZE`` kernels are
+        cached, the least recently used are evicted.
+
+        Parameters
+        ----------
+        key : tuple or None
+            Cache key, the IRF map pixel index as returned by
+            `_get_kernel_cache_key`. The kernel is not cached if None.
+        compute : callable
+            Function computing the kernel, taking no argument.
+        **kwargs : dict
+            Additional arguments identifying the kernel, compared using ``==``.
+        """
+        if key is None:
+            return compute()
+
+        # the pixel index is in (lon, lat) order, the data in (..., lat, lon)
+        pixel_data = self._irf_map.data[(Ellipsis,) + key[::-1]]
+        checksum = zlib.crc32(np.ascontiguousarray(pixel_data))
+
+        cache = self._kernel_cache
+        entries = cache.setdefault(key, [])
+        cache.move_to_end(key)
+
+        for idx, (entry_kwargs, entry_checksum, kernel) in enumerate(entries):
+            if entry_kwargs.keys() == kwargs.keys() and all(
+                entry_kwargs[name] == value for name, value in kwargs.items()
+            ):
+                if entry_checksum == checksum:
+                    return kernel
+
+                del entries[idx]
+                break
+
+        kernel = compute()
+        kernel.data.flags.writeable = False
+        entries.append((kwargs, checksum, kernel))
+
+        # evict the least recently used pixels first
+        while sum(len(value) for value in cache.values()) > IRF_KERNEL_CACHE_SIZE:
+            oldest = next(iter(cache.values()))
+            del oldest[0]
+            if not oldest:
+                cache.popitem(last=False)
+
+        return kernel
+
     # TODO: add mask safe to IRFMap as a regular attribute and don't derive it from the data
     @property
     def mask_safe_image(self):
@@ -731,6 +821,8 @@ class IRFMap:
         exposure_hdu=None,
         exposure_hdu_bands=None,
         format="gadf",
+        slices=None,
+        cutout=None,
     ):
         """Create from `~astropy.io.fits.HDUList`.
 
@@ -752,6 +844,13 @@ class IRFMap:
             Default is None.
         format : {"gadf", "gtpsf"}, optional
             File format. Default is "gadf".
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs,
+            see `IRFMap.slice_by_idx`. Only the selected part of the data
+            is read. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to the ``cutout`` method of the maps.
+            Only the pixels within the cutout are read. Default is None.
 
         Returns
         -------
@@ -764,7 +863,12 @@ class IRFMap:
                 hdu = IRF_MAP_HDU_SPECIFICATION[cls.tag]
 
             irf_map = Map.from_hdulist(
-                hdulist, hdu=hdu, hdu_bands=hdu_bands, format=format
+                hdulist,
+                hdu=hdu,
+                hdu_bands=hdu_bands,
+                format=format,
+                slices=slices,
+                cutout=cutout,
             )
 
             if exposure_hdu is None:
@@ -776,6 +880,8 @@ class IRFMap:
                     hdu=exposure_hdu,
                     hdu_bands=exposure_hdu_bands,
                     format=format,
+                    slices=slices if slices and "energy_true" in slices else None,
+                    cutout=cutout,
                 )
             else:
                 exposure_map = None
@@ -923,6 +1029,7 @@ class IRFMap:
         else:
             parent_slices = slice(None)
 
+        self._irf_map._ensure_writeable()
         self._irf_map.data[parent_slices] *= self.exposure_map.data[parent_slices]
         self._irf_map.stack(
             other._irf_map * other.exposure_map.data,
@@ -1045,6 +1152,8 @@ class IRFMap:
 
         if "energy_true" in slices and self.exposure_map:
             exposure_map = self.exposure_map.slice_by_idx(slices=slices)
+        elif self.exposure_map:
+            exposure_map = self.exposure_map.slice_by_idx(slices={})
         else:
             exposure_map = self.exposure_map
 
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
 import warnings
+import scipy.sparse
 from astropy.io import fits
 from astropy.table import Table
 from astropy.units import Quantity
@@ -71,6 +72,28 @@ class EDispKernel(IRF):
         """
         return self.data
 
+    def get_pdf_sparse(self, pdf_threshold=1e-10):
+        """PDF matrix as sparse matrix, without the negligible entries.
+
+        Migration matrices are usually banded: each reconstructed energy bin
+        only receives contributions from a narrow range of true energy bins.
+        Numerical noise far from the diagonal, e.g. of order 1e-14 for
+        `EDispKernel.from_gauss`, is dropped with the threshold.
+
+        Parameters
+        ----------
+        pdf_threshold : float, optional
+            Migration probabilities smaller or equal to the threshold are
+            considered as zero. Default is 1e-10.
+
+        Returns
+        -------
+        pdf_matrix : `~scipy.sparse.csc_matrix`
+            Sparse PDF matrix, with the true energy axis first.
+        """
+        pdf_matrix = np.where(self.pdf_matrix > pdf_threshold, self.pdf_matrix, 0)
+        return scipy.sparse.csc_matrix(pdf_matrix)
+
     def pdf_in_safe_range(self, lo_threshold, hi_threshold):
         """PDF matrix with bins outside threshold set to 0.
 
@@ -109,10 +109,24 @@ class EDispMap(IRFMap):
         -------
         edisp : `~gammapy.irf.EnergyDispersion`
             The energy dispersion (i.e. rmf object).
+
+        Notes
+        -----
+        The kernel is taken from the nearest IRF map pixel. Kernels are cached per
+        pixel and reconstructed energy axis, the returned kernel is shared and
+        read-only. A cached kernel is recomputed when the data of its pixel
+        changes.
         """
-        edisp_map = self.to_region_nd_map(region=position)
-        edisp_kernel_map = edisp_map.to_edisp_kernel_map(energy_axis=energy_axis)
-        return edisp_kernel_map.get_edisp_kernel()
+        if position is None:
+            position = self.edisp_map.geom.center_skydir
+
+        def compute():
+            edisp_map = self.to_region_nd_map(region=position)
+            edisp_kernel_map = edisp_map.to_edisp_kernel_map(energy_axis=energy_axis)
+            return edisp_kernel_map.get_edisp_kernel()
+
+        key = self._get_kernel_cache_key(position)
+        return self._get_cached_kernel(key, compute, energy_axis=energy_axis)
 
     def to_edisp_kernel_map(self, energy_axis):
         """Convert to map with energy dispersion kernels.
@@ -367,17 +381,39 @@ class EDispKernelMap(IRFMap):
         -------
         edisp : `~gammapy.irf.EnergyDispersion`
             The energy dispersion (i.e. rmf object).
+
+        Notes
+        -----
+        The kernel is taken from the nearest IRF map pixel. Kernels are cached per
+        pixel, the returned kernel is shared and read-only. A cached kernel is
+        recomputed when the data of its pixel changes.
         """
         if energy_axis:
             assert energy_axis == self.edisp_map.geom.axes["energy"]
 
         if isinstance(self.edisp_map.geom, RegionGeom):
+            return self._get_cached_kernel((), self._get_edisp_kernel)
+
+        if position is None:
+            position = self.edisp_map.geom.center_skydir
+
+        key = self._get_kernel_cache_key(position)
+
+        if key is not None:
+            kernel = self._get_cached_kernel(
+                key, lambda: self._get_edisp_kernel(position=position)
+            )
+            if np.any(kernel.data > 0):
+                return kernel
+
+        position = self._get_nearest_valid_position(position)
+        return self._get_edisp_kernel(position=position)
+
+    def _get_edisp_kernel(self, position=None):
+        """Get energy dispersion kernel without caching."""
+        if position is None:
             kernel_map = self.edisp_map
         else:
-            if position is None:
-                position = self.edisp_map.geom.center_skydir
-            position = self._get_nearest_valid_position(position)
-
             kernel_map = self.edisp_map.to_region_nd_map(region=position)
 
         return EDispKernel(
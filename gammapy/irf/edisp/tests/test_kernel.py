@@ -52,6 +52,27 @@ class TestEDispKernel:
         assert_equal(edisp.pdf_matrix[2][0], 0)
         assert edisp.pdf_matrix.sum() == 4
 
+    def test_get_pdf_sparse(self):
+        energy_axis_true = MapAxis.from_energy_edges(
+            [0.5, 1, 2, 4, 6] * u.TeV, name="energy_true"
+        )
+        energy_axis = MapAxis.from_energy_edges([2, 4, 6] * u.TeV)
+
+        edisp = EDispKernel.from_diagonal_response(energy_axis_true, energy_axis)
+        pdf_matrix = edisp.get_pdf_sparse()
+
+        assert pdf_matrix.nnz == 2
+        assert_equal(pdf_matrix.toarray(), edisp.pdf_matrix)
+
+        # the matrix is not cached
+        edisp.data[0, 0] = 0.5
+        assert edisp.get_pdf_sparse().nnz == 3
+
+        pdf_matrix = self.edisp.get_pdf_sparse(pdf_threshold=1e-3)
+        is_above = self.edisp.pdf_matrix > 1e-3
+        assert pdf_matrix.nnz == is_above.sum()
+        assert_allclose(pdf_matrix.sum(), self.edisp.pdf_matrix[is_above].sum())
+
     def test_to_image(self):
         energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3)
         energy_axis_true = MapAxis.from_energy_bounds(
@@ -5,6 +5,7 @@ from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.units import Unit
+from gammapy.irf import core as irf_core
 from gammapy.irf import (
     EDispKernel,
     EDispKernelMap,
@@ -115,6 +116,49 @@ def test_edisp_map_to_energydispersion():
     assert_allclose(edisp.get_resolution(energy_true=1.0 * u.TeV), 0.2, atol=3e-2)
 
 
+def test_edisp_map_get_edisp_kernel_cache():
+    edmap = make_edisp_map_test()
+    energy_axis = MapAxis.from_energy_bounds("0.3 TeV", "3 TeV", nbin=5)
+
+    edisp = edmap.get_edisp_kernel(
+        position=SkyCoord(0, 0, unit="deg"), energy_axis=energy_axis
+    )
+
+    # same pixel and energy axis
+    edisp_same = edmap.get_edisp_kernel(
+        position=SkyCoord(0.2, 0.1, unit="deg"), energy_axis=energy_axis.copy()
+    )
+    assert edisp_same is edisp
+
+    # the shared kernel is read-only
+    with pytest.raises(ValueError):
+        edisp_same.data *= 2
+
+    edisp_other = edmap.get_edisp_kernel(
+        position=SkyCoord(1.2, 0.1, unit="deg"), energy_axis=energy_axis
+    )
+    assert edisp_other is not edisp
+
+    energy_axis_other = MapAxis.from_energy_bounds("0.3 TeV", "3 TeV", nbin=3)
+    edisp_other = edmap.get_edisp_kernel(
+        position=SkyCoord(0, 0, unit="deg"), energy_axis=energy_axis_other
+    )
+    assert edisp_other.data.shape == (4, 3)
+
+    edmap.edisp_map.data = 2 * edmap.edisp_map.data
+    edisp_new = edmap.get_edisp_kernel(
+        position=SkyCoord(0, 0, unit="deg"), energy_axis=energy_axis
+    )
+    assert_allclose(edisp_new.data, 2 * edisp.data)
+
+    # in-place modification of the data
+    edmap.edisp_map.data *= 2
+    edisp_new = edmap.get_edisp_kernel(
+        position=SkyCoord(0, 0, unit="deg"), energy_axis=energy_axis
+    )
+    assert_allclose(edisp_new.data, 4 * edisp.data)
+
+
 def test_edisp_map_from_geom_error():
     energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
     energy_axis_true = MapAxis.from_energy_bounds(
@@ -289,6 +333,54 @@ def test_edispkernel_from_1d():
     assert_allclose(sum_kernel, 1, rtol=1e-5)
 
 
+def test_edisp_kernel_map_get_edisp_kernel_cache(caplog):
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "5 TeV", nbin=31, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=11)
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=1, width=3, axes=[energy_axis, energy_axis_true]
+    )
+
+    edisp_map = EDispKernelMap.from_geom(geom)
+    edisp_map.edisp_map.data[..., 2, 2] = 0
+
+    edisp = edisp_map.get_edisp_kernel(position=SkyCoord(0.1, 0.1, unit="deg"))
+    edisp_same = edisp_map.get_edisp_kernel(position=SkyCoord(-0.2, 0, unit="deg"))
+    assert_allclose(edisp_same.data, edisp.data)
+
+    edisp_map.edisp_map.data[..., 1, 1] *= 0.5
+    edisp_new = edisp_map.get_edisp_kernel(position=SkyCoord(-0.2, 0, unit="deg"))
+    assert_allclose(edisp_new.data, 0.5 * edisp.data)
+
+    # invalid pixel falls back to the nearest valid one
+    position = SkyCoord(-1, 1, unit="deg", frame="icrs")
+    edisp_invalid = edisp_map.get_edisp_kernel(position=position)
+    assert "outside valid IRF map range" in caplog.text
+    assert_allclose(edisp_invalid.data, edisp.data)
+
+
+def test_edisp_map_get_edisp_kernel_cache_size(monkeypatch):
+    monkeypatch.setattr(irf_core, "IRF_KERNEL_CACHE_SIZE", 2)
+
+    edmap = make_edisp_map_test()
+    energy_axes = [
+        MapAxis.from_energy_bounds("0.3 TeV", "3 TeV", nbin=nbin) for nbin in [3, 4]
+    ]
+    positions = [SkyCoord(lon, 0, unit="deg") for lon in [0, 1.2]]
+
+    edisp = edmap.get_edisp_kernel(position=positions[0], energy_axis=energy_axes[0])
+    edmap.get_edisp_kernel(position=positions[0], energy_axis=energy_axes[1])
+    edmap.get_edisp_kernel(position=positions[1], energy_axis=energy_axes[0])
+
+    assert sum(len(entries) for entries in edmap._kernel_cache.values()) == 2
+    edisp_new = edmap.get_edisp_kernel(
+        position=positions[0], energy_axis=energy_axes[0]
+    )
+    assert edisp_new is not edisp
+    assert_allclose(edisp_new.data, edisp.data)
+
+
 def test_edisp_kernel_map_to_image():
     e_reco = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3)
     e_true = MapAxis.from_energy_bounds(
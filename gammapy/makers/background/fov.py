@@ -7,6 +7,7 @@ from gammapy.maps import Map, RegionGeom
 from gammapy.modeling import Fit
 from gammapy.modeling.models import FoVBackgroundModel, Model
 from ..core import Maker
+from ..utils import make_exclusion_mask_cutout
 
 __all__ = ["FoVBackgroundMaker"]
 
@@ -148,7 +149,7 @@ class FoVBackgroundMaker(Maker):
         """
         geom = dataset._geom
         if self.exclusion_mask:
-            mask = self.exclusion_mask.interp_to_geom(geom=geom)
+            mask = make_exclusion_mask_cutout(self.exclusion_mask, geom).copy()
         else:
             mask = Map.from_geom(geom=geom, data=True, dtype=bool)
         return mask
@@ -231,7 +232,7 @@ class FoVBackgroundMaker(Maker):
                 # always scale the background first
                 dataset = self.make_background_scale(dataset)
         else:
-            dataset.mask_safe.data[...] = False
+            dataset.mask_safe = Map.from_geom(dataset.mask_safe.geom, dtype=bool)
 
         dataset.mask_fit = mask_fit
         return dataset
@@ -261,7 +262,7 @@ class FoVBackgroundMaker(Maker):
                     f"FoVBackgroundMaker failed. Fit did not converge for {dataset.name}. "
                     "Setting mask to False."
                 )
-                dataset.mask_safe.data[...] = False
+                dataset.mask_safe = Map.from_geom(dataset.mask_safe.geom, dtype=bool)
 
         return dataset
 
@@ -9,8 +9,9 @@ from astropy.coordinates import Angle
 from regions import CircleSkyRegion, PixCoord, PointSkyRegion
 from gammapy.datasets import SpectrumDatasetOnOff
 from gammapy.maps import RegionGeom, RegionNDMap, WcsGeom, WcsNDMap
+from gammapy.utils.regions import compound_region_to_regions
 from ..core import Maker
-from ..utils import make_counts_off_rad_max
+from ..utils import make_counts_off_rad_max, make_counts_regions
 
 __all__ = [
     "ReflectedRegionsBackgroundMaker",
@@ -76,6 +77,110 @@ def is_rad_max_compatible_region_geom(rad_max, geom, rtol=1e-3):
     return valid
 
 
+class _PolarExclusionLookup:
+    """Excluded pixels sorted by polar angle around a rotation center.
+
+    Rotating a region around the center preserves the distance of its pixels to
+    the center, and shifts their polar angle by the rotation angle. Only the
+    excluded pixels within the annulus covered by the bounding box of the region
+    are therefore kept, sorted by polar angle. For a given rotation angle, the
+    containment is then only tested for the excluded pixels within the angular
+    range of the rotated bounding box, by rotating them back onto the region.
+
+    Parameters
+    ----------
+    region_pix : `~regions.PixelRegion`
+        Region to rotate.
+    center_pixel : `~regions.PixCoord`
+        Rotation center.
+    excluded_pixels : `~regions.PixCoord`
+        Excluded pixels.
+    """
+
+    def __init__(self, region_pix, center_pixel, excluded_pixels):
+        self.region_pix = region_pix
+        self.center_pixel = center_pixel
+
+        bbox = region_pix.bounding_box
+        x_min, x_max = (
+            bbox.ixmin - 0.5 - center_pixel.x,
+            bbox.ixmax - 0.5 - center_pixel.x,
+        )
+        y_min, y_max = (
+            bbox.iymin - 0.5 - center_pixel.y,
+            bbox.iymax - 0.5 - center_pixel.y,
+        )
+
+        x, y = (
+            np.array([x_min, x_max, x_max, x_min]),
+            np.array([y_min, y_min, y_max, y_max]),
+        )
+        r_max = np.max(np.hypot(x, y))
+        r_min = np.hypot(max(x_min, 0, -x_max), max(y_min, 0, -y_max))
+
+        if r_min > 0:
+            phi_center = np.arctan2(y_min + y_max, x_min + x_max)
+            delta = (np.arctan2(y, x) - phi_center + np.pi) % (2 * np.pi) - np.pi
+            self.phi_min = phi_center + delta.min()
+            self.phi_width = delta.max() - delta.min()
+        else:
+            self.phi_min, self.phi_width = 0, 2 * np.pi
+
+        dx = np.atleast_1d(excluded_pixels.x) - center_pixel.x
+        dy = np.atleast_1d(excluded_pixels.y) - center_pixel.y
+        r = np.hypot(dx, dy)
+        selection = (r >= r_min) & (r <= r_max)
+        dx, dy = dx[selection], dy[selection]
+
+        phi = np.arctan2(dy, dx) % (2 * np.pi)
+        idx_sort = np.argsort(phi)
+        self._phi, self._dx, self._dy = phi[idx_sort], dx[idx_sort], dy[idx_sort]
+
+    def _get_candidates(self, angle):
+        """Excluded pixel offsets within the angular range of the rotated region."""
+        if self.phi_width >= 2 * np.pi:
+            return self._dx, self._dy
+
+        # small margin to be robust against rounding at the range boundaries
+        phi_min = (self.phi_min + angle - 1e-9) % (2 * np.pi)
+        phi_max = phi_min + self.phi_width + 2e-9
+
+        idx_min, idx_max = np.searchsorted(self._phi, [phi_min, phi_max])
+        idx = np.arange(idx_min, idx_max)
+
+        if phi_max > 2 * np.pi:
+            idx_wrap = np.searchsorted(self._phi, phi_max - 2 * np.pi)
+            idx = np.append(idx, np.arange(idx_wrap))
+
+        return self._dx[idx], self._dy[idx]
+
+    def is_excluded(self, angle):
+        """Whether the region rotated by a given angle contains excluded pixels.
+
+        Parameters
+        ----------
+        angle : `~astropy.coordinates.Angle`
+            Rotation angle.
+
+        Returns
+        -------
+        excluded : bool
+            True if the rotated region contains excluded pixels.
+        """
+        angle = angle.to_value("rad")
+        dx, dy = self._get_candidates(angle)
+
+        if len(dx) == 0:
+            return False
+
+        cos, sin = np.cos(angle), np.sin(angle)
+        pixels = PixCoord(
+            self.center_pixel.x + cos * dx + sin * dy,
+            self.center_pixel.y - sin * dx + cos * dy,
+        )
+        return bool(np.any(self.region_pix.contains(pixels)))
+
+
 class RegionsFinder(metaclass=ABCMeta):
     """Base class for regions finders.
 
@@ -222,6 +327,9 @@ class WobbleRegionsFinder(RegionsFinder):
         region_pix = self._get_region_pixels(region, reference_geom)
         excluded_pixels = self._get_excluded_pixels(reference_geom, exclusion_mask)
 
+        if not isinstance(region, PointSkyRegion):
+            lookup = _PolarExclusionLookup(region_pix, center_pixel, excluded_pixels)
+
         n_positions = self.n_off_regions + 1
         increment = FULL_CIRCLE / n_positions
 
@@ -240,7 +348,7 @@ class WobbleRegionsFinder(RegionsFinder):
                         excluded_pixels.separation(region_test.center) < 1
                     ).any()
                 else:
-                    excluded = region_test.contains(excluded_pixels).any()
+                    excluded = lookup.is_excluded(angle)
 
             if not excluded:
                 regions.append(region_test)
@@ -409,11 +517,12 @@ class ReflectedRegionsFinder(RegionsFinder):
             center_pix=center_pixel,
         )
 
+        lookup = _PolarExclusionLookup(region_pix, center_pixel, excluded_pixels)
+
         angle = angle_min + self.min_distance_input
         while angle < angle_max:
-            region_test = region_pix.rotate(center_pixel, angle)
-
-            if not np.any(region_test.contains(excluded_pixels)):
+            if not lookup.is_excluded(angle):
+                region_test = region_pix.rotate(center_pixel, angle)
                 region = region_test.to_sky(reference_geom.wcs)
                 regions.append(region)
 
@@ -510,13 +619,35 @@ class ReflectedRegionsBackgroundMaker(Maker):
         counts_off : `~gammapy.maps.RegionNDMap`
             Counts vs estimated energy extracted from the OFF regions.
         """
+        geom_off = self._make_geom_off(dataset, observation)
+
+        if geom_off is None:
+            return None, RegionNDMap.from_geom(geom=dataset.counts.geom, data=0)
+
+        if geom_off.is_all_point_sky_regions:
+            counts_off = make_counts_off_rad_max(
+                geom_off=geom_off,
+                rad_max=observation.rad_max,
+                events=observation.events,
+            )
+        else:
+            counts_off = RegionNDMap.from_geom(geom=geom_off)
+            counts_off.fill_events(observation.events)
+
+        return counts_off, self._make_acceptance_off(geom_off)
+
+    @staticmethod
+    def _make_acceptance_off(geom_off):
+        n_regions = len(compound_region_to_regions(geom_off.region))
+        return RegionNDMap.from_geom(geom=geom_off, data=n_regions)
+
+    def _make_geom_off(self, dataset, observation):
+        """OFF regions geometry, or None if no OFF region is found."""
         geom = dataset.counts.geom
         energy_axis = geom.axes["energy"]
         events = observation.events
         rad_max = observation.rad_max
 
-        is_point_sky_region = geom.is_all_point_sky_regions
-
         if rad_max and not is_rad_max_compatible_region_geom(
             rad_max=rad_max, geom=geom
         ):
@@ -542,28 +673,14 @@ class ReflectedRegionsBackgroundMaker(Maker):
                 "ReflectedRegionsBackgroundMaker failed. No OFF region found "
                 f"outside exclusion mask for dataset '{dataset.name}'."
             )
-            return None, RegionNDMap.from_geom(geom=geom, data=0)
+            return None
 
-        geom_off = RegionGeom.from_regions(
+        return RegionGeom.from_regions(
             regions=regions_off,
             axes=[energy_axis],
             wcs=wcs,
         )
 
-        if is_point_sky_region:
-            counts_off = make_counts_off_rad_max(
-                geom_off=geom_off,
-                rad_max=rad_max,
-                events=events,
-            )
-        else:
-            counts_off = RegionNDMap.from_geom(geom=geom_off)
-            counts_off.fill_events(events)
-
-        acceptance_off = RegionNDMap.from_geom(geom=geom_off, data=len(regions_off))
-
-        return counts_off, acceptance_off
-
     def run(self, dataset, observation):
         """Run reflected regions background maker.
 
@@ -580,6 +697,64 @@ class ReflectedRegionsBackgroundMaker(Maker):
             On-Off dataset.
         """
         counts_off, acceptance_off = self.make_counts_off(dataset, observation)
+        return self._make_dataset_onoff(dataset, counts_off, acceptance_off)
+
+    def run_regions(self, datasets, observation):
+        """Run reflected regions background maker for several ON regions.
+
+        The OFF regions are searched for each ON region, and the events are then
+        assigned to the OFF regions of all datasets with a single spatial lookup,
+        see `~gammapy.makers.utils.make_counts_regions`.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.SpectrumDataset`
+            Spectrum datasets, one per ON region, e.g. made with
+            `~gammapy.makers.SpectrumDatasetMaker.run_regions`.
+        observation : `~gammapy.data.Observation`
+            Data store observation.
+
+        Returns
+        -------
+        datasets_on_off : list of `~gammapy.datasets.SpectrumDatasetOnOff`
+            On-Off datasets.
+        """
+        geoms_off = [self._make_geom_off(dataset, observation) for dataset in datasets]
+
+        idx_regions = [
+            idx
+            for idx, geom_off in enumerate(geoms_off)
+            if geom_off is not None and not geom_off.is_all_point_sky_regions
+        ]
+        counts_regions = make_counts_regions(
+            [geoms_off[idx] for idx in idx_regions], observation.events
+        )
+        counts_regions = dict(zip(idx_regions, counts_regions))
+
+        datasets_onoff = []
+
+        for idx, (dataset, geom_off) in enumerate(zip(datasets, geoms_off)):
+            if geom_off is None:
+                counts_off = None
+                acceptance_off = RegionNDMap.from_geom(geom=dataset.counts.geom, data=0)
+            else:
+                counts_off = counts_regions.get(idx)
+                if counts_off is None:
+                    counts_off = make_counts_off_rad_max(
+                        geom_off=geom_off,
+                        rad_max=observation.rad_max,
+                        events=observation.events,
+                    )
+                acceptance_off = self._make_acceptance_off(geom_off)
+
+            datasets_onoff.append(
+                self._make_dataset_onoff(dataset, counts_off, acceptance_off)
+            )
+
+        return datasets_onoff
+
+    @staticmethod
+    def _make_dataset_onoff(dataset, counts_off, acceptance_off):
         acceptance = RegionNDMap.from_geom(geom=dataset.counts.geom, data=1)
 
         dataset_onoff = SpectrumDatasetOnOff.from_spectrum_dataset(
@@ -591,7 +766,9 @@ class ReflectedRegionsBackgroundMaker(Maker):
         )
 
         if dataset_onoff.counts_off is None:
-            dataset_onoff.mask_safe.data[...] = False
+            dataset_onoff.mask_safe = RegionNDMap.from_geom(
+                geom=dataset_onoff.mask_safe.geom, dtype=bool
+            )
             log.warning(
                 f"ReflectedRegionsBackgroundMaker failed. Setting {dataset_onoff.name} "
                 "mask to False."
@@ -1,16 +1,30 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Ring background estimation."""
 import itertools
+from functools import lru_cache
 import numpy as np
 from astropy.convolution import Ring2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.maps import Map
 from gammapy.utils.array import scale_cube
 from ..core import Maker
+from ..utils import _get_aligned_cutout_slices, make_exclusion_mask_cutout
 
 __all__ = ["AdaptiveRingBackgroundMaker", "RingBackgroundMaker"]
 
 
+@lru_cache(maxsize=128)
+def _get_ring_kernel(r_in, width):
+    """Peak normalised ring kernel, cached by inner radius and width in pixels.
+
+    The returned kernel is shared between calls and must not be modified.
+    """
+    kernel = Ring2DKernel(r_in, width)
+    kernel.normalize("peak")
+    kernel.array.flags.writeable = False
+    return kernel
+
+
 class AdaptiveRingBackgroundMaker(Maker):
     """Adaptive ring background algorithm.
 
@@ -95,13 +109,10 @@ class AdaptiveRingBackgroundMaker(Maker):
         else:
             raise ValueError(f"Invalid method: {self.method!r}")
 
-        kernels = []
-        for r_in, width in itertools.product(r_ins, widths):
-            kernel = Ring2DKernel(r_in, width)
-            kernel.normalize("peak")
-            kernels.append(kernel)
-
-        return kernels
+        return [
+            _get_ring_kernel(r_in, width)
+            for r_in, width in itertools.product(r_ins, widths)
+        ]
 
     @staticmethod
     def _alpha_approx_cube(cubes):
@@ -164,7 +175,7 @@ class AdaptiveRingBackgroundMaker(Maker):
         kernels = self.kernels(counts)
 
         if self.exclusion_mask:
-            exclusion = self.exclusion_mask.interp_to_geom(geom=counts.geom)
+            exclusion = make_exclusion_mask_cutout(self.exclusion_mask, counts.geom)
         else:
             exclusion = Map.from_geom(geom=counts.geom, data=True, dtype=bool)
 
@@ -270,9 +281,7 @@ class RingBackgroundMaker(Maker):
         r_in = self.r_in.to("deg") / scale
         width = self.width.to("deg") / scale
 
-        ring = Ring2DKernel(r_in.value, width.value)
-        ring.normalize("peak")
-        return ring
+        return _get_ring_kernel(r_in.value, width.value)
 
     def make_maps_off(self, dataset):
         """Make off maps.
@@ -290,7 +299,11 @@ class RingBackgroundMaker(Maker):
         counts = dataset.counts
         background = dataset.npred_background()
 
-        if self.exclusion_mask is not None:
+        if self.exclusion_mask is not None and _get_aligned_cutout_slices(
+            self.exclusion_mask.geom, counts.geom
+        ):
+            exclusion = make_exclusion_mask_cutout(self.exclusion_mask, counts.geom)
+        elif self.exclusion_mask is not None:
             # reproject exclusion mask
             coords = counts.geom.get_coord()
             data = self.exclusion_mask.get_by_coord(coords)
@@ -2,9 +2,10 @@
 import logging
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
+from astropy.table import Table
 from regions import (
     CircleSkyRegion,
     EllipseAnnulusSkyRegion,
@@ -12,7 +13,7 @@ from regions import (
     PointSkyRegion,
     RectangleSkyRegion,
 )
-from gammapy.data import DataStore
+from gammapy.data import GTI, DataStore, EventList, FixedPointingInfo, Observation
 from gammapy.datasets import SpectrumDataset
 from gammapy.makers import (
     ReflectedRegionsBackgroundMaker,
@@ -21,6 +22,7 @@ from gammapy.makers import (
     SpectrumDatasetMaker,
     WobbleRegionsFinder,
 )
+from gammapy.makers.background.reflected import _PolarExclusionLookup
 from gammapy.maps import Map, MapAxis, RegionGeom, WcsGeom
 from gammapy.utils.regions import compound_region_to_regions
 from gammapy.utils.testing import assert_quantity_allclose, requires_data
@@ -154,6 +156,29 @@ def test_non_circular_regions(region, nreg):
     assert len(regions) == nreg
 
 
+@pytest.mark.parametrize("region, nreg", other_region_finder_param)
+def test_polar_exclusion_lookup(region, nreg):
+    pointing = SkyCoord(0.0, 0.0, unit="deg")
+    geom = WcsGeom.create(skydir=pointing, binsz=0.02, width=6.0)
+
+    rng = np.random.default_rng(0)
+    excluded = rng.uniform(size=geom.data_shape) < 0.001
+    exclusion_mask = Map.from_geom(geom, data=~excluded)
+
+    finder = ReflectedRegionsFinder()
+    reference_geom = finder._create_reference_geometry(region, pointing)
+    center_pixel = finder._get_center_pixel(pointing, reference_geom)
+    region_pix = finder._get_region_pixels(region, reference_geom)
+    excluded_pixels = finder._get_excluded_pixels(reference_geom, exclusion_mask)
+
+    lookup = _PolarExclusionLookup(region_pix, center_pixel, excluded_pixels)
+
+    for angle in Angle(np.linspace(0, 2 * np.pi, 73), "rad"):
+        region_test = region_pix.rotate(center_pixel, angle)
+        expected = np.any(region_test.contains(excluded_pixels))
+        assert lookup.is_excluded(angle) == expected
+
+
 def test_bad_on_region(exclusion_mask, on_region):
     pointing = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
     finder = ReflectedRegionsFinder(
@@ -336,6 +361,52 @@ def test_wobble_regions_finder_overlapping(caplog):
     ]
 
 
+def test_reflected_bkg_maker_run_regions(exclusion_mask):
+    pointing = SkyCoord(83.63, 22.51, unit="deg")
+
+    random_state = np.random.RandomState(0)
+    table = Table()
+    table["RA"] = random_state.uniform(81.5, 85.5, 20000) * u.deg
+    table["DEC"] = random_state.uniform(20.5, 24.5, 20000) * u.deg
+    table["ENERGY"] = random_state.uniform(1, 10, 20000) * u.TeV
+
+    observation = Observation(
+        obs_id=1,
+        gti=GTI.create([0] * u.s, [1] * u.h, reference_time="2010-01-01"),
+        events=EventList(table),
+        pointing=FixedPointingInfo(fixed_icrs=pointing),
+    )
+
+    energy_axis = MapAxis.from_energy_bounds(1, 10, nbin=3, unit="TeV")
+    positions = SkyCoord(
+        [83.63, 84.2, 83.1, 83.63], [22.01, 22.5, 22.9, 22.51], unit="deg"
+    )
+
+    datasets = []
+    for idx, position in enumerate(positions):
+        geom = RegionGeom.create(
+            CircleSkyRegion(position, 0.1 * u.deg), axes=[energy_axis]
+        )
+        dataset = SpectrumDataset.create(geom, name=f"source-{idx}")
+        datasets.append(dataset)
+
+    maker = ReflectedRegionsBackgroundMaker(exclusion_mask=exclusion_mask)
+    datasets_onoff = maker.run_regions(datasets, observation)
+
+    assert len(datasets_onoff) == 4
+
+    for dataset, dataset_onoff in zip(datasets, datasets_onoff):
+        expected = maker.run(dataset, observation)
+        assert dataset_onoff.name == dataset.name
+
+        assert_allclose(dataset_onoff.counts_off.data, expected.counts_off.data)
+        assert_allclose(dataset_onoff.acceptance_off.data, expected.acceptance_off.data)
+        assert_equal(dataset_onoff.mask_safe.data, expected.mask_safe.data)
+
+    assert datasets_onoff[0].counts_off.data.sum() > 0
+    assert not np.any(datasets_onoff[3].mask_safe.data)
+
+
 @requires_data()
 def test_reflected_bkg_maker_with_wobble_finder(
     on_region, observations, exclusion_mask
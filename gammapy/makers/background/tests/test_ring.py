@@ -11,7 +11,7 @@ from gammapy.makers import (
     RingBackgroundMaker,
     SafeMaskMaker,
 )
-from gammapy.maps import MapAxis, WcsGeom
+from gammapy.maps import Map, MapAxis, WcsGeom
 from gammapy.utils.testing import requires_data
 
 
@@ -147,3 +147,26 @@ def test_adaptive_ring_bkg_maker(pars, geom, observations, exclusion_mask):
     assert_allclose(
         dataset_on_off.exposure.data[0][100][100], pars["exposure"], rtol=1e-5
     )
+
+
+def test_ring_bkg_maker_image_exclusion_mask(geom):
+    image_geom = geom.to_image()
+    exclusion_mask = Map.from_geom(image_geom, data=True, dtype=bool)
+    exclusion_mask.data[200:300, 200:300] = False
+
+    dataset = MapDataset.create(geom).cutout(
+        SkyCoord(83.633, 22.014, unit="deg"), width="4 deg"
+    )
+    dataset.counts.data += 1
+    dataset.background.data += 1
+
+    maker = RingBackgroundMaker(
+        r_in="0.2 deg", width="0.3 deg", exclusion_mask=exclusion_mask
+    )
+    assert maker.kernel(dataset.counts) is maker.kernel(dataset.counts)
+
+    maps_off = maker.make_maps_off(dataset)
+
+    exclusion = exclusion_mask.interp_to_geom(dataset.counts.geom)
+    expected = (dataset.counts * exclusion).convolve(maker.kernel(dataset.counts).array)
+    assert_allclose(maps_off["counts_off"].data, expected.data)
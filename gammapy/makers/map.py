@@ -10,6 +10,8 @@ from gammapy.data import Observation
 from gammapy.maps import Map
 from .core import Maker
 from .utils import (
+    FoVCoordinates,
+    _get_time_slices,
     make_counts_rad_max,
     make_edisp_kernel_map,
     make_edisp_map,
@@ -41,6 +43,11 @@ class MapDatasetMaker(Maker):
         Pad one bin in offset for 2d background map.
         This avoids extrapolation at edges and use the nearest value.
         Default is True.
+    background_time_slices : int, optional
+        Number of time slices of equal duration used to evaluate the background IRF.
+        This takes into account the rotation of the field-of-view with respect to the
+        sky during the observation, e.g. for an alt-az aligned background IRF.
+        Default is None, which evaluates the background at the observation mid time.
 
     Examples
     --------
@@ -109,10 +116,12 @@ class MapDatasetMaker(Maker):
         background_oversampling=None,
         background_interp_missing_data=True,
         background_pad_offset=True,
+        background_time_slices=None,
     ):
         self.background_oversampling = background_oversampling
         self.background_interp_missing_data = background_interp_missing_data
         self.background_pad_offset = background_pad_offset
+        self.background_time_slices = background_time_slices
         if selection is None:
             selection = self.available_selection
 
@@ -148,7 +157,7 @@ class MapDatasetMaker(Maker):
         return counts
 
     @staticmethod
-    def make_exposure(geom, observation, use_region_center=True):
+    def make_exposure(geom, observation, use_region_center=True, fov_coords=None):
         """Make exposure map.
 
         Parameters
@@ -161,6 +170,9 @@ class MapDatasetMaker(Maker):
             For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
             If False, average over the whole region.
             Default is True.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -197,10 +209,11 @@ class MapDatasetMaker(Maker):
             aeff=observation.aeff,
             geom=geom,
             use_region_center=use_region_center,
+            fov_coords=fov_coords,
         )
 
     @staticmethod
-    def make_exposure_irf(geom, observation, use_region_center=True):
+    def make_exposure_irf(geom, observation, use_region_center=True, fov_coords=None):
         """Make exposure map with IRF geometry.
 
         Parameters
@@ -213,6 +226,9 @@ class MapDatasetMaker(Maker):
             For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
             If False, average over the whole region.
             Default is True.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -225,9 +241,10 @@ class MapDatasetMaker(Maker):
             aeff=observation.aeff,
             geom=geom,
             use_region_center=use_region_center,
+            fov_coords=fov_coords,
         )
 
-    def make_background(self, geom, observation):
+    def make_background(self, geom, observation, fov_coords=None):
         """Make background map.
 
         Parameters
@@ -236,6 +253,9 @@ class MapDatasetMaker(Maker):
             Reference geometry.
         observation : `~gammapy.data.Observation`
             Observation container.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -276,17 +296,26 @@ class MapDatasetMaker(Maker):
         if self.background_pad_offset and bkg.has_offset_axis:
             bkg = bkg.pad(1, mode="edge", axis_name="offset")
 
+        ontime = observation.observation_time_duration
+
+        if self.background_time_slices is not None:
+            obstime, ontime = _get_time_slices(
+                observation.gti, n_slices=self.background_time_slices
+            )
+            fov_coords = FoVCoordinates.from_observation(observation, obstime=obstime)
+
         return make_map_background_irf(
             pointing=observation.pointing,
-            ontime=observation.observation_time_duration,
+            ontime=ontime,
             bkg=bkg,
             geom=geom,
             oversampling=self.background_oversampling,
             use_region_center=use_region_center,
             obstime=observation.tmid,
+            fov_coords=fov_coords,
         )
 
-    def make_edisp(self, geom, observation):
+    def make_edisp(self, geom, observation, fov_coords=None):
         """Make energy dispersion map.
 
         Parameters
@@ -295,13 +324,18 @@ class MapDatasetMaker(Maker):
             Reference geometry.
         observation : `~gammapy.data.Observation`
             Observation container.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
         edisp : `~gammapy.irf.EDispMap`
             Energy dispersion map.
         """
-        exposure = self.make_exposure_irf(geom.squash(axis_name="migra"), observation)
+        exposure = self.make_exposure_irf(
+            geom.squash(axis_name="migra"), observation, fov_coords=fov_coords
+        )
 
         use_region_center = getattr(self, "use_region_center", True)
 
@@ -311,9 +345,10 @@ class MapDatasetMaker(Maker):
             geom=geom,
             exposure_map=exposure,
             use_region_center=use_region_center,
+            fov_coords=fov_coords,
         )
 
-    def make_edisp_kernel(self, geom, observation):
+    def make_edisp_kernel(self, geom, observation, fov_coords=None):
         """Make energy dispersion kernel map.
 
         Parameters
@@ -322,6 +357,9 @@ class MapDatasetMaker(Maker):
             Reference geometry. Must contain "energy" and "energy_true" axes in that order.
         observation : `~gammapy.data.Observation`
             Observation container.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -339,7 +377,9 @@ class MapDatasetMaker(Maker):
             interp_map = edisp.edisp_map.interp_to_geom(geom)
             return EDispKernelMap(edisp_kernel_map=interp_map, exposure_map=exposure)
 
-        exposure = self.make_exposure_irf(geom.squash(axis_name="energy"), observation)
+        exposure = self.make_exposure_irf(
+            geom.squash(axis_name="energy"), observation, fov_coords=fov_coords
+        )
 
         use_region_center = getattr(self, "use_region_center", True)
 
@@ -349,9 +389,10 @@ class MapDatasetMaker(Maker):
             geom=geom,
             exposure_map=exposure,
             use_region_center=use_region_center,
+            fov_coords=fov_coords,
         )
 
-    def make_psf(self, geom, observation):
+    def make_psf(self, geom, observation, fov_coords=None):
         """Make PSF map.
 
         Parameters
@@ -360,6 +401,9 @@ class MapDatasetMaker(Maker):
             Reference geometry.
         observation : `~gammapy.data.Observation`
             Observation container.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -377,13 +421,16 @@ class MapDatasetMaker(Maker):
                 exposure_map = None
             return psf.__class__(psf.psf_map.interp_to_geom(geom), exposure_map)
 
-        exposure = self.make_exposure_irf(geom.squash(axis_name="rad"), observation)
+        exposure = self.make_exposure_irf(
+            geom.squash(axis_name="rad"), observation, fov_coords=fov_coords
+        )
 
         return make_psf_map(
             psf=psf,
             pointing=observation.get_pointing_icrs(observation.tmid),
             geom=geom,
             exposure_map=exposure,
+            fov_coords=fov_coords,
         )
 
     @staticmethod
@@ -435,10 +482,18 @@ class MapDatasetMaker(Maker):
         dataset : `~gammapy.datasets.MapDataset`
             Map dataset.
         """
+        return self._run(dataset, observation)
+
+    def _run(self, dataset, observation, counts=None, fov_coords=None):
+        """Make map dataset, optionally from pre-computed counts and FoV coordinates."""
         kwargs = {"gti": observation.gti}
+
         if isinstance(observation, Observation):
             kwargs["meta_table"] = self.make_meta_table(observation)
             kwargs["meta"] = self._make_metadata(kwargs["meta_table"])
+            # FoV coordinates are shared by all IRF projections
+            if fov_coords is None:
+                fov_coords = FoVCoordinates.from_observation(observation)
         elif getattr(observation, "meta"):
             kwargs["meta"] = observation.meta
 
@@ -447,31 +502,38 @@ class MapDatasetMaker(Maker):
 
         kwargs["mask_safe"] = mask_safe
 
-        if "counts" in self.selection:
-            counts = self.make_counts(dataset.counts.geom, observation)
-        else:
-            counts = Map.from_geom(dataset.counts.geom, data=0)
+        if counts is None:
+            if "counts" in self.selection:
+                counts = self.make_counts(dataset.counts.geom, observation)
+            else:
+                counts = Map.from_geom(dataset.counts.geom, data=0)
         kwargs["counts"] = counts
 
         if "exposure" in self.selection:
-            exposure = self.make_exposure(dataset.exposure.geom, observation)
+            exposure = self.make_exposure(
+                dataset.exposure.geom, observation, fov_coords=fov_coords
+            )
             kwargs["exposure"] = exposure
 
         if "background" in self.selection:
             kwargs["background"] = self.make_background(
-                dataset.counts.geom, observation
+                dataset.counts.geom, observation, fov_coords=fov_coords
             )
 
         if "psf" in self.selection:
-            psf = self.make_psf(dataset.psf.psf_map.geom, observation)
+            psf = self.make_psf(
+                dataset.psf.psf_map.geom, observation, fov_coords=fov_coords
+            )
             kwargs["psf"] = psf
 
         if "edisp" in self.selection:
             if dataset.edisp.edisp_map.geom.axes[0].name.upper() == "MIGRA":
-                edisp = self.make_edisp(dataset.edisp.edisp_map.geom, observation)
+                edisp = self.make_edisp(
+                    dataset.edisp.edisp_map.geom, observation, fov_coords=fov_coords
+                )
             else:
                 edisp = self.make_edisp_kernel(
-                    dataset.edisp.edisp_map.geom, observation
+                    dataset.edisp.edisp_map.geom, observation, fov_coords=fov_coords
                 )
 
             kwargs["edisp"] = edisp
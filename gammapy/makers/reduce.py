@@ -1,8 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import numpy as np
 from astropy.coordinates import Angle
 import gammapy.utils.parallel as parallel
-from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
+from gammapy.datasets import (
+    Datasets,
+    MapDataset,
+    MapDatasetOnOff,
+    MapDatasetStacker,
+    SpectrumDataset,
+)
 from .core import Maker
 from .safe import SafeMaskMaker
 
@@ -23,6 +30,8 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         Makers.
     stack_datasets : bool, optional
         If True, stack into the reference dataset (see `run` method arguments).
+        Each process stacks the datasets of its share of the observations, and
+        the partial stacks are then merged in the order of the observations.
         Default is True.
     n_jobs : int, optional
         Number of processes to run in parallel.
@@ -123,13 +132,46 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
 
         return dataset_obs
 
-    def callback(self, dataset):
+    def make_stacked_dataset(self, datasets, observations):
+        """Make datasets for a group of observations and stack them.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.MapDataset`
+            Reference datasets, one per observation.
+        observations : list of `Observation`
+            Observations.
+
+        Returns
+        -------
+        stacker : `~gammapy.datasets.MapDatasetStacker`
+            Partial stacker, to be merged into the reference dataset.
+        """
+        stacker = MapDatasetStacker.from_dataset(self._dataset)
+
+        for dataset, observation in zip(datasets, observations):
+            dataset_obs = self.make_dataset(dataset, observation)
+
+            if (
+                type(self._dataset) is MapDataset
+                and type(dataset_obs) is MapDatasetOnOff
+            ):
+                dataset_obs = dataset_obs.to_map_dataset(name=dataset_obs.name)
+
+            stacker.stack(dataset_obs)
+
+        return stacker
+
+    def _make_stacked_dataset(self, idx, datasets, observations):
+        """Make partial stacker of a group of observations, returned with the group index."""
+        return idx, self.make_stacked_dataset(datasets, observations)
+
+    def callback(self, result):
         if self.stack_datasets:
-            if type(self._dataset) is MapDataset and type(dataset) is MapDatasetOnOff:
-                dataset = dataset.to_map_dataset(name=dataset.name)
-            self._dataset.stack(dataset)
+            idx, stacker = result
+            self._stackers[idx] = stacker
         else:
-            self._datasets.append(dataset)
+            self._datasets.append(result)
 
     def error_callback(self, dataset):
         # parallel run could cause a memory error with non-explicit message.
@@ -167,11 +209,31 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         else:
             datasets = len(observations) * [dataset]
 
+        if len(observations) == 0:
+            log.warning("No observations to reduce")
+            return Datasets([dataset] if self.stack_datasets else [])
+
         n_jobs = min(self.n_jobs, len(observations))
 
+        if self.stack_datasets:
+            self._stackers = {}
+            func = self._make_stacked_dataset
+            groups = np.array_split(np.arange(len(observations)), n_jobs)
+            inputs = [
+                (
+                    idx,
+                    [datasets[_] for _ in group],
+                    [observations[_] for _ in group],
+                )
+                for idx, group in enumerate(groups)
+            ]
+        else:
+            func = self.make_dataset
+            inputs = zip(datasets, observations)
+
         parallel.run_multiprocessing(
-            self.make_dataset,
-            zip(datasets, observations),
+            func,
+            inputs,
             backend=self.parallel_backend,
             pool_kwargs=dict(processes=n_jobs),
             method="apply_async",
@@ -186,7 +248,12 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
             raise RuntimeError("Execution of a sub-process failed")
 
         if self.stack_datasets:
-            return Datasets([self._dataset])
+            # merge in the order of the groups, not of completion, so that the
+            # GTI and meta table are ordered as the observations
+            stacker = MapDatasetStacker(self._dataset)
+            for idx in range(len(groups)):
+                stacker.merge(self._stackers.pop(idx))
+            return Datasets([stacker.finalize()])
 
         lookup = {
             d.meta_table["OBS_ID"][0]: idx for idx, d in enumerate(self._datasets)
@@ -355,7 +355,7 @@ class SafeMaskMaker(Maker):
                 raise ValueError("observation argument is mandatory with DL3 irfs")
 
         if dataset.mask_safe:
-            mask_safe = dataset.mask_safe.data
+            mask_safe = dataset.mask_safe.data.copy()
         else:
             mask_safe = np.ones(dataset._geom.data_shape, dtype=bool)
 
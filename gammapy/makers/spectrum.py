@@ -1,7 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 from regions import CircleSkyRegion
+from gammapy.data import Observation
 from .map import MapDatasetMaker
+from .utils import FoVCoordinates, make_counts_regions
 
 __all__ = ["SpectrumDatasetMaker"]
 
@@ -45,7 +47,7 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             selection=selection, background_oversampling=background_oversampling
         )
 
-    def make_exposure(self, geom, observation):
+    def make_exposure(self, geom, observation, fov_coords=None):
         """Make exposure.
 
         Parameters
@@ -54,6 +56,9 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             Reference map geometry.
         observation : `~gammapy.data.Observation`
             Observation to compute effective area for.
+        fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+            Pre-computed field-of-view coordinates of the observation.
+            Default is None.
 
         Returns
         -------
@@ -61,7 +66,10 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             Exposure map.
         """
         exposure = super().make_exposure(
-            geom, observation, use_region_center=self.use_region_center
+            geom,
+            observation,
+            use_region_center=self.use_region_center,
+            fov_coords=fov_coords,
         )
 
         is_pointlike = exposure.meta.get("is_pointlike", False)
@@ -132,3 +140,47 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             Spectrum dataset.
         """
         return super(SpectrumDatasetMaker, self).run(dataset, observation)
+
+    def run_regions(self, datasets, observation):
+        """Make spectrum datasets for several ON regions of the same observation.
+
+        The events are assigned to all ON regions with a single spatial lookup,
+        see `~gammapy.makers.utils.make_counts_regions`, and the field-of-view
+        coordinates are shared by the IRF projections of all regions.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.SpectrumDataset`
+            Reference datasets, one per ON region.
+        observation : `~gammapy.data.Observation`
+            Observation.
+
+        Returns
+        -------
+        datasets : list of `~gammapy.datasets.SpectrumDataset`
+            Spectrum datasets.
+        """
+        counts = [None] * len(datasets)
+
+        if "counts" in self.selection:
+            idx_regions = [
+                idx
+                for idx, dataset in enumerate(datasets)
+                if not dataset.counts.geom.is_all_point_sky_regions
+            ]
+            counts_regions = make_counts_regions(
+                [datasets[idx].counts.geom for idx in idx_regions], observation.events
+            )
+            for idx, counts_region in zip(idx_regions, counts_regions):
+                counts[idx] = counts_region
+
+        fov_coords = None
+        if isinstance(observation, Observation):
+            fov_coords = FoVCoordinates.from_observation(observation)
+
+        return [
+            self._run(
+                dataset, observation, counts=counts_dataset, fov_coords=fov_coords
+            )
+            for dataset, counts_dataset in zip(datasets, counts)
+        ]
@@ -1,15 +1,17 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
+from astropy.table import Table
 from regions import CircleSkyRegion, PointSkyRegion
-from gammapy.data import DataStore, Observation
+from gammapy.data import DataStore, FixedPointingInfo, Observation
 from gammapy.datasets import MapDataset, SpectrumDataset
 from gammapy.makers import (
     DatasetsMaker,
     FoVBackgroundMaker,
+    Maker,
     MapDatasetMaker,
     ReflectedRegionsBackgroundMaker,
     SafeMaskMaker,
@@ -222,6 +224,58 @@ def test_datasets_maker_map(pars, observations_cta, makers_map, map_dataset):
         assert_allclose(exposure.data.mean(), 2.436063e09, rtol=3e-3)
 
 
+class _CountsMaker(Maker):
+    tag = "CountsMaker"
+
+    def run(self, dataset, observation):
+        dataset.counts.data += observation.obs_id
+        dataset.exposure.data += 1
+        dataset.mask_safe.data[observation.obs_id % 2 :] = True
+        dataset.gti = observation.gti
+        dataset.meta_table = Table({"OBS_ID": [observation.obs_id]})
+        return dataset
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, 3])
+def test_datasets_maker_stack_reduction(map_dataset, n_jobs):
+    pointing = FixedPointingInfo(fixed_icrs=SkyCoord(0, 0, unit="deg"))
+    observations = [
+        Observation.create(
+            pointing, obs_id=idx, tstart=idx * u.h, tstop=(idx + 0.5) * u.h, irfs={}
+        )
+        for idx in range(5)
+    ]
+
+    expected = map_dataset.copy(name="expected")
+    for observation in observations:
+        dataset = _CountsMaker().run(map_dataset.copy(), observation)
+        expected.stack(dataset)
+
+    maker = DatasetsMaker([_CountsMaker()], n_jobs=n_jobs)
+    datasets = maker.run(map_dataset.copy(name="stacked"), observations)
+
+    assert len(datasets) == 1
+    assert datasets[0].name == "stacked"
+    assert_allclose(datasets[0].counts.data, expected.counts.data)
+    assert_allclose(datasets[0].exposure.data, expected.exposure.data)
+    assert_equal(datasets[0].mask_safe.data, expected.mask_safe.data)
+    assert_allclose(datasets[0].gti.time_sum, 2.5 * u.h)
+
+    # merged in the order of the observations
+    assert_equal(datasets[0].meta_table["OBS_ID"][0], [0, 1, 2, 3, 4])
+
+
+@pytest.mark.parametrize("stack_datasets", [True, False])
+def test_datasets_maker_no_observations(map_dataset, stack_datasets):
+    maker = DatasetsMaker([_CountsMaker()], stack_datasets=stack_datasets)
+    datasets = maker.run(map_dataset, [])
+
+    if stack_datasets:
+        assert datasets[0] is map_dataset
+    else:
+        assert len(datasets) == 0
+
+
 @requires_data()
 def test_failure_datasets_maker_map(
     observations_cta_with_issue, makers_map, map_dataset
@@ -308,3 +308,20 @@ def test_safe_mask_maker_bkg_invalid(observations_hess_dl3):
 
     dataset = safe_mask_maker_nonan.run(dataset, obs)
     assert_allclose(dataset.mask_safe, mask_nonan)
+
+
+def test_safe_mask_maker_sliced_dataset():
+    axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=6)
+    geom = WcsGeom.create(npix=(3, 3), axes=[axis])
+
+    dataset = MapDataset.create(geom=geom)
+    dataset.background.data += np.array([1, 2, 4, 3, 2, 1]).reshape((-1, 1, 1))
+    dataset.mask_safe.data[...] = True
+
+    sliced = dataset.slice_by_idx({"energy": slice(1, 5)})
+
+    safe_mask_maker = SafeMaskMaker(methods=["bkg-peak"], irfs="DL4")
+    sliced = safe_mask_maker.run(sliced)
+
+    assert_allclose(sliced.mask_safe.data[:, 0, 0], [False, True, True, True])
+    assert np.all(dataset.mask_safe.data)
@@ -4,10 +4,11 @@ import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
+from astropy.table import Table
 from regions import CircleSkyRegion
-from gammapy.data import DataStore
+from gammapy.data import DataStore, EventList, FixedPointingInfo, Observation
 from gammapy.datasets import SpectrumDataset
-from gammapy.irf import FoVAlignment
+from gammapy.irf import EffectiveAreaTable2D, FoVAlignment
 from gammapy.makers import (
     ReflectedRegionsBackgroundMaker,
     SafeMaskMaker,
@@ -15,6 +16,7 @@ from gammapy.makers import (
 )
 from gammapy.maps import MapAxis, RegionGeom, WcsGeom
 from gammapy.utils.testing import assert_quantity_allclose, requires_data
+from gammapy.utils.time import time_ref_to_dict
 
 
 @pytest.fixture
@@ -126,7 +128,6 @@ def test_spectrum_dataset_maker_hess_dl3(spectrum_dataset_crab, observations_hes
 
     datasets = []
     for obs in observations_hess_dl3:
-
         assert obs.meta.optional["CREATOR"] == "SASH FITS::EventListWriter"
         assert obs.meta.optional["HDUVERS"] == "0.2"
         assert obs.bkg.fov_alignment == FoVAlignment.REVERSE_LON_RADEC
@@ -360,3 +361,51 @@ class TestSpectrumMakerChain:
 
         actual = dataset.energy_range[0]
         assert_quantity_allclose(actual, 0.681292 * u.TeV, rtol=1e-3)
+
+
+def test_spectrum_dataset_maker_run_regions():
+    random_state = np.random.RandomState(0)
+    table = Table()
+    table["RA"] = random_state.uniform(81.5, 85.5, 2000) * u.deg
+    table["DEC"] = random_state.uniform(20.5, 24.5, 2000) * u.deg
+    table["ENERGY"] = random_state.uniform(1, 10, 2000) * u.TeV
+    table.meta.update(time_ref_to_dict("2000-01-01"))
+
+    energy_axis_true = MapAxis.from_energy_bounds(
+        0.5, 20, nbin=5, unit="TeV", name="energy_true"
+    )
+    offset_axis = MapAxis.from_bounds(0, 3, nbin=3, unit="deg", name="offset")
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis], data=np.ones((5, 3)), unit="m2"
+    )
+
+    pointing = FixedPointingInfo(fixed_icrs=SkyCoord(83.63, 22.51, unit="deg"))
+    observation = Observation.create(
+        pointing, obs_id=1, livetime=1 * u.h, irfs={"aeff": aeff}
+    )
+    observation._events = EventList(table)
+
+    energy_axis = MapAxis.from_energy_bounds(1, 10, nbin=3, unit="TeV")
+    datasets = []
+    for idx in range(3):
+        region = CircleSkyRegion(
+            SkyCoord(83.63 + 0.3 * idx, 22.0, unit="deg"), 0.1 * u.deg
+        )
+        geom = RegionGeom.create(region, axes=[energy_axis])
+        dataset = SpectrumDataset.create(
+            geom, energy_axis_true=energy_axis_true, name=f"source-{idx}"
+        )
+        datasets.append(dataset)
+
+    maker = SpectrumDatasetMaker(selection=["counts", "exposure"])
+    datasets_obs = maker.run_regions(datasets, observation)
+
+    assert len(datasets_obs) == 3
+
+    for dataset, dataset_obs in zip(datasets, datasets_obs):
+        expected = maker.run(dataset, observation)
+        assert dataset_obs.name == dataset.name
+        assert_allclose(dataset_obs.counts.data, expected.counts.data)
+        assert_allclose(dataset_obs.exposure.data, expected.exposure.data)
+
+    assert_allclose(datasets_obs[1].counts.data.sum(), 7)
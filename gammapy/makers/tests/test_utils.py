@@ -1,12 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 from astropy import units as u
-from astropy.coordinates import EarthLocation, SkyCoord
+from astropy.coordinates import EarthLocation, SkyCoord, SkyOffsetFrame
 from astropy.table import Table
 from astropy.time import Time
-from regions import PointSkyRegion
+from regions import CircleSkyRegion, PointSkyRegion, RectangleSkyRegion
 from gammapy.data import GTI, DataStore, EventList, FixedPointingInfo, Observation
 from gammapy.irf import (
     Background2D,
@@ -16,18 +16,22 @@ from gammapy.irf import (
 )
 from gammapy.makers import WobbleRegionsFinder
 from gammapy.makers.utils import (
+    FoVCoordinates,
+    _get_time_slices,
     _map_spectrum_weight,
     guess_instrument_fov,
     make_counts_off_rad_max,
     make_counts_rad_max,
+    make_counts_regions,
     make_edisp_kernel_map,
     make_effective_livetime_map,
+    make_exclusion_mask_cutout,
     make_map_background_irf,
     make_map_exposure_true_energy,
     make_observation_time_map,
     make_theta_squared_table,
 )
-from gammapy.maps import HpxGeom, MapAxis, RegionGeom, WcsGeom, WcsNDMap
+from gammapy.maps import HpxGeom, MapAxis, RegionGeom, RegionNDMap, WcsGeom, WcsNDMap
 from gammapy.modeling.models import ConstantSpectralModel
 from gammapy.utils.testing import requires_data
 from gammapy.utils.time import time_ref_to_dict
@@ -325,6 +329,110 @@ def test_make_map_background_irf_skycoord(fixed_pointing_info_aligned):
         )
 
 
+def test_fov_coordinates(bkg_2d):
+    pointing = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
+    axis = MapAxis.from_edges([0.1, 1, 10], name="energy", unit="TeV", interp="log")
+    geom = WcsGeom.create(
+        npix=(5, 4), binsz=1, axes=[axis], skydir=pointing.galactic, frame="galactic"
+    )
+
+    fov_coords = FoVCoordinates(pointing=pointing)
+    coords = fov_coords.get_coords(irf=bkg_3d_custom("asymmetric"), geom=geom)
+
+    sky_coord = geom.to_image().get_coord().skycoord
+    expected = sky_coord.transform_to(SkyOffsetFrame(origin=pointing))
+    assert coords["fov_lon"].shape == (4, 5)
+    assert_allclose(coords["fov_lon"].to_value("deg"), -expected.lon.deg, atol=1e-10)
+    assert_allclose(coords["fov_lat"].to_value("deg"), expected.lat.deg, atol=1e-10)
+
+    # coordinates are cached per image geometry and IRF coordinate type
+    fov_coords.get_coords(irf=bkg_3d_custom("constant"), geom=geom.to_image())
+    assert len(fov_coords._cache) == 1
+
+    coords = fov_coords.get_coords(irf=bkg_2d, geom=geom)
+    assert len(fov_coords._cache) == 2
+    assert_allclose(coords["offset"], sky_coord.separation(pointing))
+
+    coords["energy"] = 1 * u.TeV
+    assert "energy" not in fov_coords.get_coords(irf=bkg_2d, geom=geom)
+
+    m = make_map_background_irf(
+        pointing=None, ontime=42 * u.s, bkg=bkg_2d, geom=geom, fov_coords=fov_coords
+    )
+    m_ref = make_map_background_irf(
+        pointing=pointing, ontime=42 * u.s, bkg=bkg_2d, geom=geom
+    )
+    assert_allclose(m.data, m_ref.data)
+
+
+def test_fov_coordinates_cache_size(bkg_2d):
+    pointing = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
+    fov_coords = FoVCoordinates(pointing=pointing)
+
+    geoms = [
+        WcsGeom.create(npix=npix, binsz=1, skydir=pointing)
+        for npix in range(1, fov_coords._cache_size + 3)
+    ]
+
+    for geom in geoms:
+        fov_coords.get_coords(irf=bkg_2d, geom=geom)
+
+    assert len(fov_coords._cache) == fov_coords._cache_size
+    assert fov_coords._cache[0][1] == geoms[2]
+
+
+def test_get_time_slices():
+    gti = GTI.create(
+        start=[0, 1000] * u.s, stop=[600, 1200] * u.s, reference_time="2020-01-01"
+    )
+    obstime, ontime = _get_time_slices(gti, n_slices=4)
+
+    assert_allclose(ontime.to_value("s"), [300, 300, 200])
+    assert_allclose((obstime - gti.time_ref).to_value("s"), [150, 450, 1050])
+    assert_allclose(ontime.sum(), gti.time_sum)
+
+
+def test_make_map_background_irf_time_slices():
+    location = EarthLocation(lat=-23.27 * u.deg, lon=16.5 * u.deg, height=1800 * u.m)
+    time_start = Time("2020-01-01T20:00:00")
+    pointing = FixedPointingInfo(
+        fixed_icrs=SkyCoord(83.63, 22.01, unit="deg"),
+        location=location,
+        time_start=time_start,
+        time_stop=time_start + 1 * u.h,
+    )
+
+    axis = MapAxis.from_edges([0.1, 1, 10], name="energy", unit="TeV", interp="log")
+    geom = WcsGeom.create(
+        npix=(5, 5), binsz=1, axes=[axis], skydir=pointing.fixed_icrs, frame="icrs"
+    )
+    bkg = bkg_3d_custom("asymmetric", "ALTAZ")
+    obstime = time_start + [10, 30, 50] * u.min
+
+    m = make_map_background_irf(
+        pointing=pointing, ontime=1 * u.h, bkg=bkg, geom=geom, obstime=obstime
+    )
+
+    expected = 0
+    for time in obstime:
+        expected += make_map_background_irf(
+            pointing=pointing, ontime=20 * u.min, bkg=bkg, geom=geom, obstime=time
+        ).data
+
+    assert m.data.shape == (2, 5, 5)
+    assert_allclose(m.data, expected, rtol=1e-4)
+
+    m_chunked = make_map_background_irf(
+        pointing=pointing,
+        ontime=[20, 20, 20] * u.min,
+        bkg=bkg,
+        geom=geom,
+        obstime=obstime,
+        max_memory="1 byte",
+    )
+    assert_allclose(m_chunked.data, m.data)
+
+
 def test_make_edisp_kernel_map():
     migra = MapAxis.from_edges(np.linspace(0.5, 1.5, 50), unit="", name="migra")
     etrue = MapAxis.from_energy_bounds(0.5, 2, 6, unit="TeV", name="energy_true")
@@ -377,6 +485,38 @@ def test_make_counts_off_rad_max(observations):
     assert_allclose(np.squeeze(counts_off.data), np.array([1641, 564, 156, 24, 0, 0]))
 
 
+def test_make_counts_regions():
+    random_state = np.random.RandomState(0)
+    table = Table()
+    table["RA"] = random_state.uniform(-2, 2, 10000) * u.deg
+    table["DEC"] = random_state.uniform(-2, 2, 10000) * u.deg
+    table["ENERGY"] = random_state.uniform(1, 10, 10000) * u.TeV
+    events = EventList(table)
+
+    energy_axis = MapAxis.from_energy_bounds(1, 10, nbin=3, unit="TeV")
+    regions = [
+        CircleSkyRegion(SkyCoord(0, 0, unit="deg"), 0.5 * u.deg),
+        CircleSkyRegion(SkyCoord(1, 1, unit="deg"), 0.2 * u.deg),
+        CircleSkyRegion(SkyCoord(0.2, 0, unit="deg"), 0.3 * u.deg)
+        | CircleSkyRegion(SkyCoord(-1, 0, unit="deg"), 0.3 * u.deg),
+        RectangleSkyRegion(SkyCoord(0, 1, unit="deg"), 0.5 * u.deg, 0.3 * u.deg),
+        CircleSkyRegion(SkyCoord(30, 0, unit="deg"), 0.2 * u.deg),
+    ]
+    geoms = [RegionGeom.create(region, axes=[energy_axis]) for region in regions]
+
+    counts = make_counts_regions(geoms, events)
+
+    assert len(counts) == 5
+
+    for counts_geom, geom in zip(counts, geoms):
+        expected = RegionNDMap.from_geom(geom)
+        expected.fill_events(events)
+        assert_allclose(counts_geom.data, expected.data)
+
+    assert counts[0].data.sum() > 0
+    assert_allclose(counts[4].data.sum(), 0)
+
+
 class TestTheta2Table:
     def setup_class(self):
         self.observations = []
@@ -564,3 +704,41 @@ def test_make_effective_livetime_map():
     assert_allclose(obs_time_offset, [0, 0.242814], rtol=1e-3)
 
     assert obs_time.unit == u.hr
+
+
+def test_make_exclusion_mask_cutout():
+    geom = WcsGeom.create(skydir=(83.63, 22.01), binsz=0.02, width=6, frame="icrs")
+    rng = np.random.default_rng(0)
+    exclusion_mask = WcsNDMap(geom, data=rng.uniform(size=geom.data_shape) > 0.1)
+
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    position = SkyCoord(84.1, 22.5, unit="deg")
+
+    cutout_geom = geom.cutout(position=position, width=2 * u.deg)
+    cutout_geom = cutout_geom.to_cube([energy_axis])
+
+    mask = make_exclusion_mask_cutout(exclusion_mask, cutout_geom)
+    expected = exclusion_mask.interp_to_geom(cutout_geom)
+
+    assert mask.geom == cutout_geom
+    assert not mask.data.flags.writeable
+    assert np.shares_memory(mask.data, exclusion_mask.data)
+    assert_equal(mask.data, expected.data)
+
+    # not aligned with the exclusion mask
+    other_geom = WcsGeom.create(skydir=position, binsz=0.03, width=2, frame="icrs")
+    mask = make_exclusion_mask_cutout(exclusion_mask, other_geom, fill_value=True)
+    expected = exclusion_mask.interp_to_geom(other_geom, fill_value=True)
+
+    assert mask.data.flags.writeable
+    assert_equal(mask.data, expected.data)
+
+    # partially outside of the exclusion mask
+    other_geom = geom.cutout(
+        position=SkyCoord(86.5, 22.0, unit="deg"), width=2 * u.deg, mode="partial"
+    )
+    mask = make_exclusion_mask_cutout(exclusion_mask, other_geom)
+    expected = exclusion_mask.interp_to_geom(other_geom)
+
+    assert not np.shares_memory(mask.data, exclusion_mask.data)
+    assert_equal(mask.data, expected.data)
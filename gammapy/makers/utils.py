@@ -3,21 +3,27 @@ import logging
 import warnings
 import numpy as np
 import astropy.units as u
-from astropy.coordinates import Angle
+from astropy.coordinates import AltAz, Angle, SkyCoord, search_around_sky
 from astropy.table import Table
-from gammapy.data import FixedPointingInfo
-from gammapy.irf import BackgroundIRF, EDispMap, FoVAlignment, PSFMap
-from gammapy.maps import Map, RegionNDMap
+from astropy.utils import lazyproperty
+from regions import CircleSkyRegion
+from gammapy.data import FixedPointingInfo, PointingInfo
+from gammapy.irf import EDispMap, FoVAlignment, PSFMap
+from gammapy.maps import Map, RegionNDMap, WcsGeom
 from gammapy.maps.utils import broadcast_axis_values_to_geom
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import WStatCountsStatistic
-from gammapy.utils.coordinates import sky_to_fov
+from gammapy.utils.coordinates import fov_to_sky, sky_to_fov
+from gammapy.utils.integrate import trapz_loglog
 from gammapy.utils.regions import compound_region_to_regions
 
 __all__ = [
+    "FoVCoordinates",
     "make_counts_rad_max",
+    "make_counts_regions",
     "make_edisp_kernel_map",
     "make_edisp_map",
+    "make_exclusion_mask_cutout",
     "make_map_background_irf",
     "make_map_exposure_true_energy",
     "make_psf_map",
@@ -29,80 +35,295 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
-def _get_fov_coords(pointing, irf, geom, use_region_center=True, obstime=None):
-    # TODO: create dedicated coordinate handling see #5041
-    coords = {}
-    if isinstance(pointing, FixedPointingInfo):
-        # for backwards compatibility, obstime should be required
-        if obstime is None:
-            if isinstance(obstime, BackgroundIRF):
-                warnings.warn(
-                    "Future versions of gammapy will require the obstime keyword for this function",
-                    DeprecationWarning,
-                )
+class FoVCoordinates:
+    """Field-of-view coordinates of an observation.
+
+    The offset and field-of-view longitude and latitude of the pixels of a
+    given geometry are computed once and cached, so that they can be shared
+    by all IRF projections of the same observation.
+
+    If an array of observation times is given, the coordinates are computed
+    for each time, with the time as the first dimension. For the alt-az
+    aligned field-of-view coordinates, the rotation of the field-of-view
+    with respect to the sky is then computed at the pointing position only
+    and applied to the whole field-of-view. This neglects differential
+    aberration which is on the order of an arcsecond.
+
+    Parameters
+    ----------
+    pointing : `~gammapy.data.FixedPointingInfo`, `~gammapy.data.PointingInfo` or `~astropy.coordinates.SkyCoord`
+        Observation pointing.
+    obstime : `~astropy.time.Time`, optional
+        Observation time or array of times to use. Default is None, which uses the
+        `obstime` of the `~gammapy.data.FixedPointingInfo`.
+    location : `~astropy.coordinates.EarthLocation`, optional
+        Observatory location. Default is None.
+
+    Examples
+    --------
+    >>> from gammapy.data import DataStore
+    >>> from gammapy.makers.utils import FoVCoordinates
+    >>> from gammapy.maps import WcsGeom
+    >>> data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1")
+    >>> obs = data_store.obs(23523)
+    >>> geom = WcsGeom.create(skydir=(83.633, 22.014), binsz=0.02, width=2)
+    >>> fov_coords = FoVCoordinates.from_observation(obs)
+    >>> coords = fov_coords.get_coords(irf=obs.aeff, geom=geom)
+    >>> print(coords["offset"].shape)
+    (100, 100)
+    """
+
+    _cache_size = 8
+
+    def __init__(self, pointing, obstime=None, location=None):
+        if isinstance(pointing, FixedPointingInfo) and obstime is None:
             obstime = pointing.obstime
 
-        pointing_icrs = pointing.get_icrs(obstime)
-    else:
-        pointing_icrs = pointing
+        self.pointing = pointing
+        self.obstime = obstime
+        self.location = location
+        self._cache = []
+
+    @classmethod
+    def from_observation(cls, observation, obstime=None):
+        """Create from an observation.
+
+        Parameters
+        ----------
+        observation : `~gammapy.data.Observation`
+            Observation.
+        obstime : `~astropy.time.Time`, optional
+            Observation time or array of times to use.
+            Default is None, which uses the mid time of the observation.
+
+        Returns
+        -------
+        fov_coords : `FoVCoordinates`
+            Field-of-view coordinates.
+        """
+        if obstime is None:
+            obstime = observation.tmid
 
-    if not use_region_center:
-        region_coord, weights = geom.get_wcs_coord_and_weights()
-        sky_coord = region_coord.skycoord
+        return cls(
+            pointing=observation.pointing,
+            obstime=obstime,
+            location=observation.observatory_earth_location,
+        )
 
-    else:
-        image_geom = geom.to_image()
-        map_coord = image_geom.get_coord()
-        sky_coord = map_coord.skycoord
+    @property
+    def is_time_sliced(self):
+        """Whether the coordinates are computed for an array of times."""
+        return self.obstime is not None and not self.obstime.isscalar
+
+    @lazyproperty
+    def pointing_icrs(self):
+        """Pointing position in ICRS as a `~astropy.coordinates.SkyCoord`."""
+        if isinstance(self.pointing, FixedPointingInfo):
+            return self.pointing.get_icrs(self.obstime, self.location)
+        elif isinstance(self.pointing, PointingInfo):
+            return self.pointing.get_icrs(self.obstime)
+        return self.pointing
+
+    @lazyproperty
+    def pointing_altaz(self):
+        """Pointing position in alt-az as a `~astropy.coordinates.SkyCoord`."""
+        if isinstance(self.pointing, FixedPointingInfo):
+            return self.pointing.get_altaz(self.obstime, self.location)
+        elif isinstance(self.pointing, PointingInfo):
+            return self.pointing.get_altaz(self.obstime)
+
+        raise TypeError(
+            "FixedPointingInfo is required to compute field-of-view "
+            "coordinates if the IRF fov_alignment is ALTAZ",
+        )
 
-    if irf.has_offset_axis:
-        coords["offset"] = sky_coord.separation(pointing_icrs)
-    else:
-        if irf.fov_alignment == FoVAlignment.ALTAZ:
-            if not isinstance(pointing, FixedPointingInfo) and isinstance(
-                irf, BackgroundIRF
-            ):
-                raise TypeError(
-                    "make_map_background_irf requires FixedPointingInfo if "
-                    "BackgroundIRF.fov_alignement is ALTAZ",
-                )
-
-            # for backwards compatibility, obstime should be required
-            if obstime is None:
-                warnings.warn(
-                    "Future versions of gammapy will require the obstime keyword for this function",
-                    DeprecationWarning,
-                )
-                obstime = pointing.obstime
-
-            pointing_altaz = pointing.get_altaz(obstime)
-            altaz_coord = sky_coord.transform_to(pointing_altaz.frame)
-
-            # Compute FOV coordinates of map relative to pointing
-            fov_lon, fov_lat = sky_to_fov(
-                altaz_coord.az, altaz_coord.alt, pointing_altaz.az, pointing_altaz.alt
-            )
-        elif irf.fov_alignment in [FoVAlignment.RADEC, FoVAlignment.REVERSE_LON_RADEC]:
-            fov_lon, fov_lat = sky_to_fov(
-                sky_coord.icrs.ra,
-                sky_coord.icrs.dec,
-                pointing_icrs.icrs.ra,
-                pointing_icrs.icrs.dec,
+    @lazyproperty
+    def _radec_to_altaz_matrix(self):
+        """Rotation from RADEC to ALTAZ aligned FoV coordinates for each time."""
+        pointing_icrs = self.pointing_icrs.icrs
+        pointing_altaz = self.pointing_altaz
+
+        # pointing and points offset to FoV north and FoV lon
+        fov_lon = [0, 0, 1] * u.deg
+        fov_lat = [0, 1, 0] * u.deg
+        ra, dec = fov_to_sky(
+            fov_lon,
+            fov_lat,
+            pointing_icrs.ra[..., np.newaxis],
+            pointing_icrs.dec[..., np.newaxis],
+        )
+
+        frame = AltAz(
+            obstime=self.obstime[..., np.newaxis],
+            location=pointing_altaz.location,
+        )
+        altaz = SkyCoord(ra, dec, frame="icrs").transform_to(frame)
+        lon, lat = sky_to_fov(
+            altaz.az, altaz.alt, altaz.az[..., :1], altaz.alt[..., :1]
+        )
+
+        # images of the unit vectors of the tangent plane in ALTAZ alignment
+        y, z = np.cos(lat) * np.sin(lon), np.sin(lat)
+        matrix = np.stack([y[..., 2:0:-1], z[..., 2:0:-1]], axis=-2)
+        matrix = matrix.to_value("") / np.sin(np.radians(1))
+
+        # remove the residual scaling and shear, which are due to aberration
+        u_, _, vh = np.linalg.svd(matrix)
+        return u_ @ vh
+
+    def _rotate_to_altaz(self, fov_lon, fov_lat, ndim):
+        """Rotate RADEC aligned to ALTAZ aligned FoV coordinates."""
+        matrix = self._radec_to_altaz_matrix
+        matrix = matrix.reshape(matrix.shape[:1] + (1,) * ndim + (2, 2))
+
+        fov_lon, fov_lat = fov_lon.to_value("rad"), fov_lat.to_value("rad")
+
+        cos_lat = np.cos(fov_lat)
+        x = cos_lat * np.cos(fov_lon)
+        y = cos_lat * np.sin(fov_lon)
+        z = np.sin(fov_lat)
+
+        y_altaz = matrix[..., 0, 0] * y + matrix[..., 0, 1] * z
+        z_altaz = matrix[..., 1, 0] * y + matrix[..., 1, 1] * z
+
+        fov_lon = np.arctan2(y_altaz, x)
+        fov_lat = np.arctan2(z_altaz, np.hypot(x, y_altaz))
+        return Angle(np.rad2deg(fov_lon), "deg"), Angle(np.rad2deg(fov_lat), "deg")
+
+    @staticmethod
+    def _expand_time(coord, ndim):
+        """Add dimensions for broadcasting of the time axis against the pixels."""
+        if coord.isscalar:
+            return coord
+        return coord.reshape(coord.shape + (1,) * ndim)
+
+    def _broadcast_time(self, coords, shape):
+        """Broadcast coordinates to have the time as first dimension."""
+        if not self.is_time_sliced:
+            return coords
+
+        coords_broadcast = {}
+        for key, value in coords.items():
+            coords_broadcast[key] = np.broadcast_to(
+                value, self.obstime.shape + shape, subok=True
             )
-            if irf.fov_alignment == FoVAlignment.REVERSE_LON_RADEC:
-                fov_lon = -fov_lon
+
+        return coords_broadcast
+
+    @staticmethod
+    def _get_sky_coord(geom, use_region_center):
+        if not use_region_center:
+            region_coord, _ = geom.get_wcs_coord_and_weights()
+            return region_coord.skycoord
+        return geom.to_image().get_coord().skycoord
+
+    def _compute_coords(self, kind, geom, use_region_center):
+        sky_coord = self._get_sky_coord(geom, use_region_center)
+
+        if kind == "offset":
+            pointing_icrs = self._expand_time(self.pointing_icrs, sky_coord.ndim)
+            offset = sky_coord.separation(pointing_icrs)
+            return self._broadcast_time({"offset": offset}, sky_coord.shape)
+
+        if kind == FoVAlignment.ALTAZ and not self.is_time_sliced:
+            pointing_altaz = self.pointing_altaz
+            sky_coord = sky_coord.transform_to(pointing_altaz.frame)
+            lon, lat = sky_coord.az, sky_coord.alt
+            lon_pnt, lat_pnt = pointing_altaz.az, pointing_altaz.alt
+        elif kind in [
+            FoVAlignment.ALTAZ,
+            FoVAlignment.RADEC,
+            FoVAlignment.REVERSE_LON_RADEC,
+        ]:
+            # time sliced alt-az coordinates are rotated from RADEC below
+            sky_coord = sky_coord.icrs
+            pointing_icrs = self._expand_time(self.pointing_icrs.icrs, sky_coord.ndim)
+            lon, lat = sky_coord.ra, sky_coord.dec
+            lon_pnt, lat_pnt = pointing_icrs.ra, pointing_icrs.dec
         else:
-            raise ValueError(
-                f"Unsupported background coordinate system: {irf.fov_alignment!r}"
-            )
+            raise ValueError(f"Unsupported background coordinate system: {kind!r}")
+
+        # Compute FOV coordinates of map relative to pointing
+        fov_lon, fov_lat = sky_to_fov(lon, lat, lon_pnt, lat_pnt)
+
+        if kind == FoVAlignment.ALTAZ and self.is_time_sliced:
+            fov_lon, fov_lat = self._rotate_to_altaz(fov_lon, fov_lat, sky_coord.ndim)
+        elif kind == FoVAlignment.REVERSE_LON_RADEC:
+            fov_lon = -fov_lon
+
+        coords = {"fov_lon": fov_lon, "fov_lat": fov_lat}
+        return self._broadcast_time(coords, sky_coord.shape)
+
+    def get_coords(self, irf, geom, use_region_center=True):
+        """Get field-of-view coordinates for a given IRF and geometry.
+
+        Parameters
+        ----------
+        irf : `~gammapy.irf.IRF`
+            IRF to get the coordinates for. Defines whether the offset or
+            the field-of-view longitude and latitude are needed.
+        geom : `~gammapy.maps.Geom`
+            Map geometry.
+        use_region_center : bool, optional
+            For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
+            If False, use the coordinates of all pixels within the region.
+            Default is True.
+
+        Returns
+        -------
+        coords : dict of `~astropy.units.Quantity`
+            Either "offset" or "fov_lon" and "fov_lat" coordinates.
+        """
+        kind = "offset" if irf.has_offset_axis else irf.fov_alignment
+
+        if geom.is_region:
+            return self._compute_coords(kind, geom, use_region_center)
+
+        image_geom = geom.to_image()
+
+        for idx, (cached_kind, cached_geom, coords) in enumerate(self._cache):
+            if cached_kind == kind and cached_geom == image_geom:
+                # move to the end to evict the least recently used first
+                self._cache.append(self._cache.pop(idx))
+                return dict(coords)
+
+        coords = self._compute_coords(kind, image_geom, use_region_center)
+        self._cache.append((kind, image_geom, coords))
+
+        if len(self._cache) > self._cache_size:
+            self._cache.pop(0)
 
-        coords["fov_lon"] = fov_lon
-        coords["fov_lat"] = fov_lat
-    return coords
+        return dict(coords)
+
+
+def _create_fov_coords(pointing, irf, obstime=None):
+    # for backwards compatibility, obstime should be required
+    if (
+        obstime is None
+        and not irf.has_offset_axis
+        and irf.fov_alignment == FoVAlignment.ALTAZ
+    ):
+        warnings.warn(
+            "Future versions of gammapy will require the obstime keyword for this function",
+            DeprecationWarning,
+        )
+
+    return FoVCoordinates(pointing=pointing, obstime=obstime)
+
+
+def _get_fov_coords(
+    pointing, irf, geom, use_region_center=True, obstime=None, fov_coords=None
+):
+    if fov_coords is None:
+        fov_coords = _create_fov_coords(pointing=pointing, irf=irf, obstime=obstime)
+
+    return fov_coords.get_coords(
+        irf=irf, geom=geom, use_region_center=use_region_center
+    )
 
 
 def make_map_exposure_true_energy(
-    pointing, livetime, aeff, geom, use_region_center=True
+    pointing, livetime, aeff, geom, use_region_center=True, fov_coords=None
 ):
     """Compute exposure map.
 
@@ -123,6 +344,9 @@ def make_map_exposure_true_energy(
         For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
         If False, average over the whole region.
         Default is True.
+    fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+        Pre-computed field-of-view coordinates of the observation.
+        If given, ``pointing`` is ignored. Default is None.
 
     Returns
     -------
@@ -135,6 +359,7 @@ def make_map_exposure_true_energy(
         use_region_center=use_region_center,
         irf=aeff,
         obstime=None,
+        fov_coords=fov_coords,
     )
 
     coords["energy_true"] = broadcast_axis_values_to_geom(geom, "energy_true")
@@ -196,6 +421,8 @@ def make_map_background_irf(
     oversampling=None,
     use_region_center=True,
     obstime=None,
+    fov_coords=None,
+    max_memory="1 GB",
 ):
     """Compute background map from background IRFs.
 
@@ -212,6 +439,8 @@ def make_map_background_irf(
     ontime : `~astropy.units.Quantity`
         Observation ontime. i.e. not corrected for deadtime
         see https://gamma-astro-data-formats.readthedocs.io/en/latest/irfs/full_enclosure/bkg/index.html#notes)  # noqa: E501
+        For an array of ``obstime``, either the total ontime, which is split equally
+        between the times, or an array with the ontime of each time slice.
     bkg : `~gammapy.irf.Background3D`
         Background rate model.
     geom : `~gammapy.maps.WcsGeom`
@@ -223,22 +452,23 @@ def make_map_background_irf(
         If False, average over the whole region.
         Default is True.
     obstime : `~astropy.time.Time`
-        Observation time to use.
+        Observation time to use. If an array of times is given, the background
+        rate is evaluated at each time and summed, weighted by the ``ontime``.
+        This takes into account the rotation of the field-of-view during the
+        observation.
+    fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+        Pre-computed field-of-view coordinates of the observation.
+        If given, ``pointing`` and ``obstime`` are ignored. Default is None.
+    max_memory : `~astropy.units.Quantity` or str, optional
+        Approximate maximum memory used to evaluate the background at an array
+        of ``obstime``. All times are evaluated in one vectorized call if the memory
+        allows, otherwise in chunks of times. Default is "1 GB".
 
     Returns
     -------
     background : `~gammapy.maps.WcsNDMap`
         Background predicted counts sky cube in reconstructed energy.
     """
-    # TODO:
-    #  This implementation can be improved in two ways:
-    #  1. Create equal time intervals between TSTART and TSTOP and sum up the
-    #  background IRF for each interval. This is instead of multiplying by
-    #  the total ontime. This then handles the rotation of the FoV.
-    #  2. Use the pointing table (does not currently exist in CTA files) to
-    #  obtain the RA DEC and time for each interval. This then considers that
-    #  the pointing might change slightly over the observation duration
-
     # Get altaz coords for map
     if oversampling is not None:
         geom = geom.upsample(factor=oversampling, axis_name="energy")
@@ -252,17 +482,24 @@ def make_map_background_irf(
         image_geom = geom.to_image()
         d_omega = image_geom.solid_angle()
 
-    coords = _get_fov_coords(
-        pointing=pointing,
-        irf=bkg,
-        geom=geom,
-        use_region_center=use_region_center,
-        obstime=obstime,
+    if fov_coords is None:
+        fov_coords = _create_fov_coords(pointing=pointing, irf=bkg, obstime=obstime)
+
+    coords = fov_coords.get_coords(
+        irf=bkg, geom=geom, use_region_center=use_region_center
     )
-    coords["energy"] = broadcast_axis_values_to_geom(geom, "energy", False)
+    energy = broadcast_axis_values_to_geom(geom, "energy", False)
+    ontime = u.Quantity(ontime)
 
-    bkg_de = bkg.integrate_log_log(**coords, axis_name="energy")
-    data = (bkg_de * d_omega * ontime).to_value("")
+    if fov_coords.is_time_sliced:
+        bkg_de = _integrate_background_time_slices(
+            bkg=bkg, coords=coords, energy=energy, ontime=ontime, max_memory=max_memory
+        )
+    else:
+        bkg_de = bkg.integrate_log_log(**coords, energy=energy, axis_name="energy")
+        bkg_de = bkg_de * ontime
+
+    data = (bkg_de * d_omega).to_value("")
 
     if not use_region_center:
         region_coord, weights = geom.get_wcs_coord_and_weights()
@@ -276,7 +513,68 @@ def make_map_background_irf(
     return bkg_map
 
 
-def make_psf_map(psf, pointing, geom, exposure_map=None):
+def _get_time_slices(gti, n_slices):
+    """Split the time range of the GTIs into slices of equal duration.
+
+    Returns the mid times of the slices overlapping with the GTIs and the
+    ontime of each slice.
+    """
+    met_start, met_stop = gti.met_start.to_value("s"), gti.met_stop.to_value("s")
+    edges = np.linspace(met_start.min(), met_stop.max(), n_slices + 1)
+
+    overlap = np.minimum(edges[1:, np.newaxis], met_stop) - np.maximum(
+        edges[:-1, np.newaxis], met_start
+    )
+    ontime = np.clip(overlap, 0, None).sum(axis=1)
+
+    is_valid = ontime > 0
+    met_mid = 0.5 * (edges[:-1] + edges[1:])[is_valid]
+    return gti.time_ref + met_mid * u.s, ontime[is_valid] * u.s
+
+
+def _integrate_background_time_slices(bkg, coords, energy, ontime, max_memory):
+    """Integrate the background rate in energy and sum over time slices.
+
+    The coordinates have the time as first dimension, the time slices are
+    evaluated in chunks limited by ``max_memory``.
+    """
+    n_time = len(coords["fov_lon" if "fov_lon" in coords else "offset"])
+
+    if ontime.isscalar:
+        ontime = np.full(n_time, 1.0 / n_time) * ontime
+
+    # insert the energy dimensions after the time dimension
+    energy = energy[np.newaxis]
+    coords = {
+        key: value.reshape(
+            value.shape[:1] + (1,) * (energy.ndim - value.ndim) + value.shape[1:]
+        )
+        for key, value in coords.items()
+    }
+
+    shape = np.broadcast_shapes(*[value.shape[1:] for value in coords.values()])
+    shape = np.broadcast_shapes(shape, energy.shape[1:])
+
+    # coordinates and interpolated values of one time slice
+    nbytes = (len(bkg.axes) + 1) * np.prod(shape) * np.dtype(float).itemsize
+    max_memory = u.Quantity(max_memory).to_value("byte")
+    n_chunk = int(np.clip(max_memory // nbytes, 1, n_time))
+
+    bkg_de = 0
+    for idx in range(0, n_time, n_chunk):
+        time_slice = slice(idx, idx + n_chunk)
+        kwargs = {key: value[time_slice] for key, value in coords.items()}
+        data = bkg.evaluate(**kwargs, energy=energy, method="linear")
+
+        # integration moves the energy axis in front of the time axis
+        integral = trapz_loglog(data, energy, axis=1)
+        weights = ontime[time_slice].reshape((1, -1) + (1,) * (integral.ndim - 2))
+        bkg_de += np.sum(integral * weights, axis=1)
+
+    return bkg_de
+
+
+def make_psf_map(psf, pointing, geom, exposure_map=None, fov_coords=None):
     """Make a PSF map for a single observation.
 
     Expected axes : rad and true energy in this specific order.
@@ -294,6 +592,9 @@ def make_psf_map(psf, pointing, geom, exposure_map=None):
     exposure_map : `~gammapy.maps.Map`, optional
         The associated exposure map.
         Default is None.
+    fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+        Pre-computed field-of-view coordinates of the observation.
+        If given, ``pointing`` is ignored. Default is None.
 
     Returns
     -------
@@ -306,6 +607,7 @@ def make_psf_map(psf, pointing, geom, exposure_map=None):
         geom=geom,
         use_region_center=True,
         obstime=None,
+        fov_coords=fov_coords,
     )
 
     coords["energy_true"] = broadcast_axis_values_to_geom(geom, "energy_true")
@@ -320,7 +622,14 @@ def make_psf_map(psf, pointing, geom, exposure_map=None):
     return PSFMap(psf_map, exposure_map)
 
 
-def make_edisp_map(edisp, pointing, geom, exposure_map=None, use_region_center=True):
+def make_edisp_map(
+    edisp,
+    pointing,
+    geom,
+    exposure_map=None,
+    use_region_center=True,
+    fov_coords=None,
+):
     """Make an edisp map for a single observation.
 
     Expected axes : migra and true energy in this specific order.
@@ -342,13 +651,22 @@ def make_edisp_map(edisp, pointing, geom, exposure_map=None, use_region_center=T
         For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
         If False, average over the whole region.
         Default is True.
+    fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+        Pre-computed field-of-view coordinates of the observation.
+        If given, ``pointing`` is ignored. Default is None.
 
     Returns
     -------
     edispmap : `~gammapy.irf.EDispMap`
         The resulting energy dispersion map.
     """
-    coords = _get_fov_coords(pointing, edisp, geom, use_region_center=use_region_center)
+    coords = _get_fov_coords(
+        pointing=pointing,
+        irf=edisp,
+        geom=geom,
+        use_region_center=use_region_center,
+        fov_coords=fov_coords,
+    )
     coords["energy_true"] = broadcast_axis_values_to_geom(geom, "energy_true")
     coords["migra"] = broadcast_axis_values_to_geom(geom, "migra")
 
@@ -366,7 +684,7 @@ def make_edisp_map(edisp, pointing, geom, exposure_map=None, use_region_center=T
 
 
 def make_edisp_kernel_map(
-    edisp, pointing, geom, exposure_map=None, use_region_center=True
+    edisp, pointing, geom, exposure_map=None, use_region_center=True, fov_coords=None
 ):
     """Make an edisp kernel map for a single observation.
 
@@ -390,21 +708,15 @@ def make_edisp_kernel_map(
         For geom as a `~gammapy.maps.RegionGeom`. If True, consider the values at the region center.
         If False, average over the whole region.
         Default is True.
+    fov_coords : `~gammapy.makers.utils.FoVCoordinates`, optional
+        Pre-computed field-of-view coordinates of the observation.
+        If given, ``pointing`` is ignored. Default is None.
 
     Returns
     -------
     edispmap : `~gammapy.irf.EDispKernelMap`
         the resulting EDispKernel map
     """
-
-    coords = _get_fov_coords(
-        pointing=pointing,
-        irf=edisp,
-        geom=geom,
-        use_region_center=use_region_center,
-    )
-    coords["energy_true"] = geom.axes["energy_true"].edges.reshape((-1, 1, 1, 1))
-
     # Use EnergyDispersion2D migra axis.
     migra_axis = edisp.axes["migra"]
 
@@ -412,7 +724,12 @@ def make_edisp_kernel_map(
     new_geom = geom.to_image().to_cube([migra_axis, geom.axes["energy_true"]])
 
     edisp_map = make_edisp_map(
-        edisp, pointing, new_geom, exposure_map, use_region_center
+        edisp=edisp,
+        pointing=pointing,
+        geom=new_geom,
+        exposure_map=exposure_map,
+        use_region_center=use_region_center,
+        fov_coords=fov_coords,
     )
 
     return edisp_map.to_edisp_kernel_map(geom.axes["energy"])
@@ -554,6 +871,74 @@ def make_counts_rad_max(geom, rad_max, events):
     return counts
 
 
+def make_counts_regions(geoms, events):
+    """Make counts maps for several region geometries from a single event list.
+
+    The events are assigned to all circular regions, including the components
+    of compound regions, with a single spatial lookup of the event positions.
+    The counts of each geometry are then filled from its candidate events only.
+    Geometries with other region shapes are filled from the full event list.
+
+    Parameters
+    ----------
+    geoms : list of `~gammapy.maps.RegionGeom`
+        Reference region geometries.
+    events : `~gammapy.data.EventList`
+        Event list to be used to compute the counts.
+
+    Returns
+    -------
+    counts : list of `~gammapy.maps.RegionNDMap`
+        Counts maps, one per geometry.
+    """
+    centers, radii, idx_geoms = [], [], []
+
+    for idx, geom in enumerate(geoms):
+        regions = compound_region_to_regions(geom.region)
+
+        if all(isinstance(region, CircleSkyRegion) for region in regions):
+            for region in regions:
+                centers.append(region.center.icrs)
+                radii.append(region.radius)
+                idx_geoms.append(idx)
+
+    is_circle = np.zeros(len(geoms), dtype=bool)
+    is_circle[idx_geoms] = True
+    candidates = {}
+
+    if centers and len(events.table) > 0:
+        # the margin accounts for the projection used by the region containment,
+        # which is evaluated exactly when filling the candidate events
+        radii = 1.1 * Angle(radii)
+        idx_center, idx_event, separation, _ = search_around_sky(
+            SkyCoord(centers), events.radec.icrs, radii.max()
+        )
+        is_candidate = separation < radii[idx_center]
+        idx_geom = np.array(idx_geoms)[idx_center[is_candidate]]
+        idx_event = idx_event[is_candidate]
+
+        order = np.argsort(idx_geom, kind="stable")
+        idx_geom, idx_event = idx_geom[order], idx_event[order]
+        bounds = np.searchsorted(idx_geom, np.arange(len(geoms) + 1))
+
+        for idx in np.unique(idx_geom):
+            candidates[idx] = np.unique(idx_event[bounds[idx] : bounds[idx + 1]])
+
+    counts = []
+
+    for idx, geom in enumerate(geoms):
+        counts_geom = Map.from_geom(geom)
+
+        if idx in candidates:
+            counts_geom.fill_events(events.select_row_subset(candidates[idx]))
+        elif not is_circle[idx]:
+            counts_geom.fill_events(events)
+
+        counts.append(counts_geom)
+
+    return counts
+
+
 def make_counts_off_rad_max(geom_off, rad_max, events):
     """Extract the OFF counts from a list of point regions and given rad max.
 
@@ -589,6 +974,70 @@ def make_counts_off_rad_max(geom_off, rad_max, events):
     return counts_off
 
 
+def _get_aligned_cutout_slices(parent_geom, geom):
+    """Slices of the parent image data covered by an aligned geometry.
+
+    Returns None if the image of the geometry is not on the pixel grid of the
+    parent image or not fully contained within it.
+    """
+    if not (
+        isinstance(geom, WcsGeom)
+        and isinstance(parent_geom, WcsGeom)
+        and parent_geom.is_image
+        and geom.is_regular
+    ):
+        return None
+
+    if not parent_geom.is_aligned(geom.to_image()):
+        return None
+
+    offset = np.round(parent_geom.wcs.wcs.crpix - geom.wcs.wcs.crpix).astype(int)
+    ny, nx = geom.data_shape[-2:]
+    ny_parent, nx_parent = parent_geom.data_shape
+
+    ix, iy = offset
+    if ix < 0 or iy < 0 or ix + nx > nx_parent or iy + ny > ny_parent:
+        return None
+
+    return slice(iy, iy + ny), slice(ix, ix + nx)
+
+
+def make_exclusion_mask_cutout(exclusion_mask, geom, fill_value=False):
+    """Cut out or reproject a global exclusion mask onto a given geometry.
+
+    If the geometry is on the pixel grid of the exclusion mask and fully
+    contained within it, the returned mask data is a read-only view on the
+    exclusion mask data, broadcast to the geometry shape. This avoids
+    reprojecting the same global exclusion mask for every observation.
+    Otherwise the exclusion mask is reprojected using
+    `~gammapy.maps.Map.interp_to_geom`.
+
+    Parameters
+    ----------
+    exclusion_mask : `~gammapy.maps.WcsNDMap`
+        Global exclusion mask.
+    geom : `~gammapy.maps.WcsGeom`
+        Target geometry.
+    fill_value : bool, optional
+        Value for pixels outside the exclusion mask, used when reprojecting.
+        Default is False.
+
+    Returns
+    -------
+    mask : `~gammapy.maps.WcsNDMap`
+        Exclusion mask on the target geometry. The data is read-only if it is
+        a view on the global exclusion mask, use `~gammapy.maps.Map.copy` to
+        modify it.
+    """
+    slices = _get_aligned_cutout_slices(exclusion_mask.geom, geom)
+
+    if slices is None:
+        return exclusion_mask.interp_to_geom(geom=geom, fill_value=fill_value)
+
+    data = np.broadcast_to(exclusion_mask.data[slices], geom.data_shape)
+    return Map.from_geom(geom=geom, data=data, unit=exclusion_mask.unit)
+
+
 def make_observation_time_map(observations, geom, offset_max=None):
     """
     Compute the total observation time on the target geometry
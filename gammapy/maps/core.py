@@ -119,6 +119,11 @@ class Map(abc.ABC):
 
         self._data = value
 
+    def _ensure_writeable(self):
+        """Copy read-only data, such as a shared view, before writing in place."""
+        if not self._data.flags.writeable:
+            self._data = self._data.copy()
+
     @property
     def unit(self):
         """Map unit as an `~astropy.units.Unit` object."""
@@ -305,7 +310,14 @@ class Map(abc.ABC):
 
     @staticmethod
     def from_hdulist(
-        hdulist, hdu=None, hdu_bands=None, map_type="auto", format=None, colname=None
+        hdulist,
+        hdu=None,
+        hdu_bands=None,
+        map_type="auto",
+        format=None,
+        colname=None,
+        slices=None,
+        cutout=None,
     ):
         """Create from a `astropy.io.fits.HDUList` object.
 
@@ -323,24 +335,53 @@ class Map(abc.ABC):
             FITS format convention. Default is None.
         colname : str, optional
             Data column name to be used for HEALPix map. Default is None.
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs,
+            see `Map.slice_by_idx`. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to the ``cutout`` method of the map.
+            Default is None.
 
         Returns
         -------
         map_out : `Map`
             Map object.
+
+        Notes
+        -----
+        For WCS maps stored as images, only the part of the data selected by
+        ``slices`` and ``cutout`` is read from the file. Other map types are
+        read entirely and sliced afterwards.
         """
         if map_type == "auto":
             map_type = Map._get_map_type(hdulist, hdu)
         cls_out = Map._get_map_cls(map_type)
-        if map_type == "hpx":
+        if map_type == "wcs":
             return cls_out.from_hdulist(
+                hdulist,
+                hdu=hdu,
+                hdu_bands=hdu_bands,
+                format=format,
+                slices=slices,
+                cutout=cutout,
+            )
+        elif map_type == "hpx":
+            map_out = cls_out.from_hdulist(
                 hdulist, hdu=hdu, hdu_bands=hdu_bands, format=format, colname=colname
             )
         else:
-            return cls_out.from_hdulist(
+            map_out = cls_out.from_hdulist(
                 hdulist, hdu=hdu, hdu_bands=hdu_bands, format=format
             )
 
+        if slices is not None:
+            map_out = map_out.slice_by_idx(slices=slices)
+
+        if cutout is not None:
+            map_out = map_out.cutout(**cutout)
+
+        return map_out
+
     @staticmethod
     def _get_meta_from_header(header):
         """Load metadata from a FITS header."""
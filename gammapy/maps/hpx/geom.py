@@ -1,11 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utilities for dealing with HEALPix projections and mappings."""
 import copy
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.units import Quantity
+from astropy.utils import lazyproperty
 from gammapy.utils.array import is_power2
 from ..axes import MapAxes
 from ..coord import MapCoord, skycoord_to_lonlat
@@ -29,6 +33,20 @@ from .utils import (
 # HPX_FITS_CONVENTIONS, HpxConv
 __all__ = ["HpxGeom"]
 
+# maximum ratio of the size of the dense global to local lookup table and the
+# number of pixels in the geometry, above which a sorted search is used
+DENSE_LOOKUP_MAX_RATIO = 32
+
+# maximum total size in bytes of the cached results of `HpxGeom.interp_weights`
+INTERP_WEIGHTS_CACHE_MAX_BYTES = 16 * 1024**2
+
+
+@lru_cache(maxsize=32)
+def _get_index_list_cached(nside, nest, region):
+    ilist = HpxGeom._get_index_list(nside, nest, region)
+    ilist.flags.writeable = False
+    return ilist
+
 
 class HpxGeom(Geom):
     """Geometry class for HEALPix maps.
@@ -96,7 +114,7 @@ class HpxGeom(Geom):
         """Create local-to-global pixel lookup table."""
         if isinstance(region, str):
             ipix = [
-                self.get_index_list(nside, self._nest, region)
+                _get_index_list_cached(int(nside), self._nest, region)
                 for nside in self._nside.flat
             ]
 
@@ -137,6 +155,57 @@ class HpxGeom(Geom):
         else:
             raise ValueError(f"Invalid region string: {region!r}")
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # the lookup tables and caches are recreated on demand
+        state.pop("_global_lookup", None)
+        state.pop("_interp_weights_cache", None)
+        state.pop("_interp_weights_nbytes", None)
+        return state
+
+    @lazyproperty
+    def _global_lookup(self):
+        """Dense global to local pixel lookup table.
+
+        None if the geometry covers only a small fraction of the sky, in this
+        case the local index is found by a sorted search in the pixel list.
+        """
+        if len(self._ipix) == 0:
+            return None
+
+        npix_global = int(self._ipix.max()) + 1
+
+        if npix_global > DENSE_LOOKUP_MAX_RATIO * len(self._ipix):
+            return None
+
+        lookup = np.full(npix_global, INVALID_INDEX.int, dtype="i")
+        lookup[self._ipix] = np.arange(len(self._ipix), dtype="i")
+        return lookup
+
+    @lazyproperty
+    def _interp_weights_cache(self):
+        return OrderedDict()
+
+    def _lookup_local(self, idx):
+        """Position of global indices in the pixel list, -1 if not contained."""
+        idx = np.asarray(idx)
+        lookup = self._global_lookup
+
+        if lookup is not None:
+            retval = lookup.take(idx, mode="clip")
+            retval[(idx < 0) | (idx >= len(lookup))] = INVALID_INDEX.int
+            return retval
+
+        retval = np.full(idx.shape, INVALID_INDEX.int, dtype="i")
+
+        if len(self._ipix) > 0:
+            pos = np.searchsorted(self._ipix, idx)
+            pos = np.clip(pos, 0, len(self._ipix) - 1)
+            valid = self._ipix[pos] == idx
+            retval[valid] = pos[valid]
+
+        return retval
+
     def local_to_global(self, idx_local):
         """Compute a global index (all-sky) from a local (partial-sky) index.
 
@@ -153,6 +222,10 @@ class HpxGeom(Geom):
         if self._ipix is None:
             return idx_local
 
+        if self.is_regular:
+            # the pixel list contains the HEALPix indices of the image plane
+            return (self._ipix[idx_local[0]],) + tuple(idx_local[1:])
+
         if self.nside.size > 1:
             idx = ravel_hpx_index(idx_local, self._npix)
         else:
@@ -192,10 +265,7 @@ class HpxGeom(Geom):
             idx = ravel_hpx_index(idx_global, self.npix_max)
 
         if self._ipix is not None:
-            retval = np.full(idx.size, -1, "i")
-            m = np.isin(idx.flat, self._ipix)
-            retval[m] = np.searchsorted(self._ipix, idx.flat[m])
-            retval = retval.reshape(idx.shape)
+            retval = self._lookup_local(idx)
         else:
             retval = idx
 
@@ -487,6 +557,11 @@ class HpxGeom(Geom):
     def interp_weights(self, coords, idxs=None):
         """Get interpolation weights for given coordinates.
 
+        The weights of the last few coordinate sets are cached, up to a total
+        size of ``INTERP_WEIGHTS_CACHE_MAX_BYTES``, so that repeated
+        interpolation at the same coordinates is fast. The weights are not
+        cached if ``idxs`` is given.
+
         Parameters
         ----------
         coords : `MapCoord` or dict
@@ -500,10 +575,53 @@ class HpxGeom(Geom):
         weights : `~numpy.ndarray`
             Interpolation weights.
         """
-        import healpy as hp
-
         coords = MapCoord.create(coords, frame=self.frame).broadcasted
 
+        if idxs is not None:
+            return self._interp_weights(coords, idxs=idxs)
+
+        key = self._interp_weights_key(coords)
+        cache = self._interp_weights_cache
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        pix_local, wts = self._interp_weights(coords)
+        nbytes = sum(array.nbytes for array in pix_local + [wts])
+
+        if nbytes > INTERP_WEIGHTS_CACHE_MAX_BYTES:
+            return pix_local, wts
+
+        for array in pix_local + [wts]:
+            array.flags.writeable = False
+
+        cache[key] = pix_local, wts
+        self._interp_weights_nbytes = getattr(self, "_interp_weights_nbytes", 0)
+        self._interp_weights_nbytes += nbytes
+
+        while self._interp_weights_nbytes > INTERP_WEIGHTS_CACHE_MAX_BYTES:
+            _, (pix_cached, wts_cached) = cache.popitem(last=False)
+            for array in pix_cached + [wts_cached]:
+                self._interp_weights_nbytes -= array.nbytes
+
+        return pix_local, wts
+
+    @staticmethod
+    def _interp_weights_key(coords):
+        digest = hashlib.blake2b(digest_size=16)
+
+        for name in coords.axis_names:
+            value = coords[name]
+            digest.update(str(getattr(value, "unit", "")).encode())
+            digest.update(np.ascontiguousarray(u.Quantity(value).value))
+
+        return digest.digest(), coords.shape
+
+    def _interp_weights(self, coords, idxs=None):
+        """Get interpolation weights, see `HpxGeom.interp_weights`."""
+        import healpy as hp
+
         if idxs is None:
             idxs = self.coord_to_idx(coords, clip=True)[1:]
 
@@ -1021,6 +1139,8 @@ class HpxGeom(Geom):
     def get_index_list(nside, nest, region):
         """Get list of pixels indices for all the pixels in a region.
 
+        The pixel lists are cached for repeated calls with the same arguments.
+
         Parameters
         ----------
         nside : int
@@ -1035,6 +1155,10 @@ class HpxGeom(Geom):
         ilist : `~numpy.ndarray`
             List of pixel indices.
         """
+        return _get_index_list_cached(int(nside), nest, region).copy()
+
+    @staticmethod
+    def _get_index_list(nside, nest, region):
         import healpy as hp
 
         # TODO: this should return something more friendly than a tuple
@@ -1239,69 +1363,50 @@ class HpxGeom(Geom):
 
         # Non-regular all-sky
         elif self.is_allsky and not self.is_regular:
+            shape_img = (1,) * len(self.axes)
 
-            shape = (np.max(self.npix),)
             if idx is None:
-                shape = shape + self.shape_axes
+                npix = self._npix
+                idx_img = np.indices(self.shape_axes)
             else:
-                shape = shape + (1,) * len(self.axes)
-            pix = [np.full(shape, -1, dtype=int) for i in range(1 + len(self.axes))]
-            for idx_img in np.ndindex(self.shape_axes):
+                npix = self._npix[tuple(idx)].reshape(shape_img)
+                idx_img = [np.full(shape_img, t) for t in idx]
 
-                if idx is not None and idx_img != idx:
-                    continue
+            idx_pix = np.arange(np.max(self.npix)).reshape((-1,) + shape_img)
+            valid = idx_pix < npix
 
-                npix = self._npix[idx_img]
-                if idx is None:
-                    s_img = (slice(0, npix),) + idx_img
-                else:
-                    s_img = (slice(0, npix),) + (0,) * len(self.axes)
-
-                pix[0][s_img] = np.arange(self._npix[idx_img])
-                for j in range(len(self.axes)):
-                    pix[j + 1][s_img] = idx_img[j]
+            pix = [np.where(valid, idx_pix, -1)]
+            pix += [np.where(valid, t, -1) for t in idx_img]
             pix = [p.T for p in pix]
 
         # Explicit pixel indices
         else:
+            npix_sum = np.concatenate(([0], np.cumsum(self._npix)))
 
             if idx is not None:
-                npix_sum = np.concatenate(([0], np.cumsum(self._npix)))
                 idx_ravel = np.ravel_multi_index(idx, self.shape_axes)
                 s = slice(npix_sum[idx_ravel], npix_sum[idx_ravel + 1])
             else:
-                s = slice(None)
+                s = slice(0, len(self._ipix))
+
             pix_flat = unravel_hpx_index(self._ipix[s], self.npix_max)
 
+            # position of the pixels within their image plane
+            idx_ravel = np.ravel_multi_index(pix_flat[1:], self.shape_axes)
+            idx_pix = np.arange(s.start, s.stop) - npix_sum[idx_ravel]
+
             shape = (np.max(self.npix),)
             if idx is None:
                 shape = shape + self.shape_axes
+                s_img = (idx_pix,) + tuple(pix_flat[1:])
             else:
                 shape = shape + (1,) * len(self.axes)
-            pix = [np.full(shape, -1, dtype=int) for _ in range(1 + len(self.axes))]
-
-            for idx_img in np.ndindex(self.shape_axes):
-
-                if idx is not None and idx_img != idx:
-                    continue
+                s_img = (idx_pix,) + (0,) * len(self.axes)
 
-                npix = int(self._npix[idx_img].item())
-                if idx is None:
-                    s_img = (slice(0, npix),) + idx_img
-                else:
-                    s_img = (slice(0, npix),) + (0,) * len(self.axes)
-
-                if self.axes:
-                    m = np.all(
-                        np.stack([pix_flat[i + 1] == t for i, t in enumerate(idx_img)]),
-                        axis=0,
-                    )
-                    pix[0][s_img] = pix_flat[0][m]
-                else:
-                    pix[0][s_img] = pix_flat[0]
+            pix = [np.full(shape, -1, dtype=int) for _ in range(1 + len(self.axes))]
 
-                for j in range(len(self.axes)):
-                    pix[j + 1][s_img] = idx_img[j]
+            for p, t in zip(pix, pix_flat):
+                p[s_img] = t
 
             pix = [p.T for p in pix]
 
@@ -1,6 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
 import logging
+from collections import OrderedDict
 import numpy as np
+import scipy.sparse
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
@@ -14,12 +17,74 @@ from ..utils import INVALID_INDEX
 from .core import HpxMap
 from .geom import HpxGeom
 from .io import HPX_FITS_CONVENTIONS, HpxConv
-from .utils import HpxToWcsMapping, get_pix_size_from_nside, get_superpixels
+from .utils import (
+    HpxToWcsMapping,
+    get_neighbour_pairs,
+    get_pix_size_from_nside,
+    get_superpixels,
+)
 
 __all__ = ["HpxNDMap"]
 
 log = logging.getLogger(__name__)
 
+# relative value of the window function below which multipoles are dropped
+HARMONIC_WINDOW_TOLERANCE = 1e-6
+
+# maximum number of neighbour pairs for the automatic choice of the sparse
+# convolution
+SPARSE_CONVOLUTION_MAX_PAIRS = 20_000_000
+
+# cache of the neighbour lists used by the sparse convolution
+_NEIGHBOURS_CACHE_SIZE = 4
+_NEIGHBOURS_CACHE = OrderedDict()
+
+
+def _get_neighbours_cached(geom, radius):
+    """Neighbour pairs of the pixels of a single nside geometry, cached.
+
+    Returns
+    -------
+    idx_source, idx_target : `~numpy.ndarray`
+        Local pixel indices of all source pixels, and of the target pixels
+        contained in the geometry.
+    separation : `~numpy.ndarray`
+        Angular distance between all source and target pixels in radians.
+    valid : `~numpy.ndarray`
+        Mask of the pairs with the target pixel contained in the geometry.
+    """
+    geom = geom.to_image()
+    nside, nest = geom.nside.item(), geom.nest
+
+    if geom.is_allsky:
+        ipix = np.arange(geom.npix.item())
+    else:
+        ipix = np.asarray(geom._ipix)
+
+    digest = hashlib.blake2b(ipix.astype(np.int64), digest_size=16).digest()
+    key = (nside, nest, digest, float(radius))
+
+    if key in _NEIGHBOURS_CACHE:
+        _NEIGHBOURS_CACHE.move_to_end(key)
+        return _NEIGHBOURS_CACHE[key]
+
+    idx_source, ipix_target, separation = get_neighbour_pairs(
+        nside=nside, ipix=ipix, radius=radius, nest=nest
+    )
+
+    sorter = np.argsort(ipix)
+    idx = np.searchsorted(ipix, ipix_target, sorter=sorter)
+    idx = sorter[np.clip(idx, 0, len(ipix) - 1)]
+    valid = ipix[idx] == ipix_target
+
+    value = (idx_source, idx[valid], separation, valid)
+    _NEIGHBOURS_CACHE[key] = value
+
+    while len(_NEIGHBOURS_CACHE) > _NEIGHBOURS_CACHE_SIZE:
+        _NEIGHBOURS_CACHE.popitem(last=False)
+
+    return value
+
 
 class HpxNDMap(HpxMap):
     """HEALPix map with any number of non-spatial dimensions.
@@ -445,6 +510,8 @@ class HpxNDMap(HpxMap):
                 raise ValueError("Incompatible spatial geoms between map and weights")
             data = data * weights.data
 
+        self._ensure_writeable()
+
         if idx is None:
             self.data += data
         else:
@@ -541,9 +608,6 @@ class HpxNDMap(HpxMap):
     def convolve(self, kernel, convolution_method="wcs-tan", **kwargs):
         """Convolve map with a WCS kernel.
 
-        Project the map into a WCS geometry, convolve with a WCS kernel and
-        project back into the initial HEALPix geometry.
-
         If the kernel is two-dimensional, it is applied to all image planes likewise.
         If the kernel is higher dimensional it must match the map in the number of
         dimensions and the corresponding kernel is selected for every image plane.
@@ -553,10 +617,16 @@ class HpxNDMap(HpxMap):
         kernel : `~gammapy.irf.PSFKernel`
             Convolution kernel. The pixel size must be upsampled by a factor 2 or bigger
             with respect to the input map to prevent artifacts in the projection.
-        convolution_method : {"wcs-tan", ""}
+        convolution_method : {"wcs-tan", "harmonic", "sparse", "auto", ""}
             Convolution method. If "wcs-tan", project on WCS geometry and
             convolve with WCS kernel. See `~gammapy.maps.HpxNDMap.convolve_wcs`.
-            If "", convolve map with a symmetrical WCS kernel. See `~gammapy.maps.HpxNDMap.convolve_full`.
+            If "harmonic" (or ""), convolve in spherical harmonic space with the
+            window function of the radial kernel profile.
+            See `~gammapy.maps.HpxNDMap.convolve_full`. If "sparse", convolve
+            with the radial kernel profile evaluated on the HEALPix neighbours
+            of every pixel. See `~gammapy.maps.HpxNDMap.convolve_sparse`.
+            If "auto", use "sparse" if the number of neighbour pairs is below
+            ``SPARSE_CONVOLUTION_MAX_PAIRS`` and "harmonic" otherwise.
             Default is "wcs-tan".
         **kwargs : dict
             Keyword arguments passed to `~gammapy.maps.WcsNDMap.convolve`.
@@ -566,15 +636,38 @@ class HpxNDMap(HpxMap):
         map : `HpxNDMap`
             Convolved map.
         """
+        if convolution_method == "auto":
+            convolution_method = self._get_convolution_method(kernel)
+
         if convolution_method == "wcs-tan":
             return self.convolve_wcs(kernel, **kwargs)
-        elif convolution_method == "":
+        elif convolution_method in ["harmonic", ""]:
             return self.convolve_full(kernel)
+        elif convolution_method == "sparse":
+            return self.convolve_sparse(kernel)
         else:
             raise ValueError(
                 f"Not a valid method for HPX convolution: {convolution_method}"
             )
 
+    def _get_convolution_method(self, kernel):
+        """Choose between the sparse and harmonic convolution."""
+        import healpy as hp
+
+        if len(self.geom.nside) > 1:
+            return "wcs-tan"
+
+        radius = np.max(kernel.psf_kernel_map.geom.width) / 2
+        n_neighbours = np.pi * radius.to_value("rad") ** 2
+        n_neighbours /= hp.nside2pixarea(self.geom.nside.item())
+
+        n_pairs = n_neighbours * self.geom.to_image().npix.item()
+
+        if n_pairs < SPARSE_CONVOLUTION_MAX_PAIRS:
+            return "sparse"
+
+        return "harmonic"
+
     def convolve_wcs(self, kernel, **kwargs):
         """Convolve map with a WCS kernel.
 
@@ -649,7 +742,9 @@ class HpxNDMap(HpxMap):
 
         Extract the radial profile of the kernel (assuming radial symmetry) and
         convolve via `~healpy.sphtfunc.smoothing`. Since no projection is applied, this is
-        suited for full-sky and large maps.
+        suited for full-sky and large maps. The window function of every kernel
+        plane is computed once and the harmonic transforms are truncated at the
+        multipole where the window function becomes negligible.
 
         If the kernel is two-dimensional, it is applied to all image planes likewise.
         If the kernel is higher dimensional it must match the map in the number of
@@ -677,24 +772,149 @@ class HpxNDMap(HpxMap):
         nside = self.geom.nside.item()
         lmax = int(3 * nside - 1)  # maximum l of the power spectrum
         nest = self.geom.nest
-        allsky = self.geom.is_allsky
         ipix = self.geom._ipix
 
-        if not allsky:
+        m = self._broadcast_to_kernel(kernel)
+
+        if not self.geom.is_allsky:
             # stack into an all sky map
             full_sky_geom = HpxGeom.create(
-                nside=self.geom.nside,
-                nest=self.geom.nest,
-                frame=self.geom.frame,
-                axes=self.geom.axes,
+                nside=m.geom.nside,
+                nest=m.geom.nest,
+                frame=m.geom.frame,
+                axes=m.geom.axes,
             )
             full_sky_map = HpxNDMap.from_geom(full_sky_geom)
-            for img, idx in self.iter_by_image_data():
+            for img, idx in m.iter_by_image_data():
                 full_sky_map.data[idx][ipix] = img
         else:
-            full_sky_map = self
+            full_sky_map = m
+
+        angles, values = self._get_kernel_radial_profile(kernel)
+        windows = {}
+
+        # Do the convolution in each image plane
+        convolved_data = np.empty(m.data.shape, dtype=float)
+        for img, idx in full_sky_map.iter_by_image_data():
+            img = img.astype(float)
+            if nest:
+                # reorder to ring to do the convolution
+                img = hp.pixelfunc.reorder(img, n2r=True)
+
+            idx_kernel = idx if values.ndim > 1 else ()
+
+            if idx_kernel not in windows:
+                radial_profile = values[(Ellipsis,) + idx_kernel]
+                window_beam = hp.sphtfunc.beam2bl(radial_profile, angles, lmax)
+                window_beam = window_beam / window_beam.max()
+                # truncate where the window function is negligible
+                significant = np.abs(window_beam) > HARMONIC_WINDOW_TOLERANCE
+                lmax_window = max(np.flatnonzero(significant)[-1], 1)
+                windows[idx_kernel] = window_beam[: lmax_window + 1]
+
+            window_beam = windows[idx_kernel]
+            data = hp.sphtfunc.smoothing(
+                img, beam_window=window_beam, pol=False, lmax=len(window_beam) - 1
+            )
+            if nest:
+                # reorder back to nest after the convolution
+                data = hp.pixelfunc.reorder(data, r2n=True)
+
+            convolved_data[idx] = data[ipix]
+        return m._init_copy(data=convolved_data)
+
+    def convolve_sparse(self, kernel):
+        """Convolve map with a symmetrical WCS kernel using HEALPix neighbours.
+
+        Extract the radial profile of the kernel (assuming radial symmetry) and
+        evaluate it at the angular distances between every pixel and all pixels
+        within the kernel radius. The convolution is then a sparse matrix
+        product per image plane. The neighbour lists are cached, so repeated
+        convolutions of maps with the same geometry are fast. This is suited
+        for small kernels and maps with a large nside.
+
+        The kernel is normalized on the HEALPix grid for every source pixel,
+        flux leaving the map is lost. The kernel radius should span several
+        HEALPix pixels, otherwise the profile is poorly sampled.
 
-        # Get radial profile from the kernel
+        If the kernel is two-dimensional, it is applied to all image planes likewise.
+        If the kernel is higher dimensional it must match the map in the number of
+        dimensions and the corresponding kernel is selected for every image plane.
+
+        Parameters
+        ----------
+        kernel : `~gammapy.irf.PSFKernel`
+            Convolution kernel.
+
+        Returns
+        -------
+        map : `HpxNDMap`
+            Convolved map.
+        """
+        if len(self.geom.nside) > 1:
+            raise NotImplementedError(
+                "convolve_sparse() is not supported for an irregular map."
+            )
+
+        m = self._broadcast_to_kernel(kernel)
+
+        angles, values = self._get_kernel_radial_profile(kernel)
+
+        idx_source, idx_target, separation, valid = _get_neighbours_cached(
+            m.geom, radius=angles[-1]
+        )
+
+        npix = m.geom.to_image().npix.item()
+        structure = None
+        convolved_data = np.empty(m.data.shape, dtype=float)
+
+        for img, idx in m.iter_by_image_data():
+            idx_kernel = idx if values.ndim > 1 else ()
+            radial_profile = values[(Ellipsis,) + idx_kernel]
+
+            weights = np.interp(separation, angles, radial_profile, right=0)
+            norm = np.bincount(idx_source, weights=weights, minlength=npix)
+            weights = (weights / norm[idx_source])[valid]
+
+            if structure is None:
+                matrix = scipy.sparse.csr_matrix(
+                    (weights, (idx_target, idx_source[valid])), shape=(npix, npix)
+                )
+                matrix.sum_duplicates()
+                order = np.lexsort((idx_source[valid], idx_target))
+                structure = (order, matrix.indices, matrix.indptr)
+            else:
+                order, indices, indptr = structure
+                matrix = scipy.sparse.csr_matrix(
+                    (weights[order], indices, indptr), shape=(npix, npix)
+                )
+
+            convolved_data[idx] = matrix @ img.astype(float)
+
+        return m._init_copy(data=convolved_data)
+
+    def _broadcast_to_kernel(self, kernel):
+        """Broadcast an image to the non-spatial axes of a 3D kernel."""
+        geom_kernel = kernel.psf_kernel_map.geom
+
+        if self.geom.is_image and not geom_kernel.is_image:
+            geom = self.geom.to_cube(geom_kernel.axes)
+            data = np.broadcast_to(self.data, geom.data_shape)
+            return self._init_copy(geom=geom, data=data)
+
+        return self
+
+    @staticmethod
+    def _get_kernel_radial_profile(kernel):
+        """Radial profile of a kernel, assuming radial symmetry.
+
+        Returns
+        -------
+        angles : `~numpy.ndarray`
+            Increasing angular distances from the kernel center in radians.
+        values : `~numpy.ndarray`
+            Kernel values, with the non-spatial axes of the kernel last.
+        """
         psf_kernel = kernel.psf_kernel_map
 
         center_pix = psf_kernel.geom.center_pix[:2]
@@ -710,28 +930,7 @@ class HpxNDMap(HpxMap):
         coordinates = SkyCoord(coords[0], coords[1], frame=psf_kernel.geom.frame)
         angles = coordinates.separation(psf_kernel.geom.center_skydir).rad
         values = psf_kernel.get_by_pix(pixels)
-
-        # Do the convolution in each image plane
-        convolved_data = np.empty(self.data.shape, dtype=float)
-        for img, idx in full_sky_map.iter_by_image_data():
-            img = img.astype(float)
-            if nest:
-                # reorder to ring to do the convolution
-                img = hp.pixelfunc.reorder(img, n2r=True)
-            radial_profile = np.reshape(values[:, idx], (values.shape[0],))
-            window_beam = hp.sphtfunc.beam2bl(
-                np.flip(radial_profile), np.flip(angles), lmax
-            )
-            window_beam = window_beam / window_beam.max()
-            data = hp.sphtfunc.smoothing(
-                img, beam_window=window_beam, pol=False, lmax=lmax
-            )
-            if nest:
-                # reorder back to nest after the convolution
-                data = hp.pixelfunc.reorder(data, r2n=True)
-
-            convolved_data[idx] = data[ipix]
-        return self._init_copy(data=convolved_data)
+        return np.flip(angles), np.flip(values, axis=0)
 
     def get_by_idx(self, idx):
         # inherited docstring
@@ -748,30 +947,33 @@ class HpxNDMap(HpxMap):
 
         val = np.zeros(pix[0].shape[1:])
 
+        idxs, fractions = [], []
+        for ax in self.geom.axes:
+            idx = ax.coord_to_idx(coords[ax.name])
+            idx = np.clip(idx, 0, len(ax.center) - 2)
+
+            w = ax.center[idx + 1] - ax.center[idx]
+            c = u.Quantity(coords[ax.name], ax.center.unit, copy=COPY_IF_NEEDED).value
+
+            idxs.append(idx)
+            fractions.append((c - ax.center[idx].value) / w.value)
+
         # Loop over function values at corners
         for i in range(2 ** len(self.geom.axes)):
             pix_i = []
             wt = np.ones(pix[0].shape[1:])[np.newaxis, ...]
-            for j, ax in enumerate(self.geom.axes):
-                idx = ax.coord_to_idx(coords[ax.name])
-                idx = np.clip(idx, 0, len(ax.center) - 2)
-
-                w = ax.center[idx + 1] - ax.center[idx]
-                c = u.Quantity(
-                    coords[ax.name], ax.center.unit, copy=COPY_IF_NEEDED
-                ).value
-
+            for j, (idx, fraction) in enumerate(zip(idxs, fractions)):
                 if i & (1 << j):
-                    wt *= (c - ax.center[idx].value) / w.value
+                    wt *= fraction
                     pix_i += [idx + 1]
                 else:
-                    wt *= 1.0 - (c - ax.center[idx].value) / w.value
+                    wt *= 1.0 - fraction
                     pix_i += [idx]
 
             if not self.geom.is_regular:
                 pix, wts = self.geom.interp_weights(coords, idxs=pix_i)
 
-            wts[pix[0] == INVALID_INDEX.int] = 0
+            wts = np.where(pix[0] == INVALID_INDEX.int, 0, wts)
             wt[~np.isfinite(wt)] = 0
             val += np.nansum(wts * wt * self.data.T[tuple(pix[:1] + pix_i)], axis=0)
 
@@ -797,6 +999,7 @@ class HpxNDMap(HpxMap):
         weights = np.bincount(idx_inv, weights=weights)
         if not preserve_counts:
             weights /= np.bincount(idx_inv).astype(self.data.dtype)
+        self._ensure_writeable()
         self.data.T.flat[idx_local] += weights
 
     def fill_by_idx(self, idx, weights=None):
@@ -805,6 +1008,7 @@ class HpxNDMap(HpxMap):
     def set_by_idx(self, idx, vals):
         idx = pix_tuple_to_idx(idx)
         idx_local = self.geom.global_to_local(idx)
+        self._ensure_writeable()
         self.data.T[idx_local] = vals
 
     def _make_cols(self, header, conv):
@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pickle
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -7,8 +8,10 @@ from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from regions import CircleSkyRegion
 from gammapy.maps import HpxGeom, MapAxis, MapCoord
+from gammapy.maps.hpx import geom as hpx_geom
 from gammapy.maps.hpx.utils import (
     HpxToWcsMapping,
+    get_neighbour_pairs,
     get_pix_size_from_nside,
     get_subpixels,
     get_superpixels,
@@ -856,3 +859,102 @@ def test_hpx_geom_separation():
 def test_check_nside():
     with pytest.raises(ValueError):
         HpxGeom.create(nside=3)
+
+
+@pytest.mark.parametrize("nside", [16, [8, 16, 32]])
+def test_hpx_global_to_local_lookup(nside, monkeypatch):
+    from gammapy.maps.hpx import geom as hpx_geom
+
+    axis = MapAxis.from_edges([0, 1, 2, 3], name="x")
+    kwargs = dict(nside=nside, nest=True, region="DISK(110.,75.,30.)", axes=[axis])
+
+    geom_dense = HpxGeom(**kwargs)
+    assert geom_dense._global_lookup is not None
+
+    monkeypatch.setattr(hpx_geom, "DENSE_LOOKUP_MAX_RATIO", 1)
+    geom_sorted = HpxGeom(**kwargs)
+    assert geom_sorted._global_lookup is None
+
+    idx = geom_dense.get_idx(flat=True)
+    idx_global = (np.arange(-1, 4000), np.arange(-1, 4000) % 3)
+
+    for idx_test in [idx, idx_global]:
+        expected = geom_sorted.global_to_local(idx_test, ravel=True)
+        assert_allclose(geom_dense.global_to_local(idx_test, ravel=True), expected)
+
+    idx_local = geom_dense.global_to_local(idx)
+    assert_allclose(geom_dense.local_to_global(idx_local), idx)
+
+
+def test_hpx_geom_interp_weights_cache():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = HpxGeom.create(nside=32, region="DISK(0,0,10)", axes=[axis])
+
+    coords = {"lon": [0, 1, 25], "lat": [0, 2, 0], "energy": [2, 3, 4] * u.TeV}
+
+    pix, wts = geom.interp_weights(coords)
+    pix_cached, wts_cached = geom.interp_weights(coords)
+
+    assert wts_cached is wts
+    assert not wts.flags.writeable
+    assert_allclose(wts.sum(axis=0), 1)
+
+    coords["lon"] = [0, 1, 2]
+    pix_new, wts_new = geom.interp_weights(coords)
+    assert wts_new is not wts
+    assert len(geom._interp_weights_cache) == 2
+
+    # weights for given non-spatial indices are not cached
+    idxs = geom.coord_to_idx(coords, clip=True)[1:]
+    _, wts_idxs = geom.interp_weights(coords, idxs=idxs)
+    assert wts_idxs.flags.writeable
+    assert len(geom._interp_weights_cache) == 2
+
+    geom_copy = pickle.loads(pickle.dumps(geom))
+    assert "_interp_weights_cache" not in geom_copy.__dict__
+    pix_copy, wts_copy = geom_copy.interp_weights(coords)
+    assert_allclose(wts_copy, wts_new)
+    assert_allclose(pix_copy[0], pix_new[0])
+
+
+def test_hpx_geom_interp_weights_cache_max_bytes(monkeypatch):
+    geom = HpxGeom.create(nside=32, region="DISK(0,0,10)")
+
+    coords = {"lon": [0, 1, 2], "lat": [0, 2, 0]}
+    pix, wts = geom.interp_weights(coords)
+    nbytes = pix[0].nbytes + wts.nbytes
+    assert geom._interp_weights_nbytes == nbytes
+
+    monkeypatch.setattr(hpx_geom, "INTERP_WEIGHTS_CACHE_MAX_BYTES", 2 * nbytes)
+
+    for lon in [3, 4, 5]:
+        geom.interp_weights({"lon": [lon, 1, 2], "lat": [0, 2, 0]})
+
+    assert len(geom._interp_weights_cache) == 2
+    assert geom._interp_weights_nbytes == 2 * nbytes
+
+    # weights larger than the limit are not cached
+    coords = {"lon": np.arange(10), "lat": np.zeros(10)}
+    _, wts = geom.interp_weights(coords)
+    assert wts.flags.writeable
+    assert len(geom._interp_weights_cache) == 2
+
+
+@pytest.mark.parametrize("nest", [True, False])
+def test_get_neighbour_pairs(nest):
+    import healpy as hp
+
+    ipix = np.array([0, 100, 3000, 12287])
+    radius = np.deg2rad(3)
+
+    idx_source, ipix_target, separation = get_neighbour_pairs(
+        nside=32, ipix=ipix, radius=radius, nest=nest
+    )
+
+    for idx, pix in enumerate(ipix):
+        vec = hp.pix2vec(32, pix, nest=nest)
+        expected = hp.query_disc(32, vec, radius, nest=nest)
+        assert_allclose(np.sort(ipix_target[idx_source == idx]), np.sort(expected))
+
+    assert_allclose(separation[ipix_target == ipix[idx_source]], 0, atol=1e-7)
+    assert np.all(separation <= radius)
@@ -576,6 +576,52 @@ def test_convolve_full(region):
     assert_allclose(convolved_map.data.sum(), 14.0, rtol=2e-5)
 
 
+def test_convolve_sparse():
+    energy = MapAxis.from_bounds(1, 100, unit="TeV", nbin=2, name="energy_true")
+
+    geom = HpxGeom(
+        nside=256, axes=[energy], region="DISK(0,0,5)", nest=True, frame="icrs"
+    )
+
+    m = Map.from_geom(geom)
+    m.set_by_coord((0, 0, [2, 90]), 1)
+    m.set_by_coord((2, 1, [2, 90]), 1)
+
+    # the kernel is smooth and spans several pixels up to the truncation radius
+    sigma = [0.2, 0.25] * u.deg
+    wcs_geom = WcsGeom.create(width=5, binsz=0.05, axes=[energy])
+    psf = PSFMap.from_gauss(energy_axis_true=energy, sigma=sigma)
+    kernel = psf.get_psf_kernel(geom=wcs_geom, max_radius=1 * u.deg)
+
+    # Gaussian evaluated at the pixel centers, normalized on the HEALPix grid
+    skycoord = geom.to_image().get_coord().skycoord
+    desired = np.zeros(m.data.shape)
+
+    for idx in np.flatnonzero(m.data[0]):
+        separation = skycoord.separation(skycoord[idx]).deg
+        values = np.exp(-0.5 * (separation / sigma.to_value("deg")[:, None]) ** 2)
+        # the PSF is truncated at the edge of the default rad axis
+        values *= separation <= 0.66
+        desired += values / values.sum(axis=1, keepdims=True)
+
+    convolved_sparse = m.convolve(kernel, convolution_method="sparse")
+    assert_allclose(convolved_sparse.data.sum(), 4.0, rtol=1e-6)
+    assert_allclose(convolved_sparse.data, desired, atol=2e-3)
+    assert_allclose(convolved_sparse.data.max(axis=1), [0.2089, 0.138322], rtol=1e-3)
+
+    # the harmonic convolution is band limited and smooths the peak
+    convolved_full = m.convolve(kernel, convolution_method="harmonic")
+    assert_allclose(convolved_full.data, desired, atol=1e-2)
+    assert_allclose(convolved_full.data.max(axis=1), [0.20042, 0.13422], rtol=1e-3)
+
+    assert m._get_convolution_method(kernel) == "sparse"
+
+    image = m.reduce_over_axes()
+    convolved = image.convolve_sparse(kernel)
+    assert convolved.data.shape == m.data.shape
+    assert_allclose(convolved.data.sum(axis=1), 4.0, rtol=1e-6)
+
+
 def test_hpxmap_read_healpy(tmp_path):
     import healpy as hp
 
@@ -120,6 +120,45 @@ def get_pix_size_from_nside(nside):
     return HPX_ORDER_TO_PIXSIZE[order]
 
 
+def get_neighbour_pairs(nside, ipix, radius, nest=True):
+    """Find all pairs of HEALPix pixels within a given angular distance.
+
+    Parameters
+    ----------
+    nside : int
+        HEALPix NSIDE parameter.
+    ipix : `~numpy.ndarray`
+        Source pixel indices.
+    radius : float
+        Maximum angular distance in radians.
+    nest : bool, optional
+        Indexing scheme. If True, "NESTED" scheme. If False, "RING" scheme.
+        Default is True.
+
+    Returns
+    -------
+    idx_source : `~numpy.ndarray`
+        Index of the source pixel in ``ipix``.
+    ipix_target : `~numpy.ndarray`
+        Index of the target pixel, anywhere on the sky.
+    separation : `~numpy.ndarray`
+        Angular distance between source and target pixel in radians.
+    """
+    import healpy as hp
+
+    ipix = np.asarray(ipix, dtype=np.int64)
+    vec_source = np.array(hp.pix2vec(nside, ipix, nest=nest)).T
+
+    ipix_target = [hp.query_disc(nside, vec, radius, nest=nest) for vec in vec_source]
+    idx_source = np.repeat(np.arange(len(ipix)), [len(_) for _ in ipix_target])
+    ipix_target = np.concatenate(ipix_target)
+
+    vec = np.array(hp.pix2vec(nside, ipix_target, nest=nest))
+    cos_sep = np.sum(vec * vec_source[idx_source].T, axis=0)
+    separation = np.arccos(np.clip(cos_sep, -1, 1))
+    return idx_source, ipix_target, separation
+
+
 def match_hpx_pix(nside, nest, nside_pix, ipix_ring):
     """
     Match to the HEALPix pixel number.
@@ -22,7 +22,7 @@ def find_bands_hdu(hdu_list, hdu):
     has_cube_data = False
 
     if (
-        isinstance(hdu, (fits.ImageHDU, fits.PrimaryHDU))
+        isinstance(hdu, (fits.ImageHDU, fits.CompImageHDU, fits.PrimaryHDU))
         and hdu.header.get("NAXIS", None) == 3
     ):
         has_cube_data = True
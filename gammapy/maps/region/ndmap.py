@@ -423,6 +423,7 @@ class RegionNDMap(Map):
         weights = np.bincount(idx_inv, weights=weights).astype(self.data.dtype)
         if not preserve_counts:
             weights /= np.bincount(idx_inv).astype(self.data.dtype)
+        self._ensure_writeable()
         self.data.T.flat[idx] += weights
 
     def fill_by_idx(self, idx, weights=None):
@@ -480,6 +481,7 @@ class RegionNDMap(Map):
 
     def set_by_idx(self, idx, value):
         # inherited docstring
+        self._ensure_writeable()
         self.data[idx[::-1]] = value
 
     @classmethod
@@ -733,6 +735,7 @@ class RegionNDMap(Map):
                 raise ValueError("Incompatible geoms between map and weights")
             data = data * weights.data
 
+        self._ensure_writeable()
         self.data += data
 
     def to_table(self, format="gadf"):
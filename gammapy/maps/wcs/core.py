@@ -111,7 +111,9 @@ class WcsMap(Map):
             raise ValueError(f"Invalid map type: {map_type!r}")
 
     @classmethod
-    def from_hdulist(cls, hdu_list, hdu=None, hdu_bands=None, format="gadf"):
+    def from_hdulist(
+        cls, hdu_list, hdu=None, hdu_bands=None, format="gadf", slices=None, cutout=None
+    ):
         """Make a WcsMap object from a FITS HDUList.
 
         Parameters
@@ -126,6 +128,12 @@ class WcsMap(Map):
             Default is None.
         format : {'gadf', 'fgst-ccube', 'fgst-template'}, optional
             FITS format convention. Default is "gadf".
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs.
+            Only the selected part of the data is read. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to `~gammapy.maps.WcsGeom.cutout`.
+            Only the pixels within the cutout are read. Default is None.
 
         Returns
         -------
@@ -145,7 +153,9 @@ class WcsMap(Map):
 
         format = identify_wcs_format(hdu_bands)
 
-        wcs_map = cls.from_hdu(hdu, hdu_bands, format=format)
+        wcs_map = cls.from_hdu(
+            hdu, hdu_bands, format=format, slices=slices, cutout=cutout
+        )
 
         if wcs_map.unit.is_equivalent(""):
             if format == "fgst-template":
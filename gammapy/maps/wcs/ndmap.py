@@ -14,6 +14,7 @@ from regions import PixCoord, PointPixelRegion, PointSkyRegion, SkyRegion
 import matplotlib.colors as mpcolors
 import matplotlib.pyplot as plt
 import gammapy.utils.parallel as parallel
+from gammapy.utils.fft import FFT_CONVOLVER
 from gammapy.utils.interpolation import ScaledRegularGridInterpolator
 from gammapy.utils.units import unit_from_fits_image_hdu
 from gammapy.visualization.utils import add_colorbar
@@ -29,6 +30,18 @@ log = logging.getLogger(__name__)
 
 C_MAP_MASK = mpcolors.ListedColormap(["black", "white"], name="mask")
 
+# kernels with more elements are convolved using FFTs in smooth
+DIRECT_CONVOLUTION_MAX_SIZE = 81
+
+# numpy padding modes corresponding to the scipy.ndimage boundary modes
+NDI_PAD_MODES = {
+    "reflect": "symmetric",
+    "mirror": "reflect",
+    "nearest": "edge",
+    "wrap": "wrap",
+    "constant": "constant",
+}
+
 
 class WcsNDMap(WcsMap):
     """WCS map with any number of non-spatial dimensions.
@@ -75,7 +88,7 @@ class WcsNDMap(WcsMap):
         return data
 
     @classmethod
-    def from_hdu(cls, hdu, hdu_bands=None, format=None):
+    def from_hdu(cls, hdu, hdu_bands=None, format=None, slices=None, cutout=None):
         """Make a WcsNDMap object from a FITS HDU.
 
         Parameters
@@ -86,11 +99,23 @@ class WcsNDMap(WcsMap):
             The BANDS table HDU.
         format : {'gadf', 'fgst-ccube','fgst-template'}
             FITS format convention.
+        slices : dict, optional
+            Dictionary of axes names and integers or `slice` object pairs,
+            see `~gammapy.maps.Map.slice_by_idx`. Default is None.
+        cutout : dict, optional
+            Keyword arguments passed to `~gammapy.maps.WcsGeom.cutout`.
+            Default is None.
 
         Returns
         -------
         map : `WcsNDMap`
             WCS map.
+
+        Notes
+        -----
+        For image HDUs, only the part of the data selected by ``slices`` and
+        ``cutout`` is read from the file. For tile-compressed HDUs only the
+        tiles overlapping the selection are decompressed.
         """
         geom = WcsGeom.from_header(hdu.header, hdu_bands, format=format)
         shape = geom.axes.shape
@@ -99,8 +124,14 @@ class WcsNDMap(WcsMap):
         meta = cls._get_meta_from_header(hdu.header)
         unit = unit_from_fits_image_hdu(hdu.header)
 
-        # TODO: Should we support extracting slices?
-        if isinstance(hdu, fits.BinTableHDU):
+        is_mask = any(x in hdu.name.lower() for x in ["mask", "is_ul", "success"])
+
+        # CompImageHDU is a subclass of BinTableHDU for astropy < 7
+        is_table = isinstance(hdu, fits.BinTableHDU) and not isinstance(
+            hdu, fits.CompImageHDU
+        )
+
+        if is_table:
             map_out = cls(geom, meta=meta, unit=unit)
             pix = hdu.data.field("PIX")
             pix = np.unravel_index(pix, shape_wcs[::-1])
@@ -113,16 +144,63 @@ class WcsNDMap(WcsMap):
                 idx = pix
 
             map_out.set_by_idx(idx[::-1], vals)
+        elif (slices is not None or cutout is not None) and geom.is_regular:
+            data, geom = cls._read_hdu_section(hdu, geom, slices=slices, cutout=cutout)
+
+            if is_mask:
+                data = data.astype(bool)
+
+            return cls(geom=geom, meta=meta, data=data, unit=unit)
         else:
-            if any(x in hdu.name.lower() for x in ["mask", "is_ul", "success"]):
+            if is_mask:
                 data = hdu.data.astype(bool)
             else:
                 data = hdu.data
 
             map_out = cls(geom=geom, meta=meta, data=data, unit=unit)
 
+        if slices is not None:
+            map_out = map_out.slice_by_idx(slices=slices)
+
+        if cutout is not None:
+            map_out = map_out.cutout(**cutout)
+
         return map_out
 
+    @staticmethod
+    def _read_hdu_section(hdu, geom, slices=None, cutout=None):
+        """Read the part of an image HDU selected by slices and cutout."""
+        if isinstance(hdu, fits.CompImageHDU) and hdu.fileinfo() is not None:
+            # only decompress the tiles overlapping the selection, the section
+            # of HDUs created in memory is not supported for astropy < 7
+            data = hdu.section
+        else:
+            # memory mapped if the file was opened with memmap=True
+            data = hdu.data
+
+        idx = (slice(None),) * len(geom.axes)
+
+        if slices is not None:
+            idx = tuple([slices.get(ax.name, slice(None)) for ax in geom.axes])
+            geom = geom.slice_by_idx(slices)
+
+        if cutout is None:
+            return np.array(data[idx[::-1]]), geom
+
+        geom_cutout = geom.cutout(**cutout)
+        cutout_info = geom_cutout.cutout_slices(geom, mode=cutout.get("mode", "trim"))
+
+        slices = cutout_info["parent-slices"]
+        parent_slices = idx[::-1] + (slices[0], slices[1])
+
+        slices = cutout_info["cutout-slices"]
+        cutout_slices = Ellipsis, slices[0], slices[1]
+
+        section = data[parent_slices]
+        data = np.zeros(shape=geom_cutout.data_shape, dtype=section.dtype)
+        data[cutout_slices] = section
+        return data, geom_cutout
+
     def get_by_idx(self, idx):
         idx = pix_tuple_to_idx(idx)
         return self.data.T[idx]
@@ -240,6 +318,7 @@ class WcsNDMap(WcsMap):
         elif not preserve_counts:
             weights /= bincount
 
+        self._ensure_writeable()
         self.data.T.flat[idx] += weights
 
     def fill_by_idx(self, idx, weights=None):
@@ -247,6 +326,7 @@ class WcsNDMap(WcsMap):
 
     def set_by_idx(self, idx, vals):
         idx = pix_tuple_to_idx(idx)
+        self._ensure_writeable()
         self.data.T[idx] = vals
 
     def _pad_spatial(
@@ -873,7 +953,14 @@ class WcsNDMap(WcsMap):
         kernel : `~gammapy.irf.PSFKernel` or `numpy.ndarray`
             Convolution kernel.
         method : str, optional
-            The method used by `~scipy.signal.convolve`.
+            The method used by `~scipy.signal.convolve`. For 'fft', all image
+            planes are convolved in a single call of
+            `~gammapy.utils.fft.FFTConvolver`, which caches the kernel spectra
+            and uses overlap-add convolution for images much larger than the
+            kernel. The tile size and the cache size in bytes can be
+            configured with ``gammapy.utils.fft.FFT_CONVOLVER.tile_size``
+            and ``max_cache_bytes``, the cache is cleared with
+            ``gammapy.utils.fft.FFT_CONVOLVER.clear_cache()``.
             Default is 'fft'.
         mode : str, optional
             The convolution mode used by `~scipy.signal.convolve`.
@@ -921,6 +1008,17 @@ class WcsNDMap(WcsMap):
                     " and kernel {shape_axes_kernel}"
                 )
 
+        if method == "fft":
+            if self.geom.is_image and kernel.ndim == 3:
+                images = self.data.astype(np.float32)
+            else:
+                images = self.data
+
+            data = FFT_CONVOLVER.convolve(
+                images, kernel, mode=mode, workers=parallel.N_JOBS_DEFAULT
+            )
+            return self._init_copy(data=data.astype(np.float32), geom=geom)
+
         if self.geom.is_image and kernel.ndim == 3:
             indexes = range(kernel.shape[0])
             images = repeat(self.data.astype(np.float32))
@@ -970,7 +1068,9 @@ class WcsNDMap(WcsMap):
         kwargs : dict
             Keyword arguments passed to `~ndi.uniform_filter`
             ('box'), `~ndi.gaussian_filter` ('gauss') or
-            `~ndi.convolve` ('disk').
+            `~ndi.convolve` ('disk'). Large disk kernels are applied using
+            FFTs, with overlap-add for large maps, see
+            `~gammapy.utils.fft.FFTConvolver`.
 
         Returns
         -------
@@ -990,7 +1090,7 @@ class WcsNDMap(WcsMap):
             elif kernel == "disk":
                 disk = Tophat2DKernel(width)
                 disk.normalize("integral")
-                data = ndi.convolve(img, disk.array, **kwargs)
+                data = self._convolve_disk(img, disk.array, **kwargs)
             elif kernel == "box":
                 data = ndi.uniform_filter(img, width, **kwargs)
             else:
@@ -999,6 +1099,36 @@ class WcsNDMap(WcsMap):
 
         return self._init_copy(data=smoothed_data)
 
+    @staticmethod
+    def _convolve_disk(image, kernel, mode="reflect", **kwargs):
+        """Convolve like `~ndi.convolve`, using FFTs for large kernels.
+
+        The boundary is handled by padding the image, the padded image is
+        convolved with `~gammapy.utils.fft.FFTConvolver`, using overlap-add
+        for large images.
+        """
+        use_fft = (
+            kernel.size > DIRECT_CONVOLUTION_MAX_SIZE
+            and mode in NDI_PAD_MODES
+            and set(kwargs) <= {"cval"}
+        )
+
+        if not use_fft:
+            return ndi.convolve(image, kernel, mode=mode, **kwargs)
+
+        pad_width = [(n // 2, n // 2) for n in kernel.shape]
+        pad_kwargs = {}
+
+        if mode == "constant":
+            pad_kwargs["constant_values"] = kwargs.get("cval", 0.0)
+
+        padded = np.pad(image, pad_width, mode=NDI_PAD_MODES[mode], **pad_kwargs)
+        convolved = FFT_CONVOLVER.convolve(
+            padded, kernel, workers=parallel.N_JOBS_DEFAULT
+        )
+        slices = tuple(slice(p, p + n) for (p, _), n in zip(pad_width, image.shape))
+        return convolved[slices]
+
     def cutout(self, position, width, mode="trim", odd_npix=False, min_npix=1):
         """
         Create a cutout around a given position.
@@ -1118,4 +1248,5 @@ class WcsNDMap(WcsMap):
             if not other.geom.to_image() == weights.geom.to_image():
                 raise ValueError("Incompatible spatial geoms between map and weights")
             data = data * weights.data[cutout_slices]
+        self._ensure_writeable()
         self.data[parent_slices] += data
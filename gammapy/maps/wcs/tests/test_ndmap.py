@@ -1,9 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+import scipy.ndimage as ndi
 from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
-from astropy.convolution import Box2DKernel, Gaussian2DKernel
+from astropy.convolution import Box2DKernel, Gaussian2DKernel, Tophat2DKernel
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.time import Time
@@ -24,6 +25,7 @@ from gammapy.modeling.models import (
     PowerLawSpectralModel,
     SkyModel,
 )
+from gammapy.utils.fits import to_tile_compressed_hdulist
 from gammapy.utils.testing import mpl_plot_check, requires_data
 
 axes1 = [MapAxis(np.logspace(0.0, 3.0, 3), interp="log", name="spam")]
@@ -601,6 +603,21 @@ def test_smooth(kernel):
     assert smoothed.data.dtype == float
 
 
+@pytest.mark.parametrize("mode", ["reflect", "mirror", "nearest", "wrap", "constant"])
+def test_smooth_disk_fft(mode):
+    geom = WcsGeom.create(npix=(40, 30), binsz=0.1, axes=axes1)
+    m = WcsNDMap(geom, data=np.random.default_rng(0).random(geom.data_shape))
+
+    smoothed = m.smooth(0.5 * u.deg, kernel="disk", mode=mode)
+
+    kernel = Tophat2DKernel(5)
+    kernel.normalize("integral")
+
+    for idx in np.ndindex(geom.shape_axes):
+        desired = ndi.convolve(m.data[idx], kernel.array, mode=mode)
+        assert_allclose(smoothed.data[idx], desired, atol=1e-12)
+
+
 @pytest.mark.parametrize("mode", ["partial", "strict", "trim"])
 def test_make_cutout(mode):
     pos = SkyCoord(0, 0, unit="deg", frame="galactic")
@@ -619,6 +636,30 @@ def test_make_cutout(mode):
     assert_allclose(cutout.geom.data_shape, (3, 2, 3, 3))
 
 
+@pytest.mark.parametrize("tile_compress", [False, True])
+def test_wcsndmap_from_hdu_slices_cutout(tile_compress):
+    pos = SkyCoord(0, 0, unit="deg", frame="galactic")
+    geom = WcsGeom.create(
+        npix=(10, 8), binsz=1, skydir=pos, proj="CAR", frame="galactic", axes=axes2
+    )
+    data = np.arange(np.prod(geom.data_shape), dtype=float).reshape(geom.data_shape)
+    m = WcsNDMap(geom, data=data, unit="m2")
+
+    hdulist = m.to_hdulist(hdu="map")
+    if tile_compress:
+        hdulist = to_tile_compressed_hdulist(hdulist)
+
+    slices = {axes2[1].name: slice(1, 2)}
+    cutout = {"position": pos, "width": (2.0, 3.0) * u.deg, "mode": "partial"}
+
+    actual = Map.from_hdulist(hdulist, hdu="map", slices=slices, cutout=cutout)
+    desired = m.slice_by_idx(slices).cutout(**cutout)
+
+    assert actual.geom == desired.geom
+    assert actual.unit == "m2"
+    assert_allclose(actual.data, desired.data)
+
+
 def test_convolve_vs_smooth():
     axes = [
         MapAxis(np.logspace(0.0, 3.0, 3), interp="log"),
@@ -50,6 +50,7 @@ from .spectral import (
     TemplateNDSpectralModel,
     TemplateSpectralModel,
     integrate_spectrum,
+    integrate_spectrum_gauss_legendre,
     scale_plot_flux,
 )
 from .spectral_cosmic_ray import create_cosmic_ray_spectral_model
@@ -92,6 +93,7 @@ __all__ = [
     "GeneralizedGaussianSpatialModel",
     "GeneralizedGaussianTemporalModel",
     "integrate_spectrum",
+    "integrate_spectrum_gauss_legendre",
     "LightCurveTemplateTemporalModel",
     "LinearTemporalModel",
     "LogParabolaNormSpectralModel",
@@ -32,6 +32,53 @@ __all__ = [
 ]
 
 
+def _get_gti_bin_intervals(gti_start, gti_stop, time_min, time_max):
+    """Intersect GTIs with time bins.
+
+    The intersections are found with a sorted search when the GTIs do not
+    overlap, and by comparing all pairs otherwise.
+
+    Parameters
+    ----------
+    gti_start, gti_stop : `~numpy.ndarray`
+        GTI start and stop times.
+    time_min, time_max : `~numpy.ndarray`
+        Time bin edges, in the same time format and scale as the GTIs.
+
+    Returns
+    -------
+    idx : `~numpy.ndarray`
+        Time bin index of each intersection.
+    start, stop : `~numpy.ndarray`
+        Start and stop times of each intersection.
+    """
+    order = np.argsort(gti_start, kind="stable")
+    gti_start, gti_stop = gti_start[order], gti_stop[order]
+
+    if np.all(np.diff(gti_stop) >= 0):
+        # first GTI stopping after the bin start, last GTI starting before its stop
+        lo = np.searchsorted(gti_stop, time_min, side="right")
+        hi = np.searchsorted(gti_start, time_max, side="left")
+        counts = np.clip(hi - lo, 0, None)
+
+        idx = np.repeat(np.arange(len(time_min)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        idx_gti = np.repeat(lo, counts) + offsets
+    else:
+        mask = (gti_start[:, np.newaxis] < time_max) & (
+            gti_stop[:, np.newaxis] > time_min
+        )
+        idx_gti, idx = np.nonzero(mask)
+        order = np.argsort(idx, kind="stable")
+        idx_gti, idx = idx_gti[order], idx[order]
+
+    start = np.maximum(gti_start[idx_gti], time_min[idx])
+    stop = np.minimum(gti_stop[idx_gti], time_max[idx])
+    return idx, start, stop
+
+
 class SkyModel(CovarianceMixin, ModelBase):
     """Sky model component.
 
@@ -402,21 +449,32 @@ class SkyModel(CovarianceMixin, ModelBase):
                     "Incorrect axis order. The time axis must be the last axis"
                 )
             time_axis = geom.axes["time"]
+            to_mjd = self.temporal_model._time_to_mjd
 
-            temp_eval = np.ones(time_axis.nbin)
-            for idx in range(time_axis.nbin):
-                if gti is None:
-                    t1, t2 = time_axis.time_min[idx], time_axis.time_max[idx]
-                else:
-                    gti_in_bin = gti.select_time(
-                        time_interval=[
-                            time_axis.time_min[idx],
-                            time_axis.time_max[idx],
-                        ]
-                    )
-                    t1, t2 = gti_in_bin.time_start, gti_in_bin.time_stop
-                integral = self.temporal_model.integral(t1, t2)
-                temp_eval[idx] = np.sum(integral)
+            time_min = to_mjd(time_axis.time_min)
+            time_max = to_mjd(time_axis.time_max)
+
+            if gti is None:
+                idx = np.arange(time_axis.nbin)
+                t1, t2 = time_min, time_max
+            else:
+                idx, t1, t2 = _get_gti_bin_intervals(
+                    gti_start=to_mjd(gti.time_start),
+                    gti_stop=to_mjd(gti.time_stop),
+                    time_min=time_min,
+                    time_max=time_max,
+                )
+
+            integral = np.zeros(time_axis.nbin)
+            duration = np.zeros(time_axis.nbin)
+
+            if len(idx) > 0:
+                np.add.at(integral, idx, self.temporal_model._integral_mjd(t1, t2))
+                np.add.at(duration, idx, t2 - t1)
+
+            temp_eval = np.divide(
+                integral, duration, out=np.zeros_like(integral), where=duration > 0
+            )
             value = (value.T * temp_eval).T
 
         else:
@@ -5,6 +5,7 @@ import logging
 import operator
 import os
 import warnings
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 import scipy.optimize
@@ -44,6 +45,7 @@ __all__ = [
     "ExpCutoffPowerLawSpectralModel",
     "GaussianSpectralModel",
     "integrate_spectrum",
+    "integrate_spectrum_gauss_legendre",
     "LogParabolaNormSpectralModel",
     "LogParabolaSpectralModel",
     "NaimaSpectralModel",
@@ -121,6 +123,166 @@ def integrate_spectrum(func, energy_min, energy_max, ndecade=100):
     return integral.sum(axis=0)
 
 
+@lru_cache(maxsize=32)
+def _gauss_legendre_nodes(energy_min, energy_max, shape, ndecade, order, nodes=None):
+    """Gauss-Legendre nodes and weights in log energy, cached by bin edges."""
+    energy_min = np.frombuffer(energy_min).reshape(shape)
+    energy_max = np.frombuffer(energy_max).reshape(shape)
+
+    n_sub = np.max(ndecade * np.log10(energy_max / energy_min), initial=1)
+    edges = np.linspace(
+        np.log(energy_min), np.log(energy_max), int(np.ceil(n_sub)) + 1, axis=-1
+    )
+
+    if nodes is not None:
+        # split the sub-intervals at the nodes, nodes outside of a bin are
+        # clipped to its bounds and give empty sub-intervals
+        nodes = np.clip(np.log(np.frombuffer(nodes)), edges[..., :1], edges[..., -1:])
+        edges = np.sort(np.concatenate([edges, nodes], axis=-1), axis=-1)
+
+    lo, hi = edges[..., :-1], edges[..., 1:]
+
+    # move empty sub-intervals to the end and drop those common to all bins
+    is_empty = hi <= lo
+    idx = np.argsort(is_empty, axis=-1, kind="stable")
+    idx = idx[..., : max(np.max(np.sum(~is_empty, axis=-1), initial=0), 1)]
+    lo, hi = np.take_along_axis(lo, idx, -1), np.take_along_axis(hi, idx, -1)
+
+    x, w = np.polynomial.legendre.leggauss(order)
+    center = 0.5 * (hi + lo)[..., np.newaxis]
+    half_width = 0.5 * (hi - lo)[..., np.newaxis]
+
+    energy = np.exp(center + half_width * x).reshape(shape + (-1,))
+    weights = (half_width * w).reshape(shape + (-1,)) * energy
+
+    energy.flags.writeable = False
+    weights.flags.writeable = False
+    return energy, weights
+
+
+def integrate_spectrum_gauss_legendre(
+    func, energy_min, energy_max, ndecade=10, order=5, energy_nodes=None
+):
+    """Integrate one-dimensional function using Gauss-Legendre quadrature in log energy.
+
+    Each energy bin is split into sub-intervals of equal width in log energy,
+    with "ndecade" sub-intervals per decade, and the integral over each
+    sub-interval is computed with a Gauss-Legendre rule of the given order. The
+    nodes and weights are cached per bin edges, so that repeated integrations
+    over the same energy axis only require the evaluation of the function on the
+    nodes and a weighted sum.
+
+    Parameters
+    ----------
+    func : callable
+        Function to integrate.
+    energy_min : `~astropy.units.Quantity`
+        Integration range minimum.
+    energy_max : `~astropy.units.Quantity`
+        Integration range maximum.
+    ndecade : int, optional
+        Number of sub-intervals per decade. Bins narrower than a sub-interval
+        are integrated as a single sub-interval. Default is 10.
+    order : int, optional
+        Order of the Gauss-Legendre rule used per sub-interval. Default is 5.
+    energy_nodes : `~astropy.units.Quantity`, optional
+        Energies where the function is not smooth, such as the nodes of an
+        interpolated function. The sub-intervals are split at these energies.
+        Default is None.
+
+    Returns
+    -------
+    integral : `~astropy.units.Quantity`
+        Integral of the function in each energy bin.
+    """
+    energy_min = u.Quantity(energy_min)
+    unit = energy_min.unit
+    energy_min, energy_max = np.broadcast_arrays(
+        np.asarray(energy_min.value, dtype=float),
+        np.asarray(energy_max.to_value(unit), dtype=float),
+    )
+
+    if energy_nodes is not None:
+        energy_nodes = u.Quantity(energy_nodes).to_value(unit)
+        energy_nodes = np.unique(np.asarray(energy_nodes, dtype=float)).tobytes()
+
+    energy, weights = _gauss_legendre_nodes(
+        np.ascontiguousarray(energy_min).tobytes(),
+        np.ascontiguousarray(energy_max).tobytes(),
+        energy_min.shape,
+        ndecade,
+        order,
+        energy_nodes,
+    )
+
+    values = u.Quantity(func(energy * unit), copy=COPY_IF_NEEDED)
+    return np.sum(values.value * weights, axis=-1) * (values.unit * unit)
+
+
+def _upper_incomplete_gamma(s, x):
+    r"""Upper incomplete gamma function for a real scalar ``s`` and ``x > 0``.
+
+    For ``s <= 0`` the recurrence :math:`\Gamma(s, x) = (\Gamma(s + 1, x) - x^s
+    e^{-x}) / s` is applied, starting from :math:`\Gamma(0, x) = E_1(x)` for
+    integer ``s`` and from the regularized function otherwise.
+    """
+    s, x = float(s), np.asarray(x, dtype=float)
+    n_steps = 0 if s > 0 else int(np.ceil(-s))
+    s_start = s + n_steps
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if abs(s_start) < 1e-8:
+            value = scipy.special.exp1(x)
+        else:
+            value = scipy.special.gammaincc(s_start, x) * scipy.special.gamma(s_start)
+
+        for step in range(1, n_steps + 1):
+            s_step = s_start - step
+            value = (value - x**s_step * np.exp(-x)) / s_step
+
+    return value
+
+
+def _integrate_exp_cutoff_power_law(
+    energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+):
+    r"""Integrate an exponential cutoff power law using the incomplete gamma function.
+
+    Integrates :math:`\phi_0 (E / E_0)^{-\Gamma} \exp(-(\lambda E)^\alpha)` for
+    scalar parameters with :math:`\lambda > 0` and :math:`\alpha > 0`, and falls
+    back to Gauss-Legendre quadrature otherwise.
+    """
+    lambda_ = u.Quantity(lambda_)
+    alpha = u.Quantity(alpha).to_value("")
+    index = u.Quantity(index).to_value("")
+
+    if (
+        np.ndim(index) > 0
+        or np.ndim(alpha) > 0
+        or np.ndim(lambda_) > 0
+        or lambda_.value <= 0
+        or alpha <= 0
+    ):
+        return integrate_spectrum_gauss_legendre(
+            lambda energy: ExpCutoffPowerLawSpectralModel.evaluate(
+                energy, index, amplitude, reference, lambda_, alpha
+            ),
+            energy_min,
+            energy_max,
+        )
+
+    unit = 1 / lambda_.unit
+    energy = np.stack(
+        np.broadcast_arrays(energy_min.to_value(unit), energy_max.to_value(unit))
+    )
+    x = (lambda_.value * energy) ** alpha
+    values = _upper_incomplete_gamma((1 - index) / alpha, x)
+
+    scale = (lambda_ * reference).to_value("")
+    prefactor = amplitude * reference * scale ** (index - 1) / alpha
+    return prefactor * (values[0] - values[1])
+
+
 class SpectralModel(ModelBase):
     """Spectral model base class."""
 
@@ -136,6 +298,11 @@ class SpectralModel(ModelBase):
         """Whether model is a norm spectral model."""
         return "Norm" in cls.__name__
 
+    @property
+    def _energy_nodes(self):
+        """Energies where the model is not smooth, used to split numerical integrals."""
+        return None
+
     @staticmethod
     def _convert_evaluate_unit(kwargs_ref, energy):
         kwargs = {}
@@ -273,14 +440,18 @@ class SpectralModel(ModelBase):
         energy_min, energy_max : `~astropy.units.Quantity`
             Lower and upper bound of integration range.
         **kwargs : dict
-            Keyword arguments passed to :func:`~gammapy.modeling.models.spectral.integrate_spectrum`.
+            Keyword arguments passed to
+            :func:`~gammapy.modeling.models.spectral.integrate_spectrum_gauss_legendre`.
         """
         if hasattr(self, "evaluate_integral"):
             kwargs = {par.name: par.quantity for par in self.parameters}
             kwargs = self._convert_evaluate_unit(kwargs, energy_min)
             return self.evaluate_integral(energy_min, energy_max, **kwargs)
         else:
-            return integrate_spectrum(self, energy_min, energy_max, **kwargs)
+            kwargs.setdefault("energy_nodes", self._energy_nodes)
+            return integrate_spectrum_gauss_legendre(
+                self, energy_min, energy_max, **kwargs
+            )
 
     def integral_error(self, energy_min, energy_max, epsilon=1e-4, **kwargs):
         """Evaluate the error of the integral flux of a given spectrum in a given energy range.
@@ -318,7 +489,8 @@ class SpectralModel(ModelBase):
         energy_min, energy_max : `~astropy.units.Quantity`
             Lower and upper bound of integration range.
         **kwargs : dict
-            Keyword arguments passed to :func:`~gammapy.modeling.models.spectral.integrate_spectrum`.
+            Keyword arguments passed to
+            :func:`~gammapy.modeling.models.spectral.integrate_spectrum_gauss_legendre`.
         """
 
         def f(x):
@@ -329,7 +501,10 @@ class SpectralModel(ModelBase):
             kwargs = self._convert_evaluate_unit(kwargs, energy_min)
             return self.evaluate_energy_flux(energy_min, energy_max, **kwargs)
         else:
-            return integrate_spectrum(f, energy_min, energy_max, **kwargs)
+            kwargs.setdefault("energy_nodes", self._energy_nodes)
+            return integrate_spectrum_gauss_legendre(
+                f, energy_min, energy_max, **kwargs
+            )
 
     def energy_flux_error(self, energy_min, energy_max, epsilon=1e-4, **kwargs):
         """Evaluate the error of the energy flux of a given spectrum in a given energy range.
@@ -721,6 +896,16 @@ class CompoundSpectralModel(CovarianceMixin, SpectralModel):
     def _models(self):
         return [self.model1, self.model2]
 
+    @property
+    def _energy_nodes(self):
+        nodes = [m._energy_nodes for m in self._models if m._energy_nodes is not None]
+
+        if not nodes:
+            return None
+
+        unit = nodes[0].unit
+        return np.concatenate([_.to_value(unit) for _ in nodes]) * unit
+
     @property
     def parameters(self):
         return self.model1.parameters + self.model2.parameters
@@ -767,6 +952,46 @@ class CompoundSpectralModel(CovarianceMixin, SpectralModel):
         val2 = self.model2.evaluate(energy, *args2)
         return self.operator(val1, val2)
 
+    def _get_absorbed_model(self):
+        """Split ``model * absorption`` compounds, return None otherwise."""
+        if self.operator is not operator.mul:
+            return None
+
+        if isinstance(self.model2, EBLAbsorptionNormSpectralModel):
+            return self.model1, self.model2
+        elif isinstance(self.model1, EBLAbsorptionNormSpectralModel):
+            return self.model2, self.model1
+
+        return None
+
+    def _integrate_absorbed(self, func, energy_min, energy_max, **kwargs):
+        model, absorption = self._get_absorbed_model()
+        energy, weights = absorption._absorbed_weights(energy_min, energy_max, **kwargs)
+        values = u.Quantity(func(model, energy), copy=COPY_IF_NEEDED)
+        return np.sum(values.value * weights.value, axis=-1) * (
+            values.unit * weights.unit
+        )
+
+    def integral(self, energy_min, energy_max, **kwargs):
+        # fast path for absorbed spectra using the cached attenuation weights
+        if self._get_absorbed_model() is None:
+            return super().integral(energy_min, energy_max, **kwargs)
+
+        return self._integrate_absorbed(
+            lambda model, energy: model(energy), energy_min, energy_max, **kwargs
+        )
+
+    def energy_flux(self, energy_min, energy_max, **kwargs):
+        if self._get_absorbed_model() is None:
+            return super().energy_flux(energy_min, energy_max, **kwargs)
+
+        return self._integrate_absorbed(
+            lambda model, energy: energy * model(energy),
+            energy_min,
+            energy_max,
+            **kwargs,
+        )
+
     @classmethod
     def from_dict(cls, data, **kwargs):
         from gammapy.modeling.models import SPECTRAL_MODEL_REGISTRY
@@ -1245,6 +1470,10 @@ class PiecewiseNormSpectralModel(SpectralModel):
         """Energy nodes."""
         return self._energy
 
+    @property
+    def _energy_nodes(self):
+        return self.energy
+
     @property
     def norms(self):
         """Norm values"""
@@ -1333,6 +1562,50 @@ class ExpCutoffPowerLawSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_integral(
+        energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+    ):
+        r"""Integrate exponential cutoff power law analytically (static function).
+
+        .. math::
+            F(E_{min}, E_{max}) = \int_{E_{min}}^{E_{max}}\phi(E)dE = \left.
+            -\phi_0 \frac{E_0 (\lambda E_0)^{\Gamma - 1}}{\alpha}
+            \Gamma\left(\frac{1 - \Gamma}{\alpha}, (\lambda E)^\alpha\right)
+            \right \vert _{E_{min}}^{E_{max}}
+
+        Where :math:`\Gamma(s, x)` is the upper incomplete gamma function.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return _integrate_exp_cutoff_power_law(
+            energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(
+        energy_min, energy_max, index, amplitude, reference, lambda_, alpha
+    ):
+        r"""Compute energy flux in given energy range analytically (static function).
+
+        .. math::
+            G(E_{min}, E_{max}) = \int_{E_{min}}^{E_{max}}E \phi(E)dE = \left.
+            -\phi_0 \frac{E_0^2 (\lambda E_0)^{\Gamma - 2}}{\alpha}
+            \Gamma\left(\frac{2 - \Gamma}{\alpha}, (\lambda E)^\alpha\right)
+            \right \vert _{E_{min}}^{E_{max}}
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return reference * _integrate_exp_cutoff_power_law(
+            energy_min, energy_max, index - 1, amplitude, reference, lambda_, alpha
+        )
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1457,6 +1730,44 @@ class ExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
         cutoff = np.exp((reference - energy) / ecut)
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_integral(energy_min, energy_max, index, amplitude, reference, ecut):
+        """Integrate the model analytically using the incomplete gamma function (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return ExpCutoffPowerLawSpectralModel.evaluate_integral(
+            energy_min,
+            energy_max,
+            index=index,
+            amplitude=amplitude * np.exp(reference / ecut),
+            reference=reference,
+            lambda_=1 / ecut,
+            alpha=1,
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference, ecut):
+        """Compute energy flux analytically using the incomplete gamma function (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return ExpCutoffPowerLawSpectralModel.evaluate_energy_flux(
+            energy_min,
+            energy_max,
+            index=index,
+            amplitude=amplitude * np.exp(reference / ecut),
+            reference=reference,
+            lambda_=1 / ecut,
+            alpha=1,
+        )
+
 
 class SuperExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
     r"""Spectral super exponential cutoff power-law model used for 3FGL.
@@ -1507,6 +1818,48 @@ class SuperExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
         cutoff = np.exp((reference / ecut) ** index_2 - (energy / ecut) ** index_2)
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_integral(
+        energy_min, energy_max, amplitude, reference, ecut, index_1, index_2
+    ):
+        """Integrate the model analytically using the incomplete gamma function (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return ExpCutoffPowerLawSpectralModel.evaluate_integral(
+            energy_min,
+            energy_max,
+            index=index_1,
+            amplitude=amplitude * np.exp((reference / ecut) ** index_2),
+            reference=reference,
+            lambda_=1 / ecut,
+            alpha=index_2,
+        )
+
+    @staticmethod
+    def evaluate_energy_flux(
+        energy_min, energy_max, amplitude, reference, ecut, index_1, index_2
+    ):
+        """Compute energy flux analytically using the incomplete gamma function (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        return ExpCutoffPowerLawSpectralModel.evaluate_energy_flux(
+            energy_min,
+            energy_max,
+            index=index_1,
+            amplitude=amplitude * np.exp((reference / ecut) ** index_2),
+            reference=reference,
+            lambda_=1 / ecut,
+            alpha=index_2,
+        )
+
 
 class SuperExpCutoffPowerLaw4FGLSpectralModel(SpectralModel):
     r"""Spectral super exponential cutoff power-law model used for 4FGL-DR1 (and DR2).
@@ -1827,6 +2180,10 @@ class TemplateSpectralModel(SpectralModel):
         kwargs.setdefault("interp_kwargs", {"values_scale": "lin"})
         return cls(energy=energy, values=values, **kwargs)
 
+    @property
+    def _energy_nodes(self):
+        return self.energy
+
     def evaluate(self, energy):
         """Evaluate the model (static function)."""
         return self._evaluate((energy,), clip=True)
@@ -1920,6 +2277,10 @@ class TemplateNDSpectralModel(SpectralModel):
         """Template map as a `~gammapy.maps.RegionNDMap`."""
         return self._map
 
+    @property
+    def _energy_nodes(self):
+        return self.map.geom.axes["energy_true"].center
+
     def evaluate(self, energy, **kwargs):
         coord = {"energy_true": energy}
         coord.update(kwargs)
@@ -1994,6 +2355,10 @@ class ScaleSpectralModel(SpectralModel):
         self._covariance = None
         super().__init__(norm=norm)
 
+    @property
+    def _energy_nodes(self):
+        return self.model._energy_nodes
+
     def evaluate(self, energy, norm):
         return norm * self.model(energy)
 
@@ -2027,6 +2392,7 @@ class EBLAbsorptionNormSpectralModel(SpectralModel):
     """
 
     tag = ["EBLAbsorptionNormSpectralModel", "ebl-norm"]
+    _cache_size = 32
     redshift = Parameter("redshift", 0.1, frozen=True)
     alpha_norm = Parameter("alpha_norm", 1.0, frozen=True)
 
@@ -2045,6 +2411,8 @@ class EBLAbsorptionNormSpectralModel(SpectralModel):
         self._evaluate_table_model = ScaledRegularGridInterpolator(
             points=(self.param, self.energy), values=self.data, **interp_kwargs
         )
+        self._cache = {}
+        self._cached_parameter_values = None
         super().__init__(redshift=redshift, alpha_norm=alpha_norm)
 
     def to_dict(self, full_output=False):
@@ -2188,11 +2556,94 @@ class EBLAbsorptionNormSpectralModel(SpectralModel):
             interp_kwargs=interp_kwargs,
         )
 
-    def evaluate(self, energy, redshift, alpha_norm):
-        """Evaluate model for energy and parameter value."""
+    def _get_cached(self, key, redshift, alpha_norm, compute):
+        """Get cached value for key, invalidating the cache on parameter changes."""
+        values = (float(redshift), float(alpha_norm))
+
+        if values != self._cached_parameter_values:
+            self._cache.clear()
+            self._cached_parameter_values = values
+
+        if key not in self._cache:
+            if len(self._cache) >= self._cache_size:
+                del self._cache[next(iter(self._cache))]
+            value = compute()
+            value.flags.writeable = False
+            self._cache[key] = value
+
+        return self._cache[key]
+
+    def _evaluate_absorption(self, energy, redshift, alpha_norm):
         absorption = np.clip(self._evaluate_table_model((redshift, energy)), 0, 1)
         return np.power(absorption, alpha_norm)
 
+    def evaluate(self, energy, redshift, alpha_norm):
+        """Evaluate model for energy and parameter value.
+
+        The attenuation is cached per energy grid for scalar redshift and
+        alpha_norm, the cache is invalidated when their values change.
+        """
+        if np.size(redshift) > 1 or np.size(alpha_norm) > 1:
+            return self._evaluate_absorption(energy, redshift, alpha_norm)
+
+        energy = u.Quantity(energy)
+        redshift = u.Quantity(redshift).to_value("")
+        alpha_norm = u.Quantity(alpha_norm).to_value("")
+
+        key = ("evaluate", energy.unit, energy.shape, energy.value.tobytes())
+        return self._get_cached(
+            key,
+            redshift,
+            alpha_norm,
+            lambda: self._evaluate_absorption(energy, redshift, alpha_norm),
+        )
+
+    def _absorbed_weights(self, energy_min, energy_max, ndecade=10, order=5):
+        """Gauss-Legendre nodes and weights multiplied by the attenuation.
+
+        The weights are cached per energy bins for the current redshift and
+        alpha_norm, so that the integral of an absorbed spectrum reduces to
+        ``np.sum(model(energy) * weights, axis=-1)``.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bounds of the energy bins.
+        ndecade : int, optional
+            Number of sub-intervals per decade. Default is 10.
+        order : int, optional
+            Order of the Gauss-Legendre rule used per sub-interval. Default is 5.
+
+        Returns
+        -------
+        energy : `~astropy.units.Quantity`
+            Quadrature nodes with shape of the energy bins plus one trailing axis.
+        weights : `~astropy.units.Quantity`
+            Quadrature weights multiplied by the attenuation at the nodes.
+        """
+        energy_min = u.Quantity(energy_min)
+        unit = energy_min.unit
+        energy_min, energy_max = np.broadcast_arrays(
+            np.asarray(energy_min.value, dtype=float),
+            np.asarray(u.Quantity(energy_max).to_value(unit), dtype=float),
+        )
+        energy_min = np.ascontiguousarray(energy_min)
+        energy_max = np.ascontiguousarray(energy_max)
+
+        energy, weights = _gauss_legendre_nodes(
+            energy_min.tobytes(), energy_max.tobytes(), energy_min.shape, ndecade, order
+        )
+
+        key = ("weights", unit, energy_min.shape, energy_min.tobytes())
+        key += (energy_max.tobytes(), ndecade, order)
+        absorbed = self._get_cached(
+            key,
+            self.redshift.value,
+            self.alpha_norm.value,
+            lambda: weights * u.Quantity(self(energy * unit)).to_value(""),
+        )
+        return energy * unit, absorbed * unit
+
 
 class NaimaSpectralModel(SpectralModel):
     r"""A wrapper for Naima models.
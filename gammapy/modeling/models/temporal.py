@@ -12,7 +12,7 @@ from gammapy.maps import MapAxis, RegionNDMap, TimeMapAxis
 from astropy.utils import lazyproperty
 from gammapy.modeling import Parameter
 from gammapy.utils.compat import COPY_IF_NEEDED
-from gammapy.utils.random import InverseCDFSampler, get_random_state
+from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_path
 from gammapy.utils.time import time_ref_from_dict, time_ref_to_dict
 from .core import ModelBase, _build_parameters_from_dict
@@ -183,7 +183,9 @@ class TemporalModel(ModelBase):
         t_max : `~astropy.time.Time`
             Stop time of the sampling.
         t_delta : `~astropy.units.Quantity`, optional
-            Time step used for sampling of the temporal model. Default is 1 s.
+            Time resolution of the sampling. The cumulative distribution table
+            of models without analytical inverse is not refined below it.
+            Default is 1 s.
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
@@ -194,35 +196,116 @@ class TemporalModel(ModelBase):
         time : `~astropy.units.Quantity`
             Array with times of the sampled events.
         """
-        t_min = Time(t_min, scale=self.scale)
-        t_max = Time(t_max, scale=self.scale)
-        t_delta = u.Quantity(t_delta)
+        t_min = Time(t_min, scale=self.scale).reshape(())
+        t_max = Time(t_max, scale=self.scale).reshape(())
+        t_delta = u.Quantity(t_delta).to_value("d")
         random_state = get_random_state(random_state)
 
-        ontime = (t_max - t_min).to("s")
-        n_step = np.ceil((ontime / t_delta).to_value("")).item()
-        t_step = ontime / n_step
+        mjd_min, mjd_max = self._time_to_mjd(t_min), self._time_to_mjd(t_max)
+        time = self._inverse_cdf_mjd(
+            random_state.uniform(size=n_events), mjd_min, mjd_max, t_delta=t_delta
+        )
+        return t_min + (time - mjd_min) * u.d
+
+    def _inverse_cdf_mjd(self, value, t_min, t_max, t_delta, rtol=1e-4, n_max=4096):
+        """Inverse of the cumulative distribution of event times, in MJD.
+
+        The cumulative distribution is tabulated on an adaptive grid: cells
+        are split in four as long as the cumulative distribution within them
+        deviates from a linear one by more than ``rtol`` and they are larger
+        than ``4 * t_delta``, up to ``n_max`` cells. The memory cost therefore
+        does not grow with the length of the time interval.
+
+        Parameters
+        ----------
+        value : `~numpy.ndarray`
+            Values of the cumulative distribution, between 0 and 1.
+        t_min, t_max : float
+            Time interval in MJD.
+        t_delta : float
+            Minimum cell size in days.
+        rtol : float, optional
+            Tolerance on the cumulative distribution. Default is 1e-4.
+        n_max : int, optional
+            Maximum number of cells. Default is 4096.
+
+        Returns
+        -------
+        time : `~numpy.ndarray`
+            Times in MJD.
+        """
+        edges = np.linspace(t_min, t_max, 17)
+        integral = np.clip(self._integral_mjd(edges[:-1], edges[1:]), 0, None)
+
+        while len(integral) < n_max:
+            width = np.diff(edges)
+            sub_edges = edges[:-1, np.newaxis] + width[:, np.newaxis] * np.linspace(
+                0, 1, 5
+            )
+            sub_integral = self._integral_mjd(sub_edges[:, :-1], sub_edges[:, 1:])
+            sub_integral = np.clip(sub_integral, 0, None)
+
+            cumsum = np.cumsum(sub_integral, axis=1)[:, :-1]
+            linear = integral[:, np.newaxis] * np.array([0.25, 0.5, 0.75])
+            error = np.max(np.abs(cumsum - linear), axis=1)
+
+            refine = (error > rtol * integral.sum()) & (width > 4 * t_delta)
+
+            n_refine = (n_max - len(integral)) // 3
+            if n_refine == 0:
+                break
+            elif refine.sum() > n_refine:
+                refine[np.argsort(np.where(refine, error, -1))[:-n_refine]] = False
+
+            if not np.any(refine):
+                break
+
+            # unrefined cells keep their first sub-edge with the full integral
+            sub_integral[~refine, 0] = integral[~refine]
+            keep = np.ones(sub_integral.shape, dtype=bool)
+            keep[~refine, 1:] = False
+
+            edges = np.append(sub_edges[:, :-1][keep], edges[-1])
+            integral = sub_integral[keep]
+
+        cdf = np.concatenate([[0], np.cumsum(integral)])
+        return np.interp(value * cdf[-1], cdf, edges)
 
-        # take n+1 bins
-        indices = np.arange(n_step + 1)
+    def _time_to_mjd(self, time):
+        """Convert time to MJD in the model time scale."""
+        if isinstance(time, Time):
+            return getattr(time, self.scale).mjd
+        return Time(time, scale=self.scale).mjd
 
-        # evaluate model at bin center
-        centers = (indices[:-1] + 0.5) * t_step
-        t = Time(t_min + centers, format="mjd")
-        pdf = self(t)
+    def _integral_mjd(self, t_min, t_max, oversampling_factor=100, **kwargs):
+        """Integrate the model over time intervals given in MJD.
 
-        # build sample list
-        sampler = InverseCDFSampler(pdf=pdf, random_state=random_state)
-        time_pix = sampler.sample(n_events)[0]
+        Parameters
+        ----------
+        t_min, t_max : `~numpy.ndarray`
+            Start and stop times of the intervals in MJD, in the model time scale.
+        oversampling_factor : int, optional
+            Oversampling factor to be used for numerical integration.
+            Default is 100.
 
-        # transform bin in time after shift by half a pixel
-        steps = indices * t_step
-        time = np.interp(time_pix + 0.5, indices, steps)
-        return t_min + time
+        Returns
+        -------
+        integral : `~numpy.ndarray`
+            Integral of the model on each interval, in days.
+        """
+        t_values, steps = np.linspace(
+            t_min, t_max, oversampling_factor, retstep=True, axis=-1
+        )
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        values = u.Quantity(self.evaluate(t_values * u.d, **kwargs)).to_value("")
+        return np.sum(values, axis=-1) * steps
 
     def integral(self, t_min, t_max, oversampling_factor=100, **kwargs):
         """Evaluate the integrated flux within the given time intervals.
 
+        The integral is computed analytically where the model supports it and
+        numerically otherwise.
+
         Parameters
         ----------
         t_min: `~astropy.time.Time`
@@ -235,16 +318,14 @@ class TemporalModel(ModelBase):
 
         Returns
         -------
-        norm : float
+        norm : `~astropy.units.Quantity`
             Integrated flux norm on the given time intervals.
         """
-        t_values, steps = np.linspace(
-            t_min.mjd, t_max.mjd, oversampling_factor, retstep=True, axis=-1
+        t_min, t_max = self._time_to_mjd(t_min), self._time_to_mjd(t_max)
+        integral = self._integral_mjd(
+            t_min, t_max, oversampling_factor=oversampling_factor, **kwargs
         )
-        times = Time(t_values, format="mjd", scale=self.scale)
-        values = self(times)
-        integral = np.sum(values, axis=-1) * steps
-        return integral / self.time_sum(t_min, t_max).to_value("d")
+        return u.Quantity(integral / np.sum(t_max - t_min))
 
 
 class ConstantTemporalModel(TemporalModel):
@@ -260,22 +341,11 @@ class ConstantTemporalModel(TemporalModel):
         """Evaluate at given times."""
         return np.ones(time.shape) * u.one
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation.
-        t_max : `~astropy.time.Time`
-            Stop times of observation.
+    def _integral_mjd(self, t_min, t_max, **kwargs):
+        return t_max - t_min
 
-        Returns
-        -------
-        norm : `~astropy.units.Quantity`
-            Integrated flux norm on the given time intervals.
-        """
-        return (t_max - t_min) / self.time_sum(t_min, t_max)
+    def _inverse_cdf_mjd(self, value, t_min, t_max, **kwargs):
+        return t_min + value * (t_max - t_min)
 
 
 class LinearTemporalModel(TemporalModel):
@@ -308,29 +378,27 @@ class LinearTemporalModel(TemporalModel):
         """Evaluate at given times."""
         return alpha + beta * (time - t_ref)
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation.
-        t_max : `~astropy.time.Time`
-            Stop times of observation.
+    def _integral_mjd(self, t_min, t_max, **kwargs):
+        pars = self.parameters
+        alpha = pars["alpha"].value
+        beta = pars["beta"].quantity.to_value("d-1")
+        t_ref = pars["t_ref"].quantity.to_value("d")
+        return alpha * (t_max - t_min) + beta / 2.0 * (
+            (t_max - t_ref) ** 2 - (t_min - t_ref) ** 2
+        )
 
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals.
-        """
+    def _inverse_cdf_mjd(self, value, t_min, t_max, **kwargs):
         pars = self.parameters
-        alpha = pars["alpha"]
-        beta = pars["beta"].quantity
-        t_ref = self.reference_time
-        value = alpha * (t_max - t_min) + beta / 2.0 * (
-            (t_max - t_ref) * (t_max - t_ref) - (t_min - t_ref) * (t_min - t_ref)
+        alpha = pars["alpha"].value
+        beta = pars["beta"].quantity.to_value("d-1")
+        t_ref = pars["t_ref"].quantity.to_value("d")
+
+        integral = value * self._integral_mjd(t_min, t_max)
+        norm_min = alpha + beta * (t_min - t_ref)
+        # stable root of the quadratic equation
+        return t_min + 2 * integral / (
+            norm_min + np.sqrt(norm_min**2 + 2 * beta * integral)
         )
-        return value / self.time_sum(t_min, t_max)
 
 
 class ExpDecayTemporalModel(TemporalModel):
@@ -357,26 +425,16 @@ class ExpDecayTemporalModel(TemporalModel):
         """Evaluate at given times."""
         return np.exp(-(time - t_ref) / t0)
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation.
-        t_max : `~astropy.time.Time`
-            Stop times of observation.
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals.
-        """
+    def _integral_mjd(self, t_min, t_max, **kwargs):
         pars = self.parameters
-        t0 = pars["t0"].quantity
-        t_ref = self.reference_time
+        t0 = pars["t0"].quantity.to_value("d")
+        t_ref = pars["t_ref"].quantity.to_value("d")
         value = self.evaluate(t_max, t0, t_ref) - self.evaluate(t_min, t0, t_ref)
-        return -t0 * value / self.time_sum(t_min, t_max)
+        return -t0 * value
+
+    def _inverse_cdf_mjd(self, value, t_min, t_max, **kwargs):
+        t0 = self.parameters["t0"].quantity.to_value("d")
+        return t_min - t0 * np.log1p(value * np.expm1(-(t_max - t_min) / t0))
 
 
 class GaussianTemporalModel(TemporalModel):
@@ -404,31 +462,31 @@ class GaussianTemporalModel(TemporalModel):
     def evaluate(time, t_ref, sigma):
         return np.exp(-((time - t_ref) ** 2) / (2 * sigma**2))
 
-    def integral(self, t_min, t_max, **kwargs):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation.
-        t_max : `~astropy.time.Time`
-            Stop times of observation.
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals.
-        """
+    def _integral_mjd(self, t_min, t_max, **kwargs):
         pars = self.parameters
-        sigma = pars["sigma"].quantity
-        t_ref = self.reference_time
+        sigma = pars["sigma"].quantity.to_value("d")
+        t_ref = pars["t_ref"].quantity.to_value("d")
         norm = np.sqrt(np.pi / 2) * sigma
 
         u_min = (t_min - t_ref) / (np.sqrt(2) * sigma)
         u_max = (t_max - t_ref) / (np.sqrt(2) * sigma)
 
-        integral = norm * (scipy.special.erf(u_max) - scipy.special.erf(u_min))
-        return integral / self.time_sum(t_min, t_max)
+        return norm * (scipy.special.erf(u_max) - scipy.special.erf(u_min))
+
+    def _inverse_cdf_mjd(self, value, t_min, t_max, **kwargs):
+        pars = self.parameters
+        sigma = pars["sigma"].quantity.to_value("d")
+        t_ref = pars["t_ref"].quantity.to_value("d")
+
+        z_min, z_max = (t_min - t_ref) / sigma, (t_max - t_ref) / sigma
+
+        # sample in the lower tail, where the normal CDF is accurate
+        sign = -1 if z_min > 0 else 1
+        z_min, z_max = sorted([sign * z_min, sign * z_max])
+
+        cdf_min, cdf_max = scipy.special.ndtr([z_min, z_max])
+        z = scipy.special.ndtri(cdf_min + value * (cdf_max - cdf_min))
+        return t_ref + sign * np.clip(z, z_min, z_max) * sigma
 
 
 class GeneralizedGaussianTemporalModel(TemporalModel):
@@ -746,13 +804,48 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         val = np.clip(val, 0, a_max=None)
         return u.Quantity(val, unit=self.map.unit, copy=COPY_IF_NEEDED)
 
-    def integral(self, t_min, t_max, oversampling_factor=100, **kwargs):
+    def _integral_mjd(self, t_min, t_max, **kwargs):
+        """Integrate the light curve using the cumulative sum over its nodes.
+
+        For linear interpolation the integral is exact within the light curve
+        time range; otherwise, and outside the time range where the light curve
+        is extrapolated, the integral is computed numerically.
+        """
         if self.is_energy_dependent:
             raise NotImplementedError(
                 "Integral not supported for energy dependent models"
             )
 
-        return super().integral(t_min, t_max, oversampling_factor, **kwargs)
+        time_axis = self.map.geom.axes["time"]
+
+        if self.method != "linear" or self.values_scale != "lin" or time_axis.nbin < 2:
+            return super()._integral_mjd(t_min, t_max, **kwargs)
+
+        nodes = self.t_ref.value + time_axis.center.to_value("d")
+        values = np.nan_to_num(self.map.data.reshape(-1), nan=0, posinf=0, neginf=0)
+        values = np.clip(values, 0, None)
+        cumsum = np.zeros(nodes.shape)
+        cumsum[1:] = np.cumsum(0.5 * (values[1:] + values[:-1]) * np.diff(nodes))
+
+        def primitive(time):
+            idx = np.clip(
+                np.searchsorted(nodes, time, side="right") - 1, 0, len(nodes) - 2
+            )
+            delta = time - nodes[idx]
+            slope = (values[idx + 1] - values[idx]) / (nodes[idx + 1] - nodes[idx])
+            return cumsum[idx] + delta * (values[idx] + 0.5 * slope * delta)
+
+        t_min, t_max = np.broadcast_arrays(t_min, t_max)
+        integral = primitive(t_max) - primitive(t_min)
+
+        outside = (t_min < nodes[0]) | (t_max > nodes[-1])
+        if np.any(outside):
+            integral = np.array(integral, dtype=float)
+            integral[outside] = super()._integral_mjd(
+                t_min[outside], t_max[outside], **kwargs
+            )
+
+        return integral
 
     @classmethod
     def from_dict(cls, data):
@@ -855,33 +948,31 @@ class PowerLawTemporalModel(TemporalModel):
         """Evaluate at given times."""
         return np.power((time - t_ref) / t0, alpha)
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min: `~astropy.time.Time`
-            Start times of observation.
-        t_max: `~astropy.time.Time`
-            Stop times of observation.
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals.
-        """
+    def _integral_mjd(self, t_min, t_max, **kwargs):
         pars = self.parameters
-        alpha = pars["alpha"].quantity
-        t0 = pars["t0"].quantity
-        t_ref = self.reference_time
+        alpha = pars["alpha"].value
+        t0 = pars["t0"].quantity.to_value("d")
+        t_ref = pars["t_ref"].quantity.to_value("d")
         if alpha != -1:
             value = self.evaluate(t_max, alpha + 1.0, t_ref, t0) - self.evaluate(
                 t_min, alpha + 1.0, t_ref, t0
             )
-            return t0 / (alpha + 1.0) * value / self.time_sum(t_min, t_max)
+            return t0 / (alpha + 1.0) * value
+        else:
+            return t0 * np.log((t_max - t_ref) / (t_min - t_ref))
+
+    def _inverse_cdf_mjd(self, value, t_min, t_max, **kwargs):
+        pars = self.parameters
+        alpha = pars["alpha"].value
+        t_ref = pars["t_ref"].quantity.to_value("d")
+
+        x_min, x_max = t_min - t_ref, t_max - t_ref
+        if alpha != -1:
+            power_min, power_max = x_min ** (alpha + 1), x_max ** (alpha + 1)
+            x = (power_min + value * (power_max - power_min)) ** (1 / (alpha + 1))
         else:
-            value = np.log((t_max - t_ref) / (t_min - t_ref))
-            return t0 * value / self.time_sum(t_min, t_max)
+            x = x_min * (x_max / x_min) ** value
+        return t_ref + x
 
 
 class SineTemporalModel(TemporalModel):
@@ -914,31 +1005,15 @@ class SineTemporalModel(TemporalModel):
         """Evaluate at given times."""
         return 1.0 + amp * np.sin(omega * (time - t_ref))
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals.
-
-        Parameters
-        ----------
-        t_min: `~astropy.time.Time`
-            Start times of observation.
-        t_max: `~astropy.time.Time`
-            Stop times of observation.
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals.
-        """
+    def _integral_mjd(self, t_min, t_max, **kwargs):
         pars = self.parameters
         omega = pars["omega"].quantity.to_value("rad/day")
         amp = pars["amp"].value
-        t_ref = self.reference_time
+        t_ref = pars["t_ref"].quantity.to_value("d")
 
-        value = (t_max - t_min).to_value(u.day) - amp / omega * (
-            np.sin(omega * (t_max - t_ref).to_value(u.day))
-            - np.sin(omega * (t_min - t_ref).to_value(u.day))
+        return (t_max - t_min) - amp / omega * (
+            np.cos(omega * (t_max - t_ref)) - np.cos(omega * (t_min - t_ref))
         )
-        return value / self.time_sum(t_min, t_max).to_value(u.day)
 
 
 class TemplatePhaseCurveTemporalModel(TemporalModel):
@@ -1161,6 +1236,12 @@ class TemplatePhaseCurveTemporalModel(TemporalModel):
 
         return integral_norm
 
+    def _integral_mjd(self, t_min, t_max, **kwargs):
+        t_min = Time(t_min, format="mjd", scale=self.scale)
+        t_max = Time(t_max, format="mjd", scale=self.scale)
+        integral = u.Quantity(self.integral(t_min, t_max)).to_value("")
+        return integral * self.time_sum(t_min, t_max).to_value("d")
+
     @classmethod
     def from_dict(cls, data):
         params = _build_parameters_from_dict(
@@ -1205,11 +1286,23 @@ class TemplatePhaseCurveTemporalModel(TemporalModel):
         ax.set_ylabel("Norm / A.U.")
         return ax
 
+    def _phase_cdf(self):
+        """Phase nodes, norm and cumulative distribution of the phase curve."""
+        phase = np.unique(np.concatenate([[0.0, 1.0], self.table["PHASE"].data]))
+        norm = np.clip(self._interpolator(phase), 0, None)
+        cdf = np.concatenate(
+            [[0], np.cumsum(0.5 * (norm[1:] + norm[:-1]) * np.diff(phase))]
+        )
+        return phase, norm, cdf
+
     def sample_time(self, n_events, t_min, t_max, t_delta="1 s", random_state=0):
         """Sample arrival times of events.
 
-        To fully cover the phase range, t_delta is the minimum between the input
-        and product of the period at 0.5*(t_min + t_max) and the table bin size.
+        The phases are sampled from the exact inverse of the cumulative
+        distribution of the phase curve, folded over the number of periods in
+        the time interval, and converted back to times with the timing solution.
+        As for the integral, variations of the frequency within the time
+        interval are neglected.
 
         Parameters
         ----------
@@ -1220,7 +1313,7 @@ class TemplatePhaseCurveTemporalModel(TemporalModel):
         t_max : `~astropy.time.Time`
             Stop time of the sampling.
         t_delta : `~astropy.units.Quantity`
-            Time step used for sampling of the temporal model.
+            Not used, kept for compatibility with `TemporalModel.sample_time`.
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
@@ -1230,18 +1323,67 @@ class TemplatePhaseCurveTemporalModel(TemporalModel):
         time : `~astropy.units.Quantity`
             Array with times of the sampled events.
         """
-        t_delta = u.Quantity(t_delta)
+        random_state = get_random_state(random_state)
+        t_min = Time(t_min, scale=self.scale).reshape(())
+        t_max = Time(t_max, scale=self.scale).reshape(())
 
-        # Determine period at the mid time
-        t_mid = Time(t_min, scale=self.scale) + 0.5 * (t_max - t_min)
-        delta_t = (t_mid - self.reference_time).to(u.d)
-        frequency = self.f0.quantity + delta_t * (
-            self.f1.quantity + delta_t * self.f2.quantity / 2
-        )
-        period = 1 / frequency
+        pars = self.parameters
+        phi_ref = pars["phi_ref"].value
+        f0 = pars["f0"].quantity.to_value("s-1")
+        f1 = pars["f1"].quantity.to_value("s-2")
+        f2 = pars["f2"].quantity.to_value("s-3")
+
+        def time_to_phase(delta_t):
+            return phi_ref + delta_t * (f0 + delta_t / 2.0 * (f1 + delta_t / 3 * f2))
+
+        delta_min = (t_min - self.reference_time).to_value("s")
+        delta_max = (t_max - self.reference_time).to_value("s")
+        phase_min, phase_max = time_to_phase(delta_min), time_to_phase(delta_max)
+
+        # cumulative distribution of the absolute phase, relative to the first period
+        phase, norm, cdf = self._phase_cdf()
+        period_min = np.floor(phase_min)
+
+        def phase_to_cdf(value):
+            n_period = np.floor(value)
+            value = value - n_period
+            idx = np.clip(
+                np.searchsorted(phase, value, side="right") - 1, 0, len(phase) - 2
+            )
+            slope = (norm[idx + 1] - norm[idx]) / (phase[idx + 1] - phase[idx])
+            delta = value - phase[idx]
+            return (
+                (n_period - period_min) * cdf[-1]
+                + cdf[idx]
+                + delta * (norm[idx] + 0.5 * slope * delta)
+            )
+
+        cdf_min = phase_to_cdf(phase_min)
+        cdf_max = phase_to_cdf(phase_max)
+        values = cdf_min + random_state.uniform(size=n_events) * (cdf_max - cdf_min)
+
+        n_period = np.floor(values / cdf[-1])
+        values -= n_period * cdf[-1]
+
+        # invert the piecewise quadratic cumulative distribution within a period
+        idx = np.clip(np.searchsorted(cdf, values, side="right") - 1, 0, len(cdf) - 2)
+        slope = (norm[idx + 1] - norm[idx]) / (phase[idx + 1] - phase[idx])
+        delta_cdf = values - cdf[idx]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            denominator = norm[idx] + np.sqrt(
+                np.clip(norm[idx] ** 2 + 2 * slope * delta_cdf, 0, None)
+            )
+            delta_phase = np.where(denominator > 0, 2 * delta_cdf / denominator, 0)
+
+        phase_events = period_min + n_period + phase[idx] + delta_phase
+        phase_events = np.clip(phase_events, phase_min, phase_max)
 
-        # Take minimum time delta between user input and the period divided by the number of rows in the model table
-        # this assumes that phase values are evenly spaced.
-        t_delta = np.minimum(period / len(self.table), t_delta)
+        # convert phases to times with Newton iterations, starting at the mean frequency
+        frequency = (phase_max - phase_min) / (delta_max - delta_min)
+        delta_t = delta_min + (phase_events - phase_min) / frequency
+        for _ in range(5):
+            frequency = f0 + delta_t * (f1 + delta_t / 2.0 * f2)
+            delta_t -= (time_to_phase(delta_t) - phase_events) / frequency
 
-        return super().sample_time(n_events, t_min, t_max, t_delta, random_state)
+        delta_t = np.clip(delta_t, delta_min, delta_max)
+        return t_min + (delta_t - delta_min) * u.s
@@ -33,6 +33,7 @@ from gammapy.modeling.models import (
     TemplateSpatialModel,
     create_fermi_isotropic_diffuse_model,
 )
+from gammapy.modeling.models.cube import _get_gti_bin_intervals
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import mpl_plot_check, requires_data
 
@@ -981,6 +982,28 @@ def test_evaluate_integrate_geom_with_time_and_gti():
     assert integral.unit.is_equivalent(unit_exp)
 
 
+def test_get_gti_bin_intervals():
+    time_min = np.array([0.0, 2.0, 4.0, 6.0])
+    time_max = np.array([2.0, 4.0, 6.0, 8.0])
+
+    gti_start = np.array([5.5, 0.5, 1.5, 9.0])
+    gti_stop = np.array([7.0, 1.0, 3.0, 10.0])
+
+    idx, start, stop = _get_gti_bin_intervals(gti_start, gti_stop, time_min, time_max)
+    assert_allclose(idx, [0, 0, 1, 2, 3])
+    assert_allclose(start, [0.5, 1.5, 2.0, 5.5, 6.0])
+    assert_allclose(stop, [1.0, 2.0, 3.0, 6.0, 7.0])
+
+    # overlapping GTIs
+    gti_start = np.array([0.5, 1.0])
+    gti_stop = np.array([5.0, 1.5])
+
+    idx, start, stop = _get_gti_bin_intervals(gti_start, gti_stop, time_min, time_max)
+    assert_allclose(idx, [0, 0, 1, 2])
+    assert_allclose(start, [0.5, 1.0, 2.0, 4.0])
+    assert_allclose(stop, [2.0, 1.5, 4.0, 5.0])
+
+
 def test_compound_spectral_model(caplog):
     spatial_model = GaussianSpatialModel(
         lon_0="3 deg", lat_0="4 deg", sigma="3 deg", frame="galactic"
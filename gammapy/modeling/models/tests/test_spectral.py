@@ -28,11 +28,14 @@ from gammapy.modeling.models import (
     PowerLawSpectralModel,
     SkyModel,
     SmoothBrokenPowerLawSpectralModel,
+    SuperExpCutoffPowerLaw3FGLSpectralModel,
     SuperExpCutoffPowerLaw4FGLDR3SpectralModel,
     SuperExpCutoffPowerLaw4FGLSpectralModel,
     TemplateNDSpectralModel,
     TemplateSpectralModel,
+    integrate_spectrum_gauss_legendre,
 )
+from gammapy.modeling.models.spectral import _gauss_legendre_nodes, integrate_spectrum
 from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import (
@@ -116,8 +119,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(1.080321705479446, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(3.765838739678921, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(9.901735870666526, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(3.765883378, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(9.901910949, "TeV cm-2 s-1"),
         e_peak=4 * u.TeV,
     ),
     dict(
@@ -129,8 +132,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(1.080321705479446, ""),
-        integral_1_10TeV=u.Quantity(3.765838739678921, "TeV"),
-        eflux_1_10TeV=u.Quantity(9.901735870666526, "TeV2"),
+        integral_1_10TeV=u.Quantity(3.765883378, "TeV"),
+        eflux_1_10TeV=u.Quantity(9.901910949, "TeV2"),
     ),
     dict(
         name="ecpl_3fgl",
@@ -141,8 +144,8 @@ TEST_MODELS = [
             ecut=10 * u.TeV,
         ),
         val_at_2TeV=u.Quantity(0.7349563611124971, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.6034046173089, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(5.340285560055799, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.603428692, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(5.340356913, "TeV cm-2 s-1"),
     ),
     dict(
         name="plsec_4fgl_dr1",
@@ -154,8 +157,8 @@ TEST_MODELS = [
             expfactor=1e-14,
         ),
         val_at_2TeV=u.Quantity(0.3431043087721737, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(1.2125247, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(3.38072082, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(1.212549607, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(3.380857437, "TeV cm-2 s-1"),
     ),
     dict(
         name="plsec_4fgl",
@@ -167,8 +170,8 @@ TEST_MODELS = [
             expfactor=1e-2,
         ),
         val_at_2TeV=u.Quantity(0.35212994, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(1.328499, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(4.067067, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(1.32850758, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(4.067117231, "TeV cm-2 s-1"),
         e_peak=10.0498756 * u.TeV,
     ),
     dict(
@@ -180,8 +183,8 @@ TEST_MODELS = [
             beta=0.5 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.255791434, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(3.958830041, "TeV cm-2 s-1"),
         e_peak=0.74082 * u.TeV,
     ),
     dict(
@@ -193,8 +196,8 @@ TEST_MODELS = [
             beta=0.5 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, ""),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "TeV"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV2"),
+        integral_1_10TeV=u.Quantity(2.255791434, "TeV"),
+        eflux_1_10TeV=u.Quantity(3.958830041, "TeV2"),
     ),
     dict(
         name="logpar10",
@@ -205,8 +208,8 @@ TEST_MODELS = [
             beta=1.151292546497023 * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(0.6387956571420305, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.255689748270628, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(3.9586515834989267, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.255791434, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(3.958830041, "TeV cm-2 s-1"),
         e_peak=0.74082 * u.TeV,
     ),
     dict(
@@ -229,8 +232,8 @@ TEST_MODELS = [
             lambda_=0.1 / u.TeV,
         ),
         val_at_2TeV=u.Quantity(0.81873075, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(2.83075297, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(6.41406327, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(2.830781886, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(6.414160096, "TeV cm-2 s-1"),
         e_peak=np.nan * u.TeV,
     ),
     dict(
@@ -254,8 +257,8 @@ TEST_MODELS = [
             alpha=0.8,
         ),
         val_at_2TeV=u.Quantity(0.871694294554192, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(3.026342, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(7.38652453, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(3.026369481, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(7.386616814, "TeV cm-2 s-1"),
         e_peak=1.7677669529663684 * u.TeV,
     ),
     dict(
@@ -281,8 +284,8 @@ TEST_MODELS = [
             beta=1,
         ),
         val_at_2TeV=u.Quantity(0.28284271247461906, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(0.9956923907948155, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(2.2372256145972207, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(0.9956997105, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(2.237239081, "TeV cm-2 s-1"),
     ),
     dict(
         name="sbpl-hard",
@@ -295,8 +298,8 @@ TEST_MODELS = [
             beta=1,
         ),
         val_at_2TeV=u.Quantity(3.5355339059327378, "cm-2 s-1 TeV-1"),
-        integral_1_10TeV=u.Quantity(13.522782989735022, "cm-2 s-1"),
-        eflux_1_10TeV=u.Quantity(40.06681812966845, "TeV cm-2 s-1"),
+        integral_1_10TeV=u.Quantity(13.52269501, "cm-2 s-1"),
+        eflux_1_10TeV=u.Quantity(40.06662043, "TeV cm-2 s-1"),
     ),
     dict(
         name="pbpl",
@@ -305,8 +308,8 @@ TEST_MODELS = [
             norms=[1, 5, 3, 0.5] * u.Unit(""),
         ),
         val_at_2TeV=u.Quantity(2.76058404, ""),
-        integral_1_10TeV=u.Quantity(24.758255, "TeV"),
-        eflux_1_10TeV=u.Quantity(117.745068, "TeV2"),
+        integral_1_10TeV=u.Quantity(24.76528708, "TeV"),
+        eflux_1_10TeV=u.Quantity(117.7881899, "TeV2"),
     ),
     dict(
         name="pbpllin",
@@ -316,8 +319,8 @@ TEST_MODELS = [
             interp="lin",
         ),
         val_at_2TeV=u.Quantity(3.0, ""),
-        integral_1_10TeV=u.Quantity(27.24066846, "TeV"),
-        eflux_1_10TeV=u.Quantity(133.34487, "TeV2"),
+        integral_1_10TeV=u.Quantity(27.25, "TeV"),
+        eflux_1_10TeV=u.Quantity(133.4166667, "TeV2"),
     ),
 ]
 
@@ -693,12 +696,94 @@ def test_absorbed_extrapolate():
     assert_allclose(values, 1)
 
 
+def test_absorption_cache():
+    energy = np.geomspace(0.01, 100, 50) * u.TeV
+    param = np.linspace(0, 1, 11)
+    data = np.exp(-3 * np.outer(param, np.sqrt(energy.to_value("TeV"))))
+
+    absorption = EBLAbsorptionNormSpectralModel(
+        energy=energy, param=param, data=data, redshift=0.2, alpha_norm=1
+    )
+    model = PowerLawSpectralModel() * absorption
+
+    edges = MapAxis.from_energy_bounds("0.1 TeV", "50 TeV", nbin=10).edges
+    integral = model.integral(edges[:-1], edges[1:])
+    expected = integrate_spectrum_gauss_legendre(model, edges[:-1], edges[1:])
+    assert_quantity_allclose(integral, expected, rtol=1e-12)
+
+    energy_flux = model.energy_flux(edges[:-1], edges[1:])
+    expected = integrate_spectrum_gauss_legendre(
+        lambda energy: energy * model(energy), edges[:-1], edges[1:]
+    )
+    assert_quantity_allclose(energy_flux, expected, rtol=1e-12)
+    assert len(absorption._cache) == 2
+
+    values = absorption(edges)
+    assert absorption(edges) is values
+    assert not values.flags.writeable
+
+    absorption.redshift.value = 0.5
+    assert_allclose(absorption(1 * u.TeV), np.exp(-1.5), rtol=1e-2)
+    assert len(absorption._cache) == 1
+
+    integral_z05 = model.integral(edges[:-1], edges[1:])
+    assert np.all(integral_z05 < integral)
+
+
 def test_ecpl_integrate():
     # regression test to check the numerical integration for small energy bins
     ecpl = ExpCutoffPowerLawSpectralModel()
     value = ecpl.integral(1 * u.TeV, 1.1 * u.TeV)
     assert value.isscalar
-    assert_quantity_allclose(value, 8.380714e-14 * u.Unit("s-1 cm-2"))
+    assert_quantity_allclose(value, 8.380788e-14 * u.Unit("s-1 cm-2"))
+
+
+def test_integrate_spectrum_gauss_legendre():
+    model = LogParabolaSpectralModel(alpha=2.3, beta=0.5)
+    energy = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=3).edges
+
+    value = integrate_spectrum_gauss_legendre(model, energy[:-1], energy[1:])
+    assert value.unit == "cm-2 s-1"
+    assert_allclose(
+        value.to_value("cm-2 s-1"),
+        [9.193981e-12, 4.348340e-11, 5.639479e-12],
+        rtol=1e-6,
+    )
+
+    info = _gauss_legendre_nodes.cache_info()
+    integrate_spectrum_gauss_legendre(model, energy[:-1], energy[1:])
+    assert _gauss_legendre_nodes.cache_info().hits == info.hits + 1
+
+    energy_min = [1, 2] * u.TeV
+    energy_max = [1.1, 2.5] * u.TeV
+    value = integrate_spectrum_gauss_legendre(model, energy_min, energy_max)
+    expected = integrate_spectrum(model, energy_min, energy_max, ndecade=1000)
+    assert_quantity_allclose(value, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ExpCutoffPowerLawSpectralModel(lambda_="0.3 TeV-1", alpha=1.5),
+        ExpCutoffPowerLaw3FGLSpectralModel(),
+        SuperExpCutoffPowerLaw3FGLSpectralModel(),
+    ],
+)
+def test_exp_cutoff_integral_analytic(model):
+    energy_min = [0.1, 1, 10] * u.TeV
+    energy_max = [1, 10, 100] * u.TeV
+
+    actual = model.integral(energy_min, energy_max)
+    expected = integrate_spectrum_gauss_legendre(
+        model, energy_min, energy_max, ndecade=100
+    )
+    assert_quantity_allclose(actual, expected, rtol=1e-9)
+
+    actual = model.energy_flux(energy_min, energy_max)
+    expected = integrate_spectrum_gauss_legendre(
+        lambda energy: energy * model(energy), energy_min, energy_max, ndecade=100
+    )
+    assert_quantity_allclose(actual, expected, rtol=1e-9)
 
 
 def test_call_plsec_4fgl_dr1():
@@ -804,6 +889,24 @@ def test_template_spectral_model_compound():
     assert np.allclose(new_model(energy), 2 * values)
 
 
+def test_template_spectral_model_integral():
+    energy = [1, 2, 5, 10] * u.TeV
+    values = [1, 3, 0.5, 0.2] * u.Unit("cm-2 s-1 TeV-1")
+    model = TemplateSpectralModel(energy=energy, values=values)
+
+    # the model is a power law between the nodes, exact values
+    integral = model.integral(1 * u.TeV, 10 * u.TeV)
+    assert_quantity_allclose(integral, 7.150606447 * u.Unit("cm-2 s-1"), rtol=1e-9)
+
+    energy_flux = model.energy_flux(1 * u.TeV, 10 * u.TeV)
+    assert_quantity_allclose(
+        energy_flux, 25.35214923 * u.Unit("TeV cm-2 s-1"), rtol=1e-9
+    )
+
+    compound = model * PowerLawNormSpectralModel(norm=2)
+    assert_quantity_allclose(compound.integral(1 * u.TeV, 10 * u.TeV), 2 * integral)
+
+
 def test_template_spectral_model_options():
     energy = [1.00e06, 1.25e06, 1.58e06, 1.99e06] * u.MeV
     values = [4.39e-7, 1.96e-7, 8.80e-7, 3.94e-7] * u.Unit("MeV-1 s-1 sr-1")
@@ -8,7 +8,7 @@ CRAB_SPECTRA = [
     {
         "name": "meyer",
         "dnde": u.Quantity(5.572437502365652e-12, "cm-2 s-1 TeV-1"),
-        "flux": u.Quantity(2.0744425607240974e-11, "cm-2 s-1"),
+        "flux": u.Quantity(2.07445424796e-11, "cm-2 s-1"),
         "index": 2.631535530090332,
     },
     {
@@ -26,19 +26,19 @@ CRAB_SPECTRA = [
     {
         "name": "hess_ecpl",
         "dnde": u.Quantity(6.23714253e-12, "cm-2 s-1 TeV-1"),
-        "flux": u.Quantity(2.267957713046026e-11, "cm-2 s-1"),
+        "flux": u.Quantity(2.2679734393e-11, "cm-2 s-1"),
         "index": 2.529860258102417,
     },
     {
         "name": "magic_lp",
         "dnde": u.Quantity(5.5451060834144166e-12, "cm-2 s-1 TeV-1"),
-        "flux": u.Quantity(2.028222279117e-11, "cm-2 s-1"),
+        "flux": u.Quantity(2.02824108458e-11, "cm-2 s-1"),
         "index": 2.614495440236207,
     },
     {
         "name": "magic_ecpl",
         "dnde": u.Quantity(5.88494595619e-12, "cm-2 s-1 TeV-1"),
-        "flux": u.Quantity(2.070767119534948e-11, "cm-2 s-1"),
+        "flux": u.Quantity(2.07079874261e-11, "cm-2 s-1"),
         "index": 2.5433349999859405,
     },
 ]
@@ -19,6 +19,7 @@ from gammapy.modeling.models import (
     SineTemporalModel,
     SkyModel,
     TemplatePhaseCurveTemporalModel,
+    TemporalModel,
 )
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import mpl_plot_check, requires_data
@@ -164,6 +165,46 @@ def test_time_sampling_template():
     assert_allclose(std - sigma.to("d").value, 0.0, atol=3e-4)
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        LinearTemporalModel(alpha=1, beta="2 d-1", t_ref=55000 * u.d),
+        ExpDecayTemporalModel(t0="2 h", t_ref=55000 * u.d),
+        GaussianTemporalModel(t_ref=55000.1 * u.d, sigma="30 min"),
+        GaussianTemporalModel(t_ref=54999.8 * u.d, sigma="2 h"),
+        PowerLawTemporalModel(alpha=-1.3, t_ref=54999.99 * u.d, t0="1 h"),
+        SineTemporalModel(amp=0.8, omega="50 rad d-1", t_ref=55000 * u.d),
+        GeneralizedGaussianTemporalModel(
+            t_ref=55000.1 * u.d, t_rise="10 min", t_decay="1 h"
+        ),
+    ],
+)
+def test_time_sampling_cdf(model):
+    t_min = Time(55000, format="mjd")
+    t_max = t_min + 6 * u.h
+    times = model.sample_time(n_events=10000, t_min=t_min, t_max=t_max)
+
+    assert np.all((times >= t_min) & (times <= t_max))
+
+    t_test = t_min + [1, 2, 4] * u.h
+    total = model._integral_mjd(t_min.mjd, t_max.mjd)
+    expected = model._integral_mjd(t_min.mjd, t_test.mjd) / total
+    actual = [np.mean(times < t) for t in t_test]
+    assert_allclose(actual, expected, atol=0.015)
+
+
+def test_time_sampling_inverse_cdf_table():
+    model = SineTemporalModel(amp=1, omega="1000 rad d-1", t_ref=55000 * u.d)
+    value = np.linspace(0, 1, 11)
+
+    time = model._inverse_cdf_mjd(value, 55000.0, 55010.0, t_delta=1e-5, n_max=1000)
+    assert_allclose(time[[0, -1]], [55000.0, 55010.0])
+    assert np.all(np.diff(time) > 0)
+
+    integral = model._integral_mjd(55000.0, time)
+    assert_allclose(integral / integral[-1], value, atol=0.02)
+
+
 def test_time_sampling_uniform():
     cst = ConstantTemporalModel()
     t0 = Time.now()
@@ -209,7 +250,7 @@ def test_lightcurve_temporal_model_integral():
     time_stop = Time("2010-01-01T00:00:00") + [2, 3.5, 6] * u.hour
     val = temporal_model.integral(time_start, time_stop)
     assert len(val) == 3
-    assert_allclose(np.sum(val), 1.0101, rtol=1e-5)
+    assert_allclose(np.sum(val), 1.0, rtol=1e-5)
 
     with mpl_plot_check():
         temporal_model.plot(
@@ -217,6 +258,28 @@ def test_lightcurve_temporal_model_integral():
         )
 
 
+def test_lightcurve_temporal_model_integral_linear():
+    time = np.array([0, 1, 3, 4]) * u.day
+    table = Table()
+    table["TIME"] = time
+    table["NORM"] = [0.0, 2.0, 2.0, 1.0]
+    table.meta = dict(MJDREFI=55197.0, MJDREFF=0, TIMEUNIT="d")
+    temporal_model = LightCurveTemplateTemporalModel.from_table(table)
+
+    t_ref = Time(55197.0, format="mjd")
+    time_start = t_ref + [0.5, 0, 3.5] * u.day
+    time_stop = t_ref + [1.5, 4, 5] * u.day
+
+    val = temporal_model.integral(time_start, time_stop)
+    total = temporal_model.time_sum(time_start, time_stop).to_value("d")
+
+    # extrapolated outside of the light curve time range
+    expected = TemporalModel._integral_mjd(
+        temporal_model, time_start.mjd, time_stop.mjd
+    )
+    assert_allclose(val * total, [1.75, 6.5, expected[2]], rtol=1e-10)
+
+
 def test_constant_temporal_model_evaluate():
     temporal_model = ConstantTemporalModel()
     t = Time(46300, format="mjd")
@@ -362,7 +425,7 @@ def test_sine_temporal_model_integral():
     time_stop = t_ref + [2, 3.5, 6] * u.day
     val = temporal_model.integral(time_start, time_stop)
     assert len(val) == 3
-    assert_allclose(np.sum(val), 1.08261, rtol=1e-5)
+    assert_allclose(np.sum(val), 1.055201, rtol=1e-5)
 
 
 @requires_data()
@@ -475,6 +538,20 @@ def test_phase_curve_model_sample_time():
 
     assert np.all(phases <= 0.5)
 
+    table = Table(data={"PHASE": phase, "NORM": 1.0 * (phase < 0.5) + phase})
+    phase_model = TemplatePhaseCurveTemporalModel(
+        table=table, f0="50 Hz", f1="-1e-10 s-2", t_ref=t_ref.mjd * u.d
+    )
+
+    times = phase_model.sample_time(10000, tmin, tmax)
+    assert np.all((times >= tmin) & (times <= tmax))
+
+    phases, _ = phase_model._time_to_phase(
+        times.mjd * u.d, **{par.name: par.quantity for par in phase_model.parameters}
+    )
+    # fraction of the phase curve integral below phase 0.5
+    assert_allclose(np.mean(phases < 0.5), 0.615 / 0.99, atol=0.015)
+
 
 @requires_data()
 def test_phasecurve_DC1():
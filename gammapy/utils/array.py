@@ -1,9 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utility functions to deal with arrays and quantities."""
 import numpy as np
+import scipy.fft
 import scipy.ndimage
 import scipy.signal
 from astropy.convolution import Gaussian2DKernel
+from .fft import _crop_kernel_same, _fft_shape, _output_slices
 
 __all__ = [
     "array_stats_str",
@@ -185,3 +187,59 @@ def scale_cube(data, kernels):
         Array of the shape (len(kernels), data.shape).
     """
     return np.dstack([_fftconvolve_wrap(kernel, data) for kernel in kernels])
+
+
+def fftconvolve_multi(images, kernels, dtype=np.float64, workers=None):
+    """Convolve several images with a sequence of kernels.
+
+    Every image is Fourier transformed only once, at a padded size common to
+    all kernels, and then multiplied by the spectrum of each kernel in turn.
+    For every kernel the result is equivalent to
+    ``scipy.signal.fftconvolve(image, kernel, mode="same")``.
+
+    The convolved images are generated kernel by kernel, so that the caller
+    can stop early, e.g. once all pixels reached a given significance.
+
+    Parameters
+    ----------
+    images : list of `~numpy.ndarray`
+        2D images of identical shape.
+    kernels : list of `~astropy.convolution.Kernel2D` or `~numpy.ndarray`
+        2D convolution kernels.
+    dtype : {`~numpy.float64`, `~numpy.float32`}
+        Floating point precision of the transforms. Default is `~numpy.float64`.
+    workers : int, optional
+        Number of threads used by `scipy.fft`. Default is None.
+
+    Yields
+    ------
+    convolved : list of `~numpy.ndarray`
+        Images convolved with the current kernel, in the order of ``images``.
+    """
+    shape = images[0].shape
+    arrays = [
+        _crop_kernel_same(np.asarray(getattr(kernel, "array", kernel)), shape)
+        for kernel in kernels
+    ]
+
+    fft_shape = _fft_shape(shape, [_.shape for _ in arrays], mode="same")
+
+    spectra = [
+        scipy.fft.rfft2(image.astype(dtype), s=fft_shape, workers=workers)
+        for image in images
+    ]
+
+    for kernel in arrays:
+        kernel_spectrum = scipy.fft.rfft2(
+            kernel.astype(dtype), s=fft_shape, workers=workers
+        )
+        slices = _output_slices(shape, kernel.shape, mode="same")
+
+        convolved = []
+        for spectrum in spectra:
+            data = scipy.fft.irfft2(
+                spectrum * kernel_spectrum, s=fft_shape, workers=workers
+            )
+            convolved.append(data[slices])
+
+        yield convolved
@@ -1,5 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-from astropy.coordinates import SkyCoord, SkyOffsetFrame
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import Angle, Latitude, Longitude
 
 __all__ = ["fov_to_sky", "sky_to_fov"]
 
@@ -20,19 +22,28 @@ def fov_to_sky(lon, lat, lon_pnt, lat_pnt):
     lon_t, lat_t : `~astropy.units.Quantity`
         Transformed sky coordinate.
     """
-    # Create a frame that is centered on the pointing position
-    center = SkyCoord(lon_pnt, lat_pnt)
-    fov_frame = SkyOffsetFrame(origin=center)
-
-    # Define coordinate to be transformed.
     # Need to switch the sign of the longitude angle here
     # because this axis is reversed in our definition of the FoV-system
-    target_fov = SkyCoord(-lon, lat, frame=fov_frame)
+    lon = -u.Quantity(lon, "rad").value
+    lat = u.Quantity(lat, "rad").value
+    lon_pnt = u.Quantity(lon_pnt, "rad").value
+    lat_pnt = u.Quantity(lat_pnt, "rad").value
+
+    # Cartesian coordinates in the frame centered on the pointing position
+    cos_lat = np.cos(lat)
+    x = cos_lat * np.cos(lon)
+    y = cos_lat * np.sin(lon)
+    z = np.sin(lat)
 
-    # Transform into celestial system (need not be ICRS)
-    target_sky = target_fov.icrs
+    # Rotate back to the celestial system (need not be ICRS), this
+    # is equivalent to the `~astropy.coordinates.SkyOffsetFrame` transform
+    cos_lat_pnt, sin_lat_pnt = np.cos(lat_pnt), np.sin(lat_pnt)
+    x_sky = x * cos_lat_pnt - z * sin_lat_pnt
+    z_sky = x * sin_lat_pnt + z * cos_lat_pnt
 
-    return target_sky.ra, target_sky.dec
+    lon_t = Longitude(np.arctan2(y, x_sky) + lon_pnt, "rad")
+    lat_t = Latitude(np.arctan2(z_sky, np.hypot(x_sky, y)), "rad")
+    return lon_t.to("deg"), lat_t.to("deg")
 
 
 def sky_to_fov(lon, lat, lon_pnt, lat_pnt):
@@ -51,16 +62,24 @@ def sky_to_fov(lon, lat, lon_pnt, lat_pnt):
     lon_t, lat_t : `~astropy.units.Quantity`
         Transformed field-of-view coordinate.
     """
-    # Create a frame that is centered on the pointing position
-    center = SkyCoord(lon_pnt, lat_pnt)
-    fov_frame = SkyOffsetFrame(origin=center)
+    lon = u.Quantity(lon, "rad").value
+    lat = u.Quantity(lat, "rad").value
+    lon_pnt = u.Quantity(lon_pnt, "rad").value
+    lat_pnt = u.Quantity(lat_pnt, "rad").value
 
-    # Define coordinate to be transformed.
-    target_sky = SkyCoord(lon, lat)
+    # Rotate into the frame centered on the pointing position, this
+    # is equivalent to the `~astropy.coordinates.SkyOffsetFrame` transform
+    dlon = lon - lon_pnt
+    cos_lat, sin_lat = np.cos(lat), np.sin(lat)
+    cos_lat_pnt, sin_lat_pnt = np.cos(lat_pnt), np.sin(lat_pnt)
+    cos_dlon = np.cos(dlon)
 
-    # Transform into FoV-system
-    target_fov = target_sky.transform_to(fov_frame)
+    x = cos_lat * cos_dlon * cos_lat_pnt + sin_lat * sin_lat_pnt
+    y = cos_lat * np.sin(dlon)
+    z = sin_lat * cos_lat_pnt - cos_lat * cos_dlon * sin_lat_pnt
 
     # Switch sign of longitude angle since this axis is
     # reversed in our definition of the FoV-system
-    return -target_fov.lon, target_fov.lat
+    lon_t = Angle(-np.arctan2(y, x), "rad")
+    lat_t = Latitude(np.arctan2(z, np.hypot(x, y)), "rad")
+    return lon_t.to("deg"), lat_t.to("deg")
@@ -0,0 +1,323 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""FFT convolution of image stacks with cached kernel spectra."""
+
+import hashlib
+from collections import OrderedDict
+from itertools import product
+import numpy as np
+import scipy.fft
+
+__all__ = ["FFTConvolver"]
+
+
+def _crop_kernel_same(kernel, shape):
+    """Crop kernel to the part that can overlap an image of the given shape.
+
+    The crop preserves the output of a "same" mode convolution.
+    """
+    slices = [Ellipsis]
+
+    for n_kernel, n_data in zip(kernel.shape[-2:], shape[-2:]):
+        n_max = 2 * n_data - 1
+        start = max((n_kernel - n_max) // 2, 0)
+        slices.append(slice(start, start + min(n_kernel, n_max)))
+
+    return kernel[tuple(slices)]
+
+
+def _fft_shape(shape, kernel_shapes, mode="same"):
+    """Padded image shape for a linear convolution by circular FFT convolution.
+
+    For mode "same" only the part of the circular convolution that is free of
+    wrap-around in the central output region is required.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Image shape (ny, nx).
+    kernel_shapes : list of tuple of int
+        Kernel image shapes (ny, nx).
+    mode : {"same", "full"}
+        Convolution mode. Default is "same".
+
+    Returns
+    -------
+    fft_shape : tuple of int
+        Padded shape, optimal for `scipy.fft`.
+    """
+    fft_shape = []
+
+    for n, sizes in zip(shape, zip(*kernel_shapes)):
+        if mode == "same":
+            n_fft = max(n + nk - 1 - (nk - 1) // 2 for nk in sizes)
+        else:
+            n_fft = max(n + nk - 1 for nk in sizes)
+        fft_shape.append(scipy.fft.next_fast_len(n_fft, real=True))
+
+    return tuple(fft_shape)
+
+
+def _output_slices(shape, kernel_shape, mode="same"):
+    """Slices of the padded circular convolution for the given mode."""
+    if mode == "same":
+        return tuple(
+            slice((nk - 1) // 2, (nk - 1) // 2 + n)
+            for n, nk in zip(shape, kernel_shape)
+        )
+
+    return tuple(slice(0, n + nk - 1) for n, nk in zip(shape, kernel_shape))
+
+
+class FFTConvolver:
+    """Convolve stacks of images with stacks of kernels using real FFTs.
+
+    All image planes of a stack are convolved in a single call, at a padded
+    size chosen with `scipy.fft.next_fast_len`. The padded kernel spectra are
+    cached, keyed on the kernel content, the padded shape and the precision,
+    so that repeated convolutions with the same kernel, e.g. the same
+    `~gammapy.irf.PSFKernel` applied to many maps, only transform the images.
+
+    Images much larger than the kernel are convolved by overlap-add: the
+    image is split in tiles, which are convolved separately and summed into
+    the output. This bounds the size of the transforms to ``tile_size``
+    and lets several tiles be transformed in parallel.
+
+    The convolution is equivalent to ``scipy.signal.convolve`` applied to
+    every image plane.
+
+    Parameters
+    ----------
+    max_cache_bytes : int
+        Maximum total size of the cached kernel spectra in bytes. Spectra
+        larger than this are not cached, a value of 0 disables the cache.
+        Default is 128 MB.
+    tile_size : int
+        Size of the padded tiles used for overlap-add convolution, in pixels
+        per image axis. Default is 512.
+    """
+
+    def __init__(self, max_cache_bytes=128 * 1024**2, tile_size=512):
+        self.max_cache_bytes = max_cache_bytes
+        self.tile_size = tile_size
+        self._cache = OrderedDict()
+        self._cache_nbytes = 0
+
+    def use_tiles(self, shape, kernel_shape):
+        """Whether overlap-add convolution is used for the given shapes.
+
+        Tiles are used if the image is larger than two tiles along an axis
+        and the kernel is smaller than a quarter tile along both axes.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Image shape (ny, nx).
+        kernel_shape : tuple of int
+            Kernel image shape (ny, nx).
+
+        Returns
+        -------
+        use_tiles : bool
+            Whether to use tiles.
+        """
+        large_image = any(n > 2 * self.tile_size for n in shape)
+        small_kernel = all(4 * nk <= self.tile_size for nk in kernel_shape)
+        return large_image and small_kernel
+
+    @property
+    def cache_nbytes(self):
+        """Total size of the cached kernel spectra in bytes."""
+        return self._cache_nbytes
+
+    def clear_cache(self):
+        """Clear the kernel spectra cache."""
+        self._cache.clear()
+        self._cache_nbytes = 0
+
+    @staticmethod
+    def _kernel_key(kernel, fft_shape, dtype):
+        digest = hashlib.blake2b(np.ascontiguousarray(kernel), digest_size=16)
+        return digest.digest(), kernel.shape, kernel.dtype.str, fft_shape, dtype.str
+
+    def kernel_spectrum(self, kernel, fft_shape, dtype=np.float64):
+        """Padded kernel spectrum, cached.
+
+        Parameters
+        ----------
+        kernel : `~numpy.ndarray`
+            Kernel, the last two axes are the image axes.
+        fft_shape : tuple of int
+            Padded image shape.
+        dtype : {`~numpy.float64`, `~numpy.float32`}
+            Floating point precision of the transform. Default is `~numpy.float64`.
+
+        Returns
+        -------
+        spectrum : `~numpy.ndarray`
+            Read-only kernel spectrum.
+        """
+        dtype = np.dtype(dtype)
+        key = self._kernel_key(kernel, fft_shape, dtype)
+
+        spectrum = self._cache.get(key)
+
+        if spectrum is None:
+            spectrum = scipy.fft.rfft2(kernel.astype(dtype), s=fft_shape)
+            spectrum.flags.writeable = False
+
+            if spectrum.nbytes <= self.max_cache_bytes:
+                self._cache[key] = spectrum
+                self._cache_nbytes += spectrum.nbytes
+
+            while self._cache_nbytes > self.max_cache_bytes:
+                _, value = self._cache.popitem(last=False)
+                self._cache_nbytes -= value.nbytes
+        else:
+            self._cache.move_to_end(key)
+
+        return spectrum
+
+    def convolve(
+        self, images, kernel, mode="same", dtype=None, workers=None, tiled=None
+    ):
+        """Convolve images with a kernel.
+
+        Parameters
+        ----------
+        images : `~numpy.ndarray`
+            Images, the last two axes are the image axes.
+        kernel : `~numpy.ndarray`
+            Kernel, the last two axes are the image axes. The leading axes
+            of the images and kernel are broadcast against each other.
+        mode : {"same", "full"}
+            Convolution mode, as in `scipy.signal.convolve`. Default is "same".
+        dtype : {`~numpy.float64`, `~numpy.float32`}, optional
+            Floating point precision of the transforms. Default is None, which
+            uses single precision if both inputs are single precision.
+        workers : int, optional
+            Number of threads used by `scipy.fft`. For overlap-add convolution
+            this is also the number of tiles transformed together.
+            Default is None.
+        tiled : bool, optional
+            Whether to use overlap-add convolution. Default is None, which
+            selects it automatically, see `FFTConvolver.use_tiles`.
+
+        Returns
+        -------
+        convolved : `~numpy.ndarray`
+            Convolved images.
+        """
+        if mode not in ["same", "full"]:
+            raise ValueError(f"Invalid mode: {mode!r}")
+
+        images, kernel = np.asarray(images), np.asarray(kernel)
+
+        if dtype is None:
+            dtype = np.result_type(images.dtype, kernel.dtype, np.float32)
+
+        shape = images.shape[-2:]
+
+        if mode == "same":
+            kernel = _crop_kernel_same(kernel, shape)
+
+        kernel_shape = kernel.shape[-2:]
+
+        if tiled is None:
+            tiled = self.use_tiles(shape, kernel_shape)
+
+        if tiled:
+            return self._convolve_tiled(
+                images, kernel, mode=mode, dtype=dtype, workers=workers
+            )
+
+        fft_shape = _fft_shape(shape, [kernel_shape], mode=mode)
+
+        kernel_spectrum = self.kernel_spectrum(kernel, fft_shape, dtype=dtype)
+        slices = _output_slices(shape, kernel_shape, mode=mode)
+
+        shape_axes = np.broadcast_shapes(images.shape[:-2], kernel.shape[:-2])
+        shape_out = tuple(_.stop - _.start for _ in slices)
+
+        kernel_spectrum = np.broadcast_to(
+            kernel_spectrum, shape_axes + kernel_spectrum.shape[-2:]
+        )
+        convolved = np.empty(shape_axes + shape_out, dtype=dtype)
+
+        # a plane by plane loop is faster than a single transform of the
+        # whole stack, because the planes fit in the CPU cache
+        if images.ndim == 2:
+            spectrum = scipy.fft.rfft2(
+                images.astype(dtype), s=fft_shape, workers=workers
+            )
+        else:
+            images = np.broadcast_to(images, shape_axes + shape)
+
+        for idx in np.ndindex(shape_axes):
+            if images.ndim > 2:
+                spectrum = scipy.fft.rfft2(
+                    images[idx].astype(dtype, copy=False), s=fft_shape, workers=workers
+                )
+
+            data = scipy.fft.irfft2(
+                spectrum * kernel_spectrum[idx], s=fft_shape, workers=workers
+            )
+            convolved[idx] = data[slices]
+
+        return convolved
+
+    def _convolve_tiled(self, images, kernel, mode, dtype, workers):
+        """Overlap-add convolution, see `FFTConvolver.convolve`."""
+        shape, kernel_shape = images.shape[-2:], kernel.shape[-2:]
+
+        tile_shape = tuple(max(self.tile_size - nk + 1, 1) for nk in kernel_shape)
+        fft_shape = _fft_shape(tile_shape, [kernel_shape], mode="full")
+
+        kernel_spectrum = self.kernel_spectrum(kernel, fft_shape, dtype=dtype)
+        slices = _output_slices(shape, kernel_shape, mode=mode)
+
+        shape_axes = np.broadcast_shapes(images.shape[:-2], kernel.shape[:-2])
+        shape_out = tuple(_.stop - _.start for _ in slices)
+
+        kernel_spectrum = np.broadcast_to(
+            kernel_spectrum, shape_axes + kernel_spectrum.shape[-2:]
+        )
+        images = np.broadcast_to(images, shape_axes + shape)
+        convolved = np.zeros(shape_axes + shape_out, dtype=dtype)
+
+        starts = list(
+            product(*[range(0, n, n_tile) for n, n_tile in zip(shape, tile_shape)])
+        )
+        n_batch = max(workers or 1, 1)
+
+        for idx in np.ndindex(shape_axes):
+            image, out = images[idx], convolved[idx]
+
+            for i in range(0, len(starts), n_batch):
+                batch = starts[i : i + n_batch]
+
+                tiles = np.zeros((len(batch),) + tile_shape, dtype=dtype)
+                for tile, (y, x) in zip(tiles, batch):
+                    data = image[y : y + tile_shape[0], x : x + tile_shape[1]]
+                    tile[: data.shape[0], : data.shape[1]] = data
+
+                spectra = scipy.fft.rfft2(tiles, s=fft_shape, workers=workers)
+                spectra *= kernel_spectrum[idx]
+                tiles = scipy.fft.irfft2(spectra, s=fft_shape, workers=workers)
+
+                for tile, start in zip(tiles, batch):
+                    # tile position in the full and in the output image
+                    slices_tile, slices_out = [], []
+                    for x, n_tile, nk, n, s in zip(
+                        start, tile_shape, kernel_shape, shape, slices
+                    ):
+                        stop = min(x + n_tile, n) + nk - 1
+                        x_min, x_max = max(x, s.start), min(stop, s.stop)
+                        slices_tile.append(slice(x_min - x, x_max - x))
+                        slices_out.append(slice(x_min - s.start, x_max - s.start))
+
+                    out[tuple(slices_out)] += tile[tuple(slices_tile)]
+
+        return convolved
+
+
+FFT_CONVOLVER = FFTConvolver()
@@ -2,6 +2,8 @@
 import html
 import logging
 import sys
+import zlib
+import numpy as np
 import astropy.units as u
 from astropy.coordinates import AltAz, Angle, EarthLocation, SkyCoord
 from astropy.io import fits
@@ -10,7 +12,12 @@ from .scripts import make_path
 
 log = logging.getLogger(__name__)
 
-__all__ = ["earth_location_from_dict", "LazyFitsData", "HDULocation"]
+__all__ = [
+    "earth_location_from_dict",
+    "LazyFitsData",
+    "HDULocation",
+    "to_tile_compressed_hdulist",
+]
 
 
 class HDULocation:
@@ -115,9 +122,43 @@ class HDULocation:
             return cls.read(filename, hdu=hdu)
 
 
+def _get_data_arrays(value):
+    """Data arrays of a map, IRF map or PSF kernel."""
+    attrs = ["_irf_map", "exposure_map", "psf_kernel_map"]
+    maps = [getattr(value, attr, None) for attr in attrs]
+    maps = [_ for _ in maps if _ is not None] or [value]
+
+    arrays = []
+    for m in maps:
+        data = getattr(m, "data", None)
+        if isinstance(data, np.ndarray):
+            arrays.append(data)
+
+    return arrays
+
+
+def _get_data_checksum(value):
+    """Checksum of the data arrays of a value, used to detect in-place modifications."""
+    checksum = 0
+
+    for data in _get_data_arrays(value):
+        data = np.ascontiguousarray(data).reshape(-1)
+        checksum = zlib.crc32(data.view(np.uint8), checksum)
+
+    return checksum
+
+
 class LazyFitsData(object):
     """A lazy FITS data descriptor.
 
+    If the instance data cache is evicted on a memory budget, i.e. the instance
+    ``_data_cache_tracked`` attribute is True, a checksum of the cached data is
+    stored as well, so that in-place modifications of the data can be detected.
+
+    Assigning a value that is not a `HDULocation` detaches the attribute from
+    the file: the value is then never cleared nor reloaded from the file by
+    `~gammapy.datasets.MapDataset.reset_data_cache`.
+
     Parameters
     ----------
     cache : bool
@@ -146,12 +187,17 @@ class LazyFitsData(object):
                 log.warning(f"HDU '{hdu_loc.hdu_name}' not found")
             if self.cache and hdu_loc.cache:
                 instance.__dict__[self.name] = value
+                if instance.__dict__.get("_data_cache_tracked", False):
+                    checksum = _get_data_checksum(value)
+                    instance.__dict__[f"_{self.name}_checksum"] = checksum
             return value
 
     def __set__(self, instance, value):
         if isinstance(value, HDULocation):
             instance.__dict__[f"_{self.name}_hdu"] = value
         else:
+            instance.__dict__.pop(f"_{self.name}_hdu", None)
+            instance.__dict__.pop(f"_{self.name}_checksum", None)
             instance.__dict__[self.name] = value
 
 
@@ -218,3 +264,43 @@ def skycoord_from_dict(header, frame="icrs", ext="PNT"):
         return SkyCoord(coords[0], coords[1], unit="deg", frame=frame)
     else:
         return None
+
+
+def to_tile_compressed_hdulist(hdulist, tile_size=128):
+    """Convert the image extensions of an HDU list to lossless tile-compressed HDUs.
+
+    Each image plane is split into tiles of at most ``tile_size`` pixels along
+    the two last axes, which are compressed independently. Reading a section
+    of the data then only decompresses the tiles it overlaps.
+
+    Parameters
+    ----------
+    hdulist : `~astropy.io.fits.HDUList`
+        HDU list.
+    tile_size : int, optional
+        Maximum tile size along the two last axes. Default is 128.
+
+    Returns
+    -------
+    hdulist : `~astropy.io.fits.HDUList`
+        HDU list with image extensions stored as `~astropy.io.fits.CompImageHDU`.
+    """
+    hdus = []
+
+    for hdu in hdulist:
+        if type(hdu) is fits.ImageHDU and hdu.data is not None:
+            shape = hdu.data.shape
+            tile_shape = (1,) * len(shape[:-2]) + tuple(
+                min(n, tile_size) for n in shape[-2:]
+            )
+            hdu = fits.CompImageHDU(
+                data=hdu.data,
+                header=hdu.header,
+                name=hdu.name,
+                compression_type="GZIP_2",
+                tile_shape=tile_shape,
+                quantize_level=0.0,
+            )
+        hdus.append(hdu)
+
+    return fits.HDUList(hdus)
@@ -2,10 +2,11 @@
 """Interpolation utilities."""
 
 import html
-from itertools import compress
+from itertools import compress, product
 import numpy as np
 import scipy.interpolate
 from astropy import units as u
+from astropy.utils import lazyproperty
 from .compat import COPY_IF_NEEDED
 
 __all__ = [
@@ -41,8 +42,21 @@ class ScaledRegularGridInterpolator:
     method : {"linear", "nearest"}
         Default interpolation method. Can be overwritten when calling the
         `ScaledRegularGridInterpolator`.
+    dtype : `~numpy.dtype`, optional
+        Data type used to store and interpolate the scaled values, e.g.
+        ``np.float32`` to halve the memory usage. Only used by the fast
+        "linear" and "nearest" interpolation. Default is None, which uses float64.
     **kwargs : dict
         Keyword arguments passed to `RegularGridInterpolator`.
+
+    Notes
+    -----
+    For "linear" and "nearest" interpolation on strictly increasing grids a
+    specialised implementation is used instead of `RegularGridInterpolator`.
+    The grid is scaled once on init and the grid indices and weights are computed
+    for each coordinate array before broadcasting, without further input
+    validation. The results are identical to `RegularGridInterpolator` up to
+    floating point precision.
     """
 
     def __init__(
@@ -53,6 +67,7 @@ class ScaledRegularGridInterpolator:
         values_scale="lin",
         extrapolate=True,
         axis=None,
+        dtype=None,
         **kwargs,
     ):
         if points_scale is None:
@@ -84,15 +99,31 @@ class ScaledRegularGridInterpolator:
         if np.any(self._include_dimensions):
             values_scaled = np.squeeze(values_scaled)
 
+        self._fast_interpolate = None
+
         if axis is None:
-            self._interpolate = scipy.interpolate.RegularGridInterpolator(
-                points=points_scaled, values=values_scaled, **kwargs
-            )
+            if _RegularGridInterpolator.is_supported(
+                points_scaled, values_scaled, **kwargs
+            ):
+                self._fast_interpolate = _RegularGridInterpolator(
+                    points=points_scaled, values=values_scaled, dtype=dtype, **kwargs
+                )
+
+            self._points_scaled = points_scaled
+            self._values_scaled = values_scaled
+            self._kwargs = kwargs
         else:
             self._interpolate = scipy.interpolate.interp1d(
                 points_scaled[0], values_scaled, axis=axis
             )
 
+    @lazyproperty
+    def _interpolate(self):
+        """Scipy interpolator, created on first use of a method not supported by the fast path."""
+        return scipy.interpolate.RegularGridInterpolator(
+            points=self._points_scaled, values=self._values_scaled, **self._kwargs
+        )
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -123,6 +154,18 @@ class ScaledRegularGridInterpolator:
         """
         points = self._scale_points(points=points)
 
+        if self._fast_interpolate is not None and not kwargs:
+            method = self._fast_interpolate.method if method is None else method
+
+            if method in _RegularGridInterpolator.methods:
+                values = self._fast_interpolate(points, method=method)
+                values = self.scale.inverse(values)
+
+                if clip:
+                    values = np.clip(values, 0, np.inf)
+
+                return values
+
         if self.axis is None:
             points = np.broadcast_arrays(*points)
             points_interp = np.stack([_.flat for _ in points]).T
@@ -138,6 +181,156 @@ class ScaledRegularGridInterpolator:
         return values
 
 
+class _RegularGridInterpolator:
+    """Linear and nearest neighbour interpolation on a regular grid.
+
+    Specialised replacement for `scipy.interpolate.RegularGridInterpolator`.
+    The grid index and weight are computed per dimension on the input arrays
+    before they are broadcast, using a direct index computation for equally
+    spaced grids. The values of the cell corners are then gathered with
+    pre-computed flat offsets. No validation of the inputs is performed.
+
+    Parameters
+    ----------
+    points : tuple of `~numpy.ndarray`
+        Strictly increasing grid points, with at least two points per dimension.
+    values : `~numpy.ndarray`
+        Values on the grid.
+    method : {"linear", "nearest"}
+        Default interpolation method. Default is "linear".
+    bounds_error : bool
+        Not supported, must be False. Default is False.
+    fill_value : float or None
+        Value for points outside the grid. If None, values are extrapolated.
+        Default is `numpy.nan`.
+    dtype : `~numpy.dtype`, optional
+        Data type used for the values and weights. Default is None, which is float64.
+    """
+
+    methods = ["linear", "nearest"]
+
+    def __init__(
+        self,
+        points,
+        values,
+        method="linear",
+        bounds_error=False,
+        fill_value=np.nan,
+        dtype=None,
+    ):
+        dtype = np.dtype(float if dtype is None else dtype)
+
+        self.method = method
+        self.fill_value = fill_value
+        self.grid = tuple(np.asarray(p, dtype=float) for p in points)
+        self.values = np.ascontiguousarray(values, dtype=dtype)
+
+        self._values_flat = self.values.reshape(-1)
+        self._strides = [
+            stride // self.values.itemsize for stride in self.values.strides
+        ]
+        self._inv_delta = [1.0 / np.diff(grid) for grid in self.grid]
+
+        self._delta = []
+
+        for grid in self.grid:
+            delta = (grid[-1] - grid[0]) / (len(grid) - 1)
+            is_equal = np.allclose(np.diff(grid), delta, rtol=1e-10, atol=0)
+            self._delta.append(delta if is_equal else None)
+
+    @classmethod
+    def is_supported(
+        cls, points, values, method="linear", bounds_error=False, **kwargs
+    ):
+        """Whether the interpolation problem can be handled by this class."""
+        values = np.asarray(values)
+        return (
+            method in cls.methods
+            and not bounds_error
+            and set(kwargs).issubset({"fill_value"})
+            and len(points) == values.ndim
+            and (
+                np.issubdtype(values.dtype, np.floating)
+                or np.issubdtype(values.dtype, np.integer)
+            )
+            and all(len(p) > 1 and np.all(np.diff(p) > 0) for p in points)
+        )
+
+    def _find_indices(self, x, idx_dim):
+        """Find lower cell index and normalised distance for one dimension."""
+        grid, delta = self.grid[idx_dim], self._delta[idx_dim]
+
+        if delta is None:
+            idx = np.clip(np.searchsorted(grid, x) - 1, 0, len(grid) - 2)
+        else:
+            # fmax and fmin map NaN to the first cell
+            idx = np.fmin(np.fmax((x - grid[0]) / delta, 0), len(grid) - 2)
+            idx = idx.astype(np.intp)
+
+        weight = (x - grid[idx]) * self._inv_delta[idx_dim][idx]
+        return idx, weight
+
+    def __call__(self, points, method=None):
+        """Interpolate at the given points.
+
+        Parameters
+        ----------
+        points : tuple of `~numpy.ndarray`
+            Coordinate arrays, one per dimension. Arrays are broadcast internally.
+        method : {None, "linear", "nearest"}
+            Interpolation method. Default is None, which is `method` defined on init.
+
+        Returns
+        -------
+        values : `~numpy.ndarray`
+            Interpolated values with the broadcast shape of the coordinate arrays.
+        """
+        method = self.method if method is None else method
+
+        offset, weights, strides = 0, [], []
+        is_nan, out_of_bounds = False, False
+
+        for idx_dim, x in enumerate(points):
+            x = np.asarray(x, dtype=float)
+            idx, weight = self._find_indices(x, idx_dim)
+
+            if method == "nearest":
+                idx = idx + (weight > 0.5)
+            else:
+                weights.append(weight.astype(self.values.dtype, copy=False))
+                strides.append(self._strides[idx_dim])
+
+            offset = offset + idx * self._strides[idx_dim]
+            is_nan = is_nan | np.isnan(x)
+
+            if self.fill_value is not None:
+                grid = self.grid[idx_dim]
+                out_of_bounds = out_of_bounds | (x < grid[0]) | (x > grid[-1])
+
+        if method == "nearest":
+            values = self._values_flat[offset]
+        else:
+            values = 0
+
+            for corner in product([False, True], repeat=len(weights)):
+                weight, shift = 1, 0
+                for upper, w, stride in zip(corner, weights, strides):
+                    weight = weight * (w if upper else 1 - w)
+                    shift += upper * stride
+
+                values = values + weight * self._values_flat[offset + shift]
+
+        values = np.asarray(values)
+
+        if np.any(out_of_bounds):
+            values = np.where(out_of_bounds, self.fill_value, values)
+
+        if np.any(is_nan):
+            values = np.where(is_nan, np.nan, values)
+
+        return values.astype(self.values.dtype, copy=False)
+
+
 def interpolation_scale(scale="lin"):
     """Interpolation scaling.
 
@@ -1,6 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
 import numpy as np
-from gammapy.utils.array import array_stats_str, shape_2N
+from numpy.testing import assert_allclose
+from scipy.signal import fftconvolve
+from gammapy.utils.array import array_stats_str, fftconvolve_multi, shape_2N
 
 
 def test_array_stats_str():
@@ -15,3 +18,21 @@ def test_shape_2N():
     shape = (34, 89, 120, 444)
     expected_shape = (40, 96, 128, 448)
     assert expected_shape == shape_2N(shape=shape, N=3)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_fftconvolve_multi(dtype):
+    rng = np.random.default_rng(42)
+    images = [rng.normal(size=(37, 50)) for _ in range(2)]
+    kernels = [rng.normal(size=shape) for shape in [(3, 3), (4, 7), (101, 9)]]
+
+    rtol = 1e-5 if dtype == np.float32 else 1e-10
+
+    results = list(fftconvolve_multi(images, kernels, dtype=dtype))
+    assert len(results) == 3
+
+    for convolved, kernel in zip(results, kernels):
+        for actual, image in zip(convolved, images):
+            desired = fftconvolve(image, kernel, mode="same")
+            assert actual.dtype == dtype
+            assert_allclose(actual, desired, atol=rtol * np.abs(desired).max())
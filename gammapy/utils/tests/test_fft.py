@@ -0,0 +1,94 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import scipy.signal
+from gammapy.utils.fft import FFTConvolver
+
+
+@pytest.mark.parametrize("mode", ["same", "full"])
+@pytest.mark.parametrize(
+    "images_shape, kernel_shape",
+    [
+        ((30, 41), (5, 7)),
+        ((3, 30, 41), (5, 7)),
+        ((30, 41), (3, 9, 4)),
+        ((3, 30, 41), (3, 9, 4)),
+    ],
+)
+def test_fft_convolver(mode, images_shape, kernel_shape):
+    rng = np.random.default_rng(42)
+    images = rng.normal(size=images_shape)
+    kernel = rng.normal(size=kernel_shape)
+
+    convolver = FFTConvolver()
+    actual = convolver.convolve(images, kernel, mode=mode)
+
+    shape_axes = np.broadcast_shapes(images.shape[:-2], kernel.shape[:-2])
+    images = np.broadcast_to(images, shape_axes + images.shape[-2:])
+    kernel = np.broadcast_to(kernel, shape_axes + kernel.shape[-2:])
+
+    for idx in np.ndindex(shape_axes):
+        desired = scipy.signal.convolve(images[idx], kernel[idx], mode=mode)
+        assert_allclose(actual[idx], desired, atol=1e-12)
+
+
+def test_fft_convolver_cache():
+    rng = np.random.default_rng(42)
+    images = rng.normal(size=(2, 20, 30)).astype(np.float32)
+    kernel = rng.normal(size=(2, 5, 5)).astype(np.float32)
+
+    # padded spectrum of the float32 kernel: 2 x 24 x 17 complex64 values
+    nbytes = 2 * 24 * 17 * 8
+
+    convolver = FFTConvolver(max_cache_bytes=3 * nbytes)
+    actual = convolver.convolve(images, kernel)
+    assert actual.dtype == np.float32
+    assert len(convolver._cache) == 1
+    assert convolver.cache_nbytes == nbytes
+
+    # same kernel content, new array
+    convolver.convolve(images, kernel.copy())
+    assert len(convolver._cache) == 1
+
+    convolver.convolve(images, kernel, dtype=np.float64)
+    assert convolver.cache_nbytes == 3 * nbytes
+
+    # exceeds the limit and evicts the least recently used spectrum
+    convolver.convolve(images[..., :10], kernel)
+    assert len(convolver._cache) == 2
+    assert convolver.cache_nbytes == 2 * nbytes + 2 * 24 * 7 * 8
+
+    kernel[0, 2, 2] += 1
+    desired = convolver.convolve(images, kernel, dtype=np.float64)
+    actual = convolver.convolve(images, kernel)
+    assert_allclose(actual, desired, rtol=1e-5, atol=1e-5)
+
+    convolver.clear_cache()
+    assert len(convolver._cache) == 0
+    assert convolver.cache_nbytes == 0
+
+    # spectra larger than the limit are not cached
+    convolver.max_cache_bytes = nbytes - 1
+    convolver.convolve(images, kernel)
+    assert len(convolver._cache) == 0
+
+    with pytest.raises(ValueError):
+        convolver.convolve(images, kernel, mode="valid")
+
+
+@pytest.mark.parametrize("mode", ["same", "full"])
+@pytest.mark.parametrize("workers", [None, 3])
+def test_fft_convolver_tiled(mode, workers):
+    rng = np.random.default_rng(42)
+    images = rng.normal(size=(2, 131, 257))
+    kernel = rng.normal(size=(2, 9, 16))
+
+    convolver = FFTConvolver(tile_size=64)
+    assert convolver.use_tiles(images.shape[-2:], kernel.shape[-2:])
+    assert not convolver.use_tiles((100, 100), kernel.shape[-2:])
+    assert not convolver.use_tiles(images.shape[-2:], (17, 9))
+
+    actual = convolver.convolve(images, kernel, mode=mode, workers=workers)
+    desired = convolver.convolve(images, kernel, mode=mode, tiled=False)
+    assert_allclose(actual, desired, atol=1e-12)
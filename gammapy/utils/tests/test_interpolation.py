@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
 import numpy as np
-from gammapy.utils.interpolation import LogScale
+import scipy.interpolate
+from gammapy.utils.interpolation import LogScale, ScaledRegularGridInterpolator
 from gammapy.utils.testing import assert_allclose
 
 
@@ -12,3 +14,59 @@ def test_LogScale_inverse():
     assert_allclose(log_values, np.array([0, np.log(1e-5), np.log(tiny)]))
     inv_values = log_scale.inverse(log_values)
     assert_allclose(inv_values, np.array([1, 1e-5, 0]))
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+@pytest.mark.parametrize("fill_value", [None, np.nan, 0.0])
+def test_scaled_regular_grid_interpolator_scipy(method, fill_value):
+    rng = np.random.default_rng(0)
+
+    points = (np.linspace(0, 1, 5), np.sort(rng.uniform(0, 3, 7)), [2.0])
+    values = rng.uniform(1, 2, (5, 7, 1))
+
+    coords = (
+        rng.uniform(-0.5, 1.5, (20, 1)),
+        rng.uniform(-1, 4, (1, 30)),
+        np.array(2.0),
+    )
+    coords[0][0] = np.nan
+
+    interp = ScaledRegularGridInterpolator(
+        points, values, method=method, fill_value=fill_value, extrapolate=False
+    )
+    actual = interp(coords, clip=False)
+
+    scipy_interp = scipy.interpolate.RegularGridInterpolator(
+        points[:2],
+        values[..., 0],
+        method=method,
+        bounds_error=False,
+        fill_value=fill_value,
+    )
+    xi = np.stack([_.flat for _ in np.broadcast_arrays(*coords[:2])]).T
+    desired = scipy_interp(xi).reshape((20, 30))
+
+    assert actual.shape == (20, 30)
+    assert_allclose(actual, desired, rtol=1e-10)
+
+
+def test_scaled_regular_grid_interpolator_dtype():
+    points = (np.geomspace(1, 100, 5), np.linspace(0, 2, 4))
+    values = np.outer(points[0] ** -2, np.exp(-points[1]))
+
+    interp = ScaledRegularGridInterpolator(
+        points, values, points_scale=("log", "lin"), values_scale="log", dtype="float32"
+    )
+
+    energy = np.array([[3.0], [30.0]])
+    actual = interp((energy, [0.5, 1.5]))
+
+    assert actual.dtype == np.float32
+    assert_allclose(actual, energy**-2 * np.exp(-np.array([0.5, 1.5])), rtol=1e-6)
+
+    actual = interp((energy, [0.5, 1.5]), method="cubic")
+    assert_allclose(actual, energy**-2 * np.exp(-np.array([0.5, 1.5])), rtol=1e-2)
+
+    actual = interp((3.0, 0.5))
+    assert actual.shape == ()
+    assert_allclose(actual, 3.0**-2 * np.exp(-0.5), rtol=1e-6)